@@ -88,7 +88,8 @@
     "enum-properties": ("https://enum-properties.readthedocs.io/en/stable", None),
     "django-render-static": ("https://django-render-static.readthedocs.io/en/stable", None),
     "django-filter": ("https://django-filter.readthedocs.io/en/stable", None),
-    "python": ('https://docs.python.org/3', None)
+    "python": ('https://docs.python.org/3', None),
+    "numpy": ("https://numpy.org/doc/stable", None),
 }
 
 linkcheck_allow_redirects = True
@@ -0,0 +1,167 @@
+"""
+Vectorized analytics over flag columns using :pypi:`numpy`.
+
+Loading a flag column through the ORM creates an enumeration instance for
+every row. For reporting over large tables it is much cheaper to pull the raw
+bit masks into a :class:`numpy.ndarray` and operate on them all at once. The
+operations here follow the semantics of the :ref:`has_any` and :ref:`has_all`
+lookups so results match the equivalent database queries, including the
+exclusion of null rows.
+"""
+
+from enum import Flag
+from typing import Any
+
+import numpy as np
+from django.db import connections
+from django.db.models import BigIntegerField, ExpressionWrapper, F, QuerySet
+
+from django_enum.fields import ExtraBigIntegerFlagField, FlagField
+
+__all__ = [
+    "bit_frequency",
+    "flag_array",
+    "has_all",
+    "has_any",
+    "popcount",
+]
+
+
+def _mask(flags: Flag | int) -> np.uint64:
+    return np.uint64(int(getattr(flags, "value", flags)))
+
+
+def _data(array: np.ndarray) -> tuple[np.ndarray, np.ndarray | None]:
+    """Split a (possibly masked) flag array into its data and null mask."""
+    if isinstance(array, np.ma.MaskedArray):
+        return np.ma.getdata(array), np.ma.getmaskarray(array)
+    return array, None
+
+
+def flag_array(queryset: QuerySet, field: str) -> np.ma.MaskedArray:
+    """
+    Fetch the raw bit masks of a flag field into a :class:`numpy.ma.MaskedArray`
+    of ``uint64`` values without creating an enumeration instance per row. The
+    array is in the order of the queryset and null rows are masked.
+
+    .. code-block:: python
+
+        from django_enum.analytics import flag_array, has_any
+
+        permissions = flag_array(User.objects.all(), "permissions")
+        can_edit = has_any(permissions, Permissions.EDIT | Permissions.ADMIN)
+
+    :param queryset: The queryset to fetch the flag column from
+    :param field: The name of a flag field on the queryset's model
+    :return: The bit mask of each row
+    :raises TypeError: If the field is not a flag field of 64 bits or less
+    """
+    model_field = queryset.model._meta.get_field(field)
+    if not isinstance(model_field, FlagField) or isinstance(
+        model_field, ExtraBigIntegerFlagField
+    ):
+        raise TypeError(
+            f"{queryset.model.__name__}.{field} must be a flag field of 64 bits "
+            f"or less."
+        )
+    # the plain output field bypasses from_db_value so no enums are created
+    rows = list(
+        queryset.values_list(
+            ExpressionWrapper(F(field), output_field=BigIntegerField()), flat=True
+        )
+    )
+    return _masked_array(model_field, rows, connections[queryset.db])
+
+
+def _masked_array(field: FlagField, rows: list[Any], connection) -> np.ma.MaskedArray:
+    """
+    Build the masked array of raw column values. Columns that are not stored as
+    integers (i.e. MySQL ``SET`` columns, which are fetched as their members)
+    are converted through the field, once for each distinct value.
+    """
+    masks: dict[Any, int] = {}
+
+    def mask(row: Any) -> int:
+        if row is None:
+            return 0
+        if isinstance(row, int):
+            return row
+        key = row if isinstance(row, str) else frozenset(row)
+        if key not in masks:
+            value = field.from_db_value(row, None, connection)
+            masks[key] = int(getattr(value, "value", value))
+        return masks[key]
+
+    return np.ma.MaskedArray(
+        np.fromiter((mask(row) for row in rows), dtype=np.uint64, count=len(rows)),
+        mask=np.fromiter((row is None for row in rows), dtype=bool, count=len(rows)),
+    )
+
+
+def has_any(array: np.ndarray, flags: Flag | int) -> np.ndarray:
+    """
+    Vectorized equivalent of the :ref:`has_any` lookup.
+
+    :param array: An array of bit masks, see :func:`flag_array`
+    :param flags: The flags to test for
+    :return: A boolean array, True where any of the flags are set. Null rows
+        are False.
+    """
+    data, nulls = _data(array)
+    result = (data & _mask(flags)) != 0
+    if nulls is not None:
+        result &= ~nulls
+    return result
+
+
+def has_all(array: np.ndarray, flags: Flag | int) -> np.ndarray:
+    """
+    Vectorized equivalent of the :ref:`has_all` lookup.
+
+    :param array: An array of bit masks, see :func:`flag_array`
+    :param flags: The flags to test for
+    :return: A boolean array, True where all of the flags are set. Null rows
+        are False.
+    """
+    mask = _mask(flags)
+    data, nulls = _data(array)
+    result = (data & mask) == mask
+    if nulls is not None:
+        result &= ~nulls
+    return result
+
+
+def popcount(array: np.ndarray) -> np.ndarray:
+    """
+    Count the number of flags set in each bit mask.
+
+    :param array: An array of bit masks, see :func:`flag_array`
+    :return: An array of the number of set bits in each row, null rows remain
+        masked if the input is masked.
+    """
+    return np.bitwise_count(array)
+
+
+def bit_frequency(array: np.ndarray, bits: int | type[Flag] = 64) -> Any:
+    """
+    Count how many bit masks have each bit set. Null rows are not counted.
+
+    :param array: An array of bit masks, see :func:`flag_array`
+    :param bits: The number of bits to count, or a flag enumeration class to
+        count the occurrences of each of its members
+    :return: An array of counts indexed by bit position, or a dictionary
+        mapping each member to its count if a flag enumeration class was given
+    """
+    data, nulls = _data(array)
+    if nulls is not None:
+        data = data[~nulls]
+    if isinstance(bits, int):
+        return np.array(
+            [np.count_nonzero(data & np.uint64(1 << bit)) for bit in range(bits)],
+            dtype=np.int64,
+        )
+    return {
+        member: int(np.count_nonzero(has_all(data, member)))
+        for member in bits
+        if member.value
+    }
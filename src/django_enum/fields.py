@@ -5,15 +5,16 @@
 from __future__ import annotations
 
 import sys
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Sequence
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal, DecimalException
 from enum import Enum, Flag, IntFlag
 from functools import reduce
 from operator import or_
-from typing import Any, ClassVar, Generic, TypeVar, cast, overload
+from typing import Any, ClassVar, Generic, Literal, TypeVar, cast, overload
 
 from django import VERSION as django_version
+from django.core import checks
 from django.core.exceptions import ValidationError
 from django.core.validators import (
     DecimalValidator,
@@ -22,6 +23,8 @@
     MinLengthValidator,
     MinValueValidator,
 )
+from django.db import connections, router
+from django.db.backends.utils import names_digest
 from django.db.models import (
     NOT_PROVIDED,
     BigIntegerField,
@@ -31,8 +34,11 @@
     DateTimeField,
     DecimalField,
     DurationField,
+    F,
     Field,
     FloatField,
+    Func,
+    Index,
     IntegerField,
     Model,
     PositiveBigIntegerField,
@@ -45,21 +51,31 @@
 )
 from django.db.models.constraints import CheckConstraint
 from django.db.models.fields import BLANK_CHOICE_DASH
+from django.db.models.lookups import GreaterThanOrEqual, LessThan
 from django.db.models.query_utils import DeferredAttribute
 from django.utils.deconstruct import deconstructible
 from django.utils.duration import duration_string
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
-from django_enum.query import (  # HasAllFlagsExtraBigLookup,
+from django_enum.query import (
+    EnumIn,
+    HasAllFlagsBitStringLookup,
+    HasAllFlagsExtraBigLookup,
     HasAllFlagsLookup,
+    HasAnyFlagsBitStringLookup,
+    HasAnyFlagsExtraBigLookup,
     HasAnyFlagsLookup,
 )
 from django_enum.utils import (
+    CacheInfo,
+    LRUCache,
     SupportedPrimitive,
+    _enum_cache,
     choices,
     decimal_params,
     determine_primitive,
+    get_set_values,
     values,
 )
 
@@ -88,6 +104,26 @@ class _DatabaseDefault:
 FlagT = TypeVar("FlagT", bound=Flag)
 
 
+def _check_symmetric(enum: type[Enum], primitive: type) -> bool:
+    """
+    Make sure all enumeration values are symmetrically coercible to the
+    primitive, if they are not this could cause some strange behavior.
+
+    :raises ValueError: if any value is not symmetrically coercible
+    """
+    for value in values(enum):
+        if value is None or type(value) is primitive:
+            continue
+        try:
+            assert type(value)(primitive(value)) == value  # type: ignore
+        except (TypeError, ValueError, AssertionError) as coerce_error:
+            raise ValueError(
+                f"Not all {enum} values are symmetrically coercible to "
+                f"primitive type {primitive}"
+            ) from coerce_error
+    return True
+
+
 @deconstructible
 class EnumValidatorAdapter:
     """
@@ -130,6 +166,11 @@ class ToPythonDeferredAttribute(DeferredAttribute, Generic[PrimitiveT, EnumT]):
     """
 
     def __set__(self, instance: Model, value: PrimitiveT | EnumT | None):
+        if self.field._is_coerced(value):
+            # values loaded from the database have already been converted by
+            # from_db_value, there is no need to convert them twice
+            instance.__dict__[self.field.name] = value  # pyright: ignore[reportIndexIssue]
+            return
         try:
             instance.__dict__[self.field.name] = (  # pyright: ignore[reportIndexIssue]
                 value
@@ -144,6 +185,39 @@ def __get__(self, instance, cls=None) -> EnumT | None:
         return super().__get__(instance, cls=cls)
 
 
+class LazyToPythonDeferredAttribute(ToPythonDeferredAttribute[PrimitiveT, EnumT]):
+    """
+    A variant of :class:`ToPythonDeferredAttribute` used by fields declared
+    with ``coerce="lazy"``. Values are stored on the instance as they are set
+    and are only converted to the Enum type the first time the attribute is
+    read. The converted value replaces the stored value so the conversion is
+    done at most once per instance.
+    """
+
+    def __set__(self, instance: Model, value: PrimitiveT | EnumT | None):
+        instance.__dict__[self.field.name] = value  # pyright: ignore[reportIndexIssue]
+
+    def __get__(self, instance, cls=None) -> EnumT | None:
+        if instance is None:
+            return self  # type: ignore[return-value]
+        value = super().__get__(instance, cls=cls)
+        if not self.field._is_coerced(value) and not isinstance(value, DatabaseDefault):
+            try:
+                value = self.field.to_python(value)
+            except (ValidationError, ValueError):
+                pass
+            instance.__dict__[self.field.name] = value
+        return value
+
+
+def _int_column_bytes(bits: int) -> int:
+    """
+    The size in bytes of the smallest integer column that can hold non-negative
+    values of the given bit length: 2, 4 or 8, or 16 beyond 63 bits.
+    """
+    return next((size for size in (2, 4, 8) if bits < size * 8), 16)
+
+
 class EnumFieldFactory(type):
     """
     Metaclass for EnumField that allows us to dynamically create a EnumFields
@@ -155,6 +229,9 @@ def __call__(
         enum: type[EnumT] | None = None,
         primitive: type[PrimitiveT] | None = None,
         bit_length: int | None = None,
+        bit_string: bool = False,
+        ordinal: bool = False,
+        db_enum_type: bool | str = False,
         **field_kwargs,
     ) -> EnumField[PrimitiveT, EnumT]:
         """
@@ -206,6 +283,18 @@ class EnumTypeChar(TextChoices):
             may be necessary to override this value for flag enumerations that
             use KEEP boundary behavior to store extra information in higher
             bits.
+        :param bit_string: For flag enumerations with non-negative values.
+            Store the flags in a native fixed width bit string column of
+            ``bit_length`` bits where the database supports it, see
+            :class:`BitStringFlagField`.
+        :param ordinal: Store the position of each value in the enumeration
+            instead of the value itself, in the smallest positive integer
+            column that can hold them, see :class:`OrdinalField`. Not
+            supported for flag enumerations.
+        :param db_enum_type: Store character enumerations in a native
+            enumeration column, see :class:`EnumTypeCharField`, or flag
+            enumerations in a native set column, see :class:`SetFlagField`. A
+            string may be given to name the PostgreSQL enumeration type.
         :param field_kwargs: Any standard named field arguments for the base
             field type.
         :return: An object of the appropriate enum field type
@@ -215,13 +304,17 @@ class EnumTypeChar(TextChoices):
         if cls is not EnumField:
             if bit_length is not None:
                 field_kwargs["bit_length"] = bit_length
+            if db_enum_type:
+                field_kwargs["db_enum_type"] = db_enum_type
             return type.__call__(cls, enum=enum, primitive=primitive, **field_kwargs)
         if enum is None:
             raise ValueError(
                 "EnumField must be initialized with an `enum` argument that "
                 "specifies the python Enum class."
             )
-        primitive = primitive or determine_primitive(enum)
+        primitive = primitive or _enum_cache(
+            enum, "primitive", lambda: determine_primitive(enum)
+        )
         if primitive is None:
             raise ValueError(
                 f"EnumField is unable to determine the primitive type for "
@@ -229,33 +322,46 @@ class EnumTypeChar(TextChoices):
                 f"primitive argument."
             )
 
-        # make sure all enumeration values are symmetrically coercible to
-        # the primitive, if they are not this could cause some strange behavior
-        for value in values(enum):
-            if value is None or type(value) is primitive:
-                continue
-            try:
-                assert type(value)(primitive(value)) == value  # type: ignore
-            except (TypeError, ValueError, AssertionError) as coerce_error:
-                raise ValueError(
-                    f"Not all {enum} values are symmetrically coercible to "
-                    f"primitive type {primitive}"
-                ) from coerce_error
+        _enum_cache(
+            enum, ("symmetric", primitive), lambda: _check_symmetric(enum, primitive)
+        )
 
         def lte(tpl1: tuple[int, int], tpl2: tuple[int, int]) -> bool:
             return tpl1[0] <= tpl2[0] and tpl1[1] <= tpl2[1]
 
+        if ordinal:
+            if issubclass(enum, Flag):
+                raise ValueError(
+                    f"ordinal storage is not supported for flag enumerations, "
+                    f"{enum} is a flag enumeration."
+                )
+            max_ordinal = max(len(values(enum)) - 1, 0)
+            column_bytes = _int_column_bytes(max_ordinal.bit_length())
+            if column_bytes == 2:
+                ordinal_cls: type[OrdinalField] = SmallIntegerOrdinalField
+            elif column_bytes == 4:
+                ordinal_cls = IntegerOrdinalField
+            else:
+                ordinal_cls = BigIntegerOrdinalField
+            return ordinal_cls(enum=enum, primitive=primitive, **field_kwargs)  # type: ignore[return-value]
+
         if issubclass(primitive, int):
             is_flag = issubclass(enum, Flag)
-            min_value = min(
-                val if isinstance(val, primitive) else primitive(val)
-                for val in values(enum)
-                if val is not None
-            )
-            max_value = max(
-                val if isinstance(val, primitive) else primitive(val)
-                for val in values(enum)
-                if val is not None
+            min_value, max_value = _enum_cache(
+                enum,
+                ("bounds", primitive),
+                lambda: (
+                    min(
+                        val if isinstance(val, primitive) else primitive(val)
+                        for val in values(enum)
+                        if val is not None
+                    ),
+                    max(
+                        val if isinstance(val, primitive) else primitive(val)
+                        for val in values(enum)
+                        if val is not None
+                    ),
+                ),
             )
             min_bits = (min_value.bit_length(), max_value.bit_length())
 
@@ -269,7 +375,23 @@ def lte(tpl1: tuple[int, int], tpl2: tuple[int, int]) -> bool:
                 bit_length = max(min_bits)
 
             field_cls: type[EnumField]
-            if min_value < 0:
+            if db_enum_type:
+                if not is_flag or min_value < 0 or bit_string or bit_length > 64:
+                    raise ValueError(
+                        f"db_enum_type storage is only supported for character "
+                        f"enumerations and flag enumerations of at most 64 "
+                        f"non-negative bits, {enum} is not."
+                    )
+                field_kwargs["db_enum_type"] = db_enum_type
+                field_cls = SetFlagField
+            elif bit_string:
+                if not is_flag or min_value < 0:
+                    raise ValueError(
+                        f"bit_string storage is only supported for flag "
+                        f"enumerations with non-negative values, {enum} is not."
+                    )
+                field_cls = BitStringFlagField
+            elif min_value < 0:
                 # Its possible to create a flag enum with negative values. This
                 # enum behaves like a regular enum - the bitwise combinations
                 # do not work - these weird flag enums are supported as normal
@@ -283,17 +405,18 @@ def lte(tpl1: tuple[int, int], tpl2: tuple[int, int]) -> bool:
                 else:
                     field_cls = EnumExtraBigIntegerField
             else:
-                if min_bits[1] >= 64 and is_flag:
+                column_bytes = _int_column_bytes(min_bits[1])
+                if column_bytes > 8 and is_flag:
                     field_cls = (
                         ExtraBigIntegerFlagField
                         if is_flag
                         else EnumExtraBigIntegerField
                     )
-                elif min_bits[1] >= 32:
+                elif column_bytes >= 8:
                     field_cls = (
                         BigIntegerFlagField if is_flag else EnumPositiveBigIntegerField
                     )
-                elif min_bits[1] >= 16:
+                elif column_bytes == 4:
                     field_cls = (
                         IntegerFlagField if is_flag else EnumPositiveIntegerField
                     )
@@ -315,8 +438,22 @@ def lte(tpl1: tuple[int, int], tpl2: tuple[int, int]) -> bool:
             return EnumFloatField(enum=enum, primitive=primitive, **field_kwargs)  # type: ignore[return-value]
 
         if issubclass(primitive, str):
+            if db_enum_type:
+                return EnumTypeCharField(  # type: ignore[return-value]
+                    enum=enum,
+                    primitive=primitive,
+                    db_enum_type=db_enum_type,
+                    **field_kwargs,
+                )
             return EnumCharField(enum=enum, primitive=primitive, **field_kwargs)  # type: ignore[return-value]
 
+        if db_enum_type:
+            raise ValueError(
+                f"db_enum_type storage is only supported for character "
+                f"enumerations and flag enumerations of at most 64 non-negative "
+                f"bits, {enum} is not."
+            )
+
         if issubclass(primitive, datetime):
             return EnumDateTimeField(enum=enum, primitive=primitive, **field_kwargs)  # type: ignore[return-value]
 
@@ -354,11 +491,17 @@ class EnumField(
         value is not coercible to a valid enumeration type.
     :param coerce: If True (default) the field will always coerce values to the
         enum type when possible. If False, the field will contain the primitive
-        type of the enumeration.
+        type of the enumeration. If "lazy", values will be coerced to the enum
+        type when the field is first accessed on a model instance rather than
+        when they are loaded from the database or set.
     :param constrained: If True (default) and strict is also true
         CheckConstraints will be added to the model to constrain values of the
         database column to values of the enumeration type. If True and strict
         is False constraints will still be added.
+    :param fallback_cache_size: Number of recently seen non-enum values that
+        non-strict fields cache the coercion result for, so repeated values skip
+        the full coercion routine. Set to 0 to disable the cache. Has no effect
+        on strict fields.
     :param args: Any standard unnamed field arguments for the underlying
         field type.
     :param field_kwargs: Any standard named field arguments for the underlying
@@ -368,10 +511,18 @@ class EnumField(
     _enum_: type[EnumT] | None = None
     _strict_: bool = True
     _coerce_: bool = True
+    _lazy_: bool = False
     _primitive_: type[PrimitiveT] | None = None
     _value_primitives_: list[Any]
+    _coercion_table_: dict[Any, EnumT]
+    _fallback_cache_: LRUCache[tuple[type, Any], Any] | None = None
+    _fallback_cache_size_: int = 128
     _constrained_: bool = _strict_
 
+    #: Integer enumerations with more values than this are constrained by
+    #: ranges of consecutive values and a list of the remaining values.
+    constraint_in_max: int = 32
+
     descriptor_class = ToPythonDeferredAttribute
 
     default_error_messages: ClassVar = {
@@ -397,6 +548,14 @@ def coerce(self) -> bool:
         """
         return self._coerce_
 
+    @property
+    def lazy(self) -> bool:
+        """
+        True if values are coerced to the enumeration type on first access
+        instead of when they are loaded from the database or set.
+        """
+        return self._lazy_
+
     @property
     def constrained(self) -> bool:
         """
@@ -420,6 +579,17 @@ def primitive(self) -> type[PrimitiveT] | None:
         """
         return self._primitive_
 
+    def fallback_cache_info(self) -> CacheInfo | None:
+        """
+        Statistics for the cache of values that are not members of the
+        enumeration. Only non-strict fields have this cache.
+
+        :return: The cache statistics or None if the field has no cache
+        """
+        if self._fallback_cache_ is None:
+            return None
+        return self._fallback_cache_.info()
+
     @overload
     def _coerce_to_value_type(self, value: None) -> None: ...
 
@@ -448,23 +618,46 @@ def __init__(
         enum: type[EnumT] | None = None,
         primitive: type[PrimitiveT] | None = None,
         strict: bool = _strict_,
-        coerce: bool = _coerce_,
+        coerce: bool | Literal["lazy"] = _coerce_,
         constrained: bool | None = None,
+        fallback_cache_size: int = _fallback_cache_size_,
         **kwargs,
     ):
         self._enum_ = enum
         self._primitive_ = primitive
-        self._value_primitives_ = [self._primitive_]
-        for value_type in [type(value) for value in values(enum)]:
-            if value_type not in self._value_primitives_:
-                self._value_primitives_.append(value_type)
+        self._value_primitives_ = [
+            self._primitive_,
+            *_enum_cache(
+                enum,
+                ("value_primitives", primitive),
+                lambda: tuple(
+                    dict.fromkeys(
+                        value_type
+                        for value_type in (type(value) for value in values(enum))
+                        if value_type is not primitive
+                    )
+                ),
+            ),
+        ]
         self._strict_ = strict if enum else False
-        self._coerce_ = coerce if enum else False
+        self._coerce_ = bool(coerce) if enum else False
+        self._lazy_ = coerce == "lazy" and self._coerce_
+        if self._lazy_:
+            self.descriptor_class = LazyToPythonDeferredAttribute
         self._constrained_ = constrained if constrained is not None else strict
-        if self.enum is not None:
-            kwargs.setdefault("choices", choices(enum))
+        self._coercion_table_ = _enum_cache(
+            enum, ("coercion_table", self.primitive), self._build_coercion_table
+        )
+        self._fallback_cache_ = (
+            LRUCache(fallback_cache_size)
+            if enum and not self._strict_ and fallback_cache_size > 0
+            else None
+        )
+        if self.enum is not None and "choices" not in kwargs:
+            kwargs["choices"] = list(choices(enum))
         super().__init__(
-            null=kwargs.pop("null", False) or None in values(self.enum), **kwargs
+            null=kwargs.pop("null", False) or None in values(enum),
+            **kwargs,
         )
 
     def __copy__(self):
@@ -485,6 +678,103 @@ def _fallback(self, value: Any) -> Any:
         """Allow deriving classes to implement a final fallback coercion attempt."""
         return value
 
+    def _build_coercion_table(self) -> dict[Any, EnumT]:
+        """
+        Build a lookup table that maps every known representation of each
+        enumeration member straight to the member. The table is populated in
+        the same priority order that :meth:`_try_coerce` resolves values in:
+
+            1. member values (including aliases)
+            2. symmetric property values (:pypi:`enum-properties`)
+            3. member values coerced to the primitive type
+            4. member names
+
+        Values that are not in the table fall through to the full coercion
+        routine, so the table only ever shortcuts lookups that would succeed.
+        """
+        table: dict[Any, EnumT] = {}
+        if self.enum is None:
+            return table
+
+        def add(key: Any, member: EnumT):
+            try:
+                table.setdefault(key, member)
+            except TypeError:
+                pass  # unhashable values can only be resolved by enum(value)
+
+        for member in self.enum.__members__.values():
+            add(member.value, member)
+        for key, member in getattr(self.enum, "_ep_symmetric_map_", {}).items():
+            add(key, member)
+        for member in self.enum.__members__.values():
+            try:
+                add(self._coerce_to_value_type(member.value), member)
+            except (TypeError, ValueError, DecimalException):
+                pass
+        for name, member in self.enum.__members__.items():
+            try:
+                if self._coerce_to_value_type(name) in table:  # type: ignore[arg-type]
+                    # enum(primitive(name)) would resolve before enum[name]
+                    continue
+            except (TypeError, ValueError, DecimalException):
+                pass
+            add(name, member)
+        if issubclass(self.enum, Flag):
+            # the empty flag is not a member but is by far the most common value
+            add(0, self.enum(0))
+        return table
+
+    def _is_coerced(self, value: Any) -> bool:
+        """
+        True if :meth:`to_python` would return the given value unchanged. This
+        check is exception free and is used to avoid converting values that
+        have already been converted, (e.g. by :meth:`from_db_value`).
+        """
+        if self.enum is None:
+            return False
+        if value is None:
+            return not self.coerce or None not in self._coercion_table_
+        if self.coerce:
+            return isinstance(value, self.enum)
+        return type(value) is self.primitive
+
+    def _coerce_to_enum(self, value: Any) -> Enum | Any:
+        """
+        Resolve a value that is not in the coercion table. This exhausts every
+        supported conversion before falling back to the primitive value for
+        non-strict fields.
+
+        :raises ValueError: If the value can not be resolved
+        """
+        assert self.enum is not None
+        try:
+            return self.enum(value)
+        except (TypeError, ValueError):
+            try:
+                value = self._coerce_to_value_type(value)
+                return self.enum(value)
+            except (TypeError, ValueError, DecimalException):
+                try:
+                    return self.enum[value]
+                except KeyError as err:
+                    if len(self._value_primitives_) > 1:
+                        for primitive in self._value_primitives_:
+                            try:
+                                return self.enum(primitive(value))
+                            except Exception:  # noqa: S110, BLE001
+                                pass
+                    value = self._fallback(value)
+                    if not isinstance(value, self.enum) and (
+                        self.strict
+                        or (self.primitive and not isinstance(value, self.primitive))
+                    ):
+                        raise ValueError(
+                            f"'{value}' is not a valid "
+                            f"{self.enum.__name__} required by field "
+                            f"{self.name}."
+                        ) from err
+                    return value
+
     def _try_coerce(self, value: Any, force: bool = False) -> Enum | Any:
         """
         Attempt coercion of value to enumeration type instance, if unsuccessful
@@ -496,34 +786,27 @@ def _try_coerce(self, value: Any, force: bool = False) -> Enum | Any:
 
         if (self.coerce or force) and not isinstance(value, self.enum):
             try:
-                value = self.enum(value)
-            except (TypeError, ValueError):
-                try:
-                    # value = self.primitive(value)
-                    value = self._coerce_to_value_type(value)
-                    value = self.enum(value)
-                except (TypeError, ValueError, DecimalException):
-                    try:
-                        value = self.enum[value]
-                    except KeyError as err:
-                        if len(self._value_primitives_) > 1:
-                            for primitive in self._value_primitives_:
-                                try:
-                                    return self.enum(primitive(value))
-                                except Exception:  # noqa: S110, BLE001
-                                    pass
-                        value = self._fallback(value)
-                        if not isinstance(value, self.enum) and (
-                            self.strict
-                            or (
-                                self.primitive and not isinstance(value, self.primitive)
-                            )
-                        ):
-                            raise ValueError(
-                                f"'{value}' is not a valid "
-                                f"{self.enum.__name__} required by field "
-                                f"{self.name}."
-                            ) from err
+                member = self._coercion_table_.get(value)
+            except TypeError:
+                member = None
+            if member is not None:
+                return member
+            if value is None:
+                # None is only valid if it is a member value, in which case it
+                # is in the coercion table
+                raise ValueError(
+                    f"None is not a valid {self.enum.__name__} required by "
+                    f"field {self.name}."
+                )
+            if self._fallback_cache_ is None:
+                return self._coerce_to_enum(value)
+            key = (value.__class__, value)
+            try:
+                return self._fallback_cache_[key]
+            except KeyError:
+                value = self._fallback_cache_[key] = self._coerce_to_enum(value)
+            except TypeError:
+                return self._coerce_to_enum(value)
 
         elif not self.coerce:
             try:
@@ -553,7 +836,7 @@ def deconstruct(self) -> tuple[str, str, Sequence[Any], dict[str, Any]]:
         """
         name, path, args, kwargs = super().deconstruct()
         if self.enum is not None:
-            kwargs["choices"] = choices(self.enum)
+            kwargs["choices"] = list(choices(self.enum))
 
         if "db_default" in kwargs:
             try:
@@ -587,6 +870,19 @@ def get_prep_value(self, value: Any) -> Any:
                     raise
         return value
 
+    def prep_many(self, values: Iterable[Any]) -> list[Any]:
+        """
+        Prepare many values for the database at once. Each distinct value is
+        only run through :meth:`get_prep_value` once and the prepared result is
+        reused for every repetition, which makes this considerably cheaper than
+        preparing each value individually when columns have low cardinality.
+
+        :param values: The values to prepare
+        :return: A list of prepared values in the same order as the input
+        :raises ValueError: If a value is not mappable to a valid enumeration
+        """
+        return self._map_distinct(self.get_prep_value, values)
+
     def get_db_prep_value(self, value, connection, prepared=False) -> Any:
         """
         Convert the field value into the Enum type and then pull its value
@@ -611,6 +907,11 @@ def from_db_value(
         """
         # give the super class converter a first whack if it exists
         value = getattr(super(), "from_db_value", lambda v: v)(value)
+        if self.lazy:
+            # coercion is deferred to LazyToPythonDeferredAttribute.__get__
+            if value == "" and self.null and self.strict:
+                value = None if "" not in self._coercion_table_ else value
+            return value
         try:
             return self._try_coerce(value)
         except (ValueError, TypeError):
@@ -646,6 +947,45 @@ def to_python(self, value: Any) -> Enum | Any:
                 },
             ) from err
 
+    def coerce_many(self, values: Iterable[Any]) -> list[Enum | Any]:
+        """
+        Convert many values to the enumeration type at once. Each distinct value
+        is only resolved through :meth:`to_python` once and the result is
+        reused for every repetition. Use this to convert whole columns of data
+        before building model instances for
+        :meth:`~django.db.models.query.QuerySet.bulk_create` or
+        :meth:`~django.db.models.query.QuerySet.bulk_update`.
+
+        :param values: The values to convert
+        :return: A list of converted values in the same order as the input
+        :raises ValidationError: If a value is not mappable to a valid
+            enumeration
+        """
+        return self._map_distinct(self.to_python, values)
+
+    def _map_distinct(
+        self, convert: Callable[[Any], Any], values: Iterable[Any]
+    ) -> list[Any]:
+        """
+        Apply convert to each value, only calling it once per distinct value.
+        Values are keyed on their type as well as their value so equal values
+        of different types (e.g. 1 and True) are converted separately.
+        Unhashable values are converted individually.
+        """
+        converted: dict[tuple[type, Any], Any] = {}
+        result = []
+        for value in values:
+            key = (value.__class__, value)
+            try:
+                seen = key in converted
+            except TypeError:
+                result.append(convert(value))
+                continue
+            if not seen:
+                converted[key] = convert(value)
+            result.append(converted[key])
+        return result
+
     def get_default(self) -> Any:
         """Wrap get_default in an enum type coercion attempt"""
         if self.has_default():
@@ -756,6 +1096,32 @@ def constraint_name(
             return name[len(name) - MAX_CONSTRAINT_NAME_LENGTH :]
         return name
 
+    def constraint_condition(self, field_name: str) -> Q:
+        """
+        The condition of the check constraint that limits the column to the
+        values of the enumeration, not including null.
+
+        :param field_name: The name of the field on the model
+        """
+        assert self.enum is not None
+        enum = self.enum
+        constraint_values = _enum_cache(
+            enum,
+            ("constraint", self.primitive),
+            lambda: tuple(self._coerce_to_value_type(value) for value in values(enum)),
+        )
+        ranges: list[tuple[int, int]] = []
+        if self.primitive is int and len(constraint_values) > self.constraint_in_max:
+            ranges, constraint_values = _enum_cache(
+                enum,
+                ("constraint_ranges", self.primitive),
+                lambda: _value_ranges(constraint_values),
+            )
+        conditions = [Q(**{f"{field_name}__range": rng}) for rng in ranges]
+        if constraint_values or not conditions:
+            conditions.append(Q(**{f"{field_name}__in": list(constraint_values)}))
+        return reduce(or_, conditions)
+
     def contribute_to_class(
         self, cls: type[Model], name: str, private_only: bool = False
     ):
@@ -773,13 +1139,7 @@ def contribute_to_class(
                 private_only=private_only,
             )
         elif self.constrained and self.enum:
-            constraint = Q(
-                **{
-                    f"{self.name or name}__in": [
-                        self._coerce_to_value_type(value) for value in values(self.enum)
-                    ]
-                }
-            )
+            constraint = self.constraint_condition(self.name or name)
             if self.null:
                 constraint |= Q(**{f"{self.name or name}__isnull": True})
             cls._meta.constraints = [
@@ -802,6 +1162,35 @@ def contribute_to_class(
             )
 
 
+EnumField.register_lookup(EnumIn)
+
+
+def _value_ranges(
+    values: Iterable[int | None], min_run: int = 3
+) -> tuple[list[tuple[int, int]], tuple[int | None, ...]]:
+    """
+    Split integers into the inclusive bounds of each run of at least min_run
+    consecutive integers and the integers that are not part of such a run.
+    None is never part of a run and is kept with the remaining values.
+    """
+    ranges: list[tuple[int, int]] = []
+    remaining: list[int | None] = []
+    run: list[int] = []
+    unique = set(values)
+    for value in [*sorted(unique - {None}), None]:
+        if run and value is not None and value == run[-1] + 1:
+            run.append(value)
+            continue
+        if len(run) >= min_run:
+            ranges.append((run[0], run[-1]))
+        else:
+            remaining.extend(run)
+        run = [value] if value is not None else []
+    if None in unique:
+        remaining.append(None)
+    return ranges, tuple(remaining)
+
+
 class EnumCharField(EnumField[str, EnumT], CharField, Generic[EnumT]):
     """
     A database field supporting enumerations with character values.
@@ -828,7 +1217,7 @@ def __init__(
                 "max_length",
                 max(
                     len(self._coerce_to_value_type(choice[0]) or "")
-                    for choice in kwargs.get("choices", choices(enum))
+                    for choice in kwargs.get("choices") or choices(enum)
                 ),
             )
         super().__init__(enum=enum, primitive=primitive, **kwargs)
@@ -842,6 +1231,126 @@ def __init__(
         ]
 
 
+class EnumTypeCharField(EnumCharField[EnumT], Generic[EnumT]):
+    """
+    Enumerations with character values stored in native enumeration columns:
+    a named ``ENUM`` type on PostgreSQL and an ``ENUM(...)`` column on MySQL
+    and MariaDB. Native enumerations are stored in 4 bytes (1 or 2 on MySQL),
+    reject values that are not members and compare and sort in declaration
+    order. On other databases values are stored as they are by
+    :class:`EnumCharField`.
+
+    The PostgreSQL type must be created before the column, see
+    :class:`~django_enum.operations.CreateEnumType`, and members are added with
+    :class:`~django_enum.operations.AddEnumValues`. Check constraints are not
+    generated unless ``constrained`` is True.
+
+    PostgreSQL types are shared by every table in the schema. Fields of
+    different enumerations must not use the same type name, see
+    ``django_enum.E002``.
+
+    :param db_enum_type: The name of the PostgreSQL enumeration type. If True
+        the app label of the model and the lower case name of the enumeration
+        class are used, e.g. ``myapp_color``.
+    """
+
+    description = _("A native database enumeration.")
+
+    _qualify_db_enum_type_ = False
+
+    def __init__(
+        self,
+        enum: type[EnumT] | None = None,
+        primitive: type[str] | None = str,
+        db_enum_type: bool | str = True,
+        constrained: bool | None = None,
+        **kwargs,
+    ):
+        super().__init__(
+            enum=enum,
+            primitive=primitive,
+            constrained=bool(constrained),
+            **kwargs,
+        )
+        if db_enum_type is True:
+            if enum is None:
+                raise ValueError(
+                    "db_enum_type must name the enumeration type when no enum is given."
+                )
+            # qualified with the app label in contribute_to_class
+            self._qualify_db_enum_type_ = True
+            db_enum_type = enum.__name__.lower()
+        self.db_enum_type = str(db_enum_type)
+
+    def contribute_to_class(
+        self, cls: type[Model], name: str, private_only: bool = False
+    ):
+        super().contribute_to_class(cls, name, private_only=private_only)
+        if self._qualify_db_enum_type_:
+            assert self.enum
+            self.db_enum_type = f"{cls._meta.app_label}_{self.enum.__name__.lower()}"
+
+    def check(self, **kwargs) -> list[checks.CheckMessage]:
+        return [*super().check(**kwargs), *self._check_db_enum_type(**kwargs)]
+
+    def _check_db_enum_type(
+        self, databases: Sequence[str] | None = None, **kwargs
+    ) -> list[checks.CheckMessage]:
+        """Fields that share a PostgreSQL type must have the same members."""
+        if not databases or not any(
+            router.allow_migrate_model(alias, self.model)
+            and connections[alias].vendor == "postgresql"
+            for alias in databases
+        ):
+            return []
+        return [
+            checks.Error(
+                f"The PostgreSQL enumeration type {self.db_enum_type!r} is also "
+                f"used by {field.model._meta.label}.{field.name} with different "
+                f"members.",
+                hint="Give one of the fields a different db_enum_type name.",
+                obj=self,
+                id="django_enum.E002",
+            )
+            for model in self.model._meta.apps.get_models()
+            for field in model._meta.local_fields
+            if field is not self
+            and isinstance(field, EnumTypeCharField)
+            and field.db_enum_type == self.db_enum_type
+            and field.enum_values != self.enum_values
+        ]
+
+    @property
+    def enum_values(self) -> tuple[str, ...]:
+        """The members of the native enumeration, in declaration order."""
+        return tuple(
+            dict.fromkeys(value for value, _ in self.flatchoices if value is not None)
+        )
+
+    def db_type(self, connection):
+        if connection.vendor == "postgresql":
+            return connection.ops.quote_name(self.db_enum_type)
+        if connection.vendor == "mysql":
+            return f"enum({', '.join(map(_sql_string, self.enum_values))})"
+        return super().db_type(connection)
+
+    def deconstruct(self) -> tuple[str, str, Sequence[Any], dict[str, Any]]:
+        """
+        The type name must be preserved when the field is reconstructed in
+        migrations.
+
+        See :meth:`django.db.models.Field.deconstruct`
+        """
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["db_enum_type"] = self.db_enum_type
+        return name, path, args, kwargs
+
+
+def _sql_string(value: str) -> str:
+    """Quote a string literal for use in column definitions."""
+    return "'{}'".format(value.replace("\\", "\\\\").replace("'", "''"))
+
+
 class EnumFloatField(EnumField[float, EnumT], FloatField, Generic[EnumT]):
     """A database field supporting enumerations with floating point values"""
 
@@ -864,7 +1373,7 @@ def __init__(
         enum: type[EnumT] | None = None,
         primitive: type[float] | None = None,
         strict: bool = EnumField._strict_,
-        coerce: bool = EnumField._coerce_,
+        coerce: bool | Literal["lazy"] = EnumField._coerce_,
         constrained: bool | None = None,
         **kwargs,
     ):
@@ -983,6 +1492,188 @@ class EnumPositiveBigIntegerField(
     """
 
 
+class OrdinalField(EnumField[PrimitiveT, EnumT], Generic[PrimitiveT, EnumT]):
+    """
+    A common base class for EnumFields that store the position of each
+    enumeration value in the field's choices (its declaration order) in the
+    smallest positive integer column that can hold them, rather than the value
+    itself. Values are translated to and from their ordinals so lookups on the
+    field work with enumeration values as usual. Comparisons and ordering
+    follow declaration order.
+
+    .. warning::
+
+        Reordering, inserting or removing enumeration values changes the
+        ordinals of the values that follow them. Only append new values to
+        enumerations stored as ordinals.
+
+    Only values of the enumeration have ordinals, so ordinal fields must be
+    strict.
+    """
+
+    _ordinals_: dict[Any, int]
+    _ordinal_values_: tuple[Any, ...]
+
+    def __init__(
+        self,
+        enum: type[EnumT] | None = None,
+        primitive: type[PrimitiveT] | None = None,
+        **kwargs,
+    ):
+        if not kwargs.get("strict", True):
+            raise ValueError(
+                "Enumerations stored as ordinals must be strict, only values of "
+                "the enumeration have ordinals."
+            )
+        super().__init__(enum=enum, primitive=primitive, **kwargs)
+        # reconstructed fields (e.g. in migrations) have no enum, but the
+        # deconstructed choices are in the same order
+        self._ordinal_values_ = (
+            _enum_cache(
+                enum,
+                "ordinal_values",
+                lambda: tuple(
+                    dict.fromkeys(
+                        value for value, _ in choices(enum) if value is not None
+                    )
+                ),
+            )
+            if enum
+            else tuple(
+                dict.fromkeys(
+                    value for value, _ in self.flatchoices if value is not None
+                )
+            )
+        )
+        self._ordinals_ = {
+            value: ordinal for ordinal, value in enumerate(self._ordinal_values_)
+        }
+        # ordinals are always within the range of the column
+        self.validators = [
+            validator
+            for validator in self.validators
+            if not isinstance(validator, (MinValueValidator, MaxValueValidator))
+        ]
+
+    def constraint_condition(self, field_name: str) -> Q:
+        """
+        Ordinals are contiguous, so large enumerations are constrained to the
+        range between the first and last value.
+        """
+        if len(self._ordinal_values_) > self.constraint_in_max:
+            return Q(
+                **{
+                    f"{field_name}__range": (
+                        self._ordinal_values_[0],
+                        self._ordinal_values_[-1],
+                    )
+                }
+            )
+        return super().constraint_condition(field_name)
+
+    def get_prep_value(self, value: Any) -> Any:
+        """
+        Convert the value into its ordinal.
+
+        See :meth:`django.db.models.Field.get_prep_value`
+        """
+        value = super().get_prep_value(value)
+        if value is None:
+            return value
+        try:
+            return self._ordinals_[value]
+        except (KeyError, TypeError) as err:
+            raise ValueError(
+                f"'{value}' is not a value of {self.enum or self.choices} and can "
+                f"not be stored as an ordinal by field {self.name}."
+            ) from err
+
+    def get_db_prep_value(self, value, connection, prepared=False) -> Any:
+        """
+        See :meth:`django.db.models.Field.get_db_prep_value`
+        """
+        if not prepared:
+            value = self.get_prep_value(value)
+        return value
+
+    def from_db_value(
+        self,
+        value: Any,
+        expression,
+        connection,
+    ) -> Any:
+        """
+        Convert the stored ordinal into the Enum type.
+
+        See :meth:`django.db.models.Field.from_db_value`
+        """
+        if value is None:
+            return value
+        if not 0 <= value < len(self._ordinal_values_):
+            raise ValueError(
+                f"Ordinal {value} is not the position of a value of "
+                f"{self.enum or self.choices} required by field {self.name}."
+            )
+        value = self._ordinal_values_[value]
+        if self.lazy:
+            return value
+        return self._try_coerce(value)
+
+    def value_to_string(self, obj):
+        """
+        Serialize the enumeration value rather than its ordinal, so serialized
+        data does not depend on the declaration order of the enumeration.
+
+        See :meth:`django.db.models.Field.value_to_string`
+        """
+        val = self.value_from_object(obj)
+        val = val.value if isinstance(val, Enum) else val
+        if val is None:
+            # members with a null value are stored as null
+            return None
+        if isinstance(val, (date, time)):
+            return val.isoformat()
+        if isinstance(val, timedelta):
+            return duration_string(val)
+        return str(val)
+
+
+# comparisons of ordinals must not round the compared value like integer
+# field comparisons do
+OrdinalField.register_lookup(GreaterThanOrEqual)
+OrdinalField.register_lookup(LessThan)
+
+
+class SmallIntegerOrdinalField(
+    OrdinalField[PrimitiveT, EnumT],
+    PositiveSmallIntegerField,
+    Generic[PrimitiveT, EnumT],
+):
+    """
+    An enumeration field stored as ordinals in a PositiveSmallIntegerField (2
+    bytes).
+    """
+
+
+class IntegerOrdinalField(
+    OrdinalField[PrimitiveT, EnumT], PositiveIntegerField, Generic[PrimitiveT, EnumT]
+):
+    """
+    An enumeration field stored as ordinals in a PositiveIntegerField (4 bytes).
+    """
+
+
+class BigIntegerOrdinalField(
+    OrdinalField[PrimitiveT, EnumT],
+    PositiveBigIntegerField,
+    Generic[PrimitiveT, EnumT],
+):
+    """
+    An enumeration field stored as ordinals in a PositiveBigIntegerField (8
+    bytes).
+    """
+
+
 class EnumDateField(EnumField[date, EnumT], DateField, Generic[EnumT]):  # type: ignore
     """
     A database field supporting enumerations with date values.
@@ -1181,24 +1872,217 @@ def get_db_prep_value(self, value, connection, prepared=False) -> Any:
         return connection.ops.adapt_decimalfield_value(value)
 
 
+def _flag_values(field: EnumField) -> tuple[int, ...]:
+    """The primitive values of a flag field's enumeration."""
+    enum = field.enum
+    assert enum
+    return _enum_cache(
+        enum,
+        ("flags", field.primitive),
+        lambda: tuple(
+            field._coerce_to_value_type(val) for val in values(enum) if val is not None
+        ),
+    )
+
+
+def _flag_domain_constrained(field: EnumField) -> bool:
+    """
+    True if the flag field's check constraint bounds its column to the range of
+    its enumeration, see :meth:`FlagField.contribute_to_class`.
+    """
+    if not (field.constrained and field.enum and field.bit_length <= 64):  # type: ignore[attr-defined]
+        return False
+    boundary = getattr(field.enum, "_boundary_", None)
+    return bool(
+        boundary is STRICT
+        or boundary is CONFORM
+        or (boundary is EJECT and field.strict)
+    )
+
+
+def _flag_domain_exact(field: EnumField) -> bool:
+    """
+    True if the flag field's check constraint limits its column to exactly the
+    combinations of its flags. The range constraint only does this when the
+    flags are the lowest bits, otherwise stray bits below the highest flag
+    pass it.
+    """
+    if not _flag_domain_constrained(field):
+        return False
+    domain = reduce(or_, _flag_values(field), 0)
+    return domain > 0 and not domain & (domain + 1)
+
+
+def _combinations(bits: Iterable[int]) -> list[int]:
+    """Every combination of the given bits, including none of them."""
+    combinations = [0]
+    for bit in bits:
+        combinations += [combination | bit for combination in combinations]
+    return combinations
+
+
 class FlagField(IntEnumField[FlagT], Generic[PrimitiveT, FlagT]):  # type: ignore
     """
     A common base class for EnumFields that store Flag enumerations and
     support bitwise operations.
+
+    :param composite_cache_size: For integer flag enumerations, hold at most
+        this many of the most recently used composite flag values (combinations
+        of flags that are not themselves members) instead of keeping every
+        composite ever seen for the life of the process. Set to 0 to defer to
+        Python's default behavior.
+    :param in_list_lookups: Compile :ref:`has_any` and :ref:`has_all`
+        lookups with constant right-hand sides to ``IN`` lists of every
+        matching value when there are at most :attr:`in_list_max` of them,
+        which can use an index on the column. This assumes the column holds
+        nothing but combinations of the enumeration's flags. By default (None)
+        it is enabled for fields whose check constraint guarantees this, that
+        is fields with a range constraint (see :meth:`contribute_to_class`)
+        whose flags are the lowest bits. Set to True to enable it regardless
+        or False to disable it.
+    :param index_strategy: Generate indexes that :ref:`has_any` and
+        :ref:`has_all` lookups can use, one of :attr:`INDEX_STRATEGIES`:
+
+        - ``"btree"``: an index on the column. Serves exact lookups and
+          ``in_list_lookups``.
+        - ``"bits"``: an expression index on ``flags & bit`` for each flag.
+          Lookups test each flag with ``flags & bit = bit``.
+        - ``"gin"``: PostgreSQL only, other databases fail the
+          ``django_enum.E001`` system check. A GIN index over the array of the
+          field's masked flags. Lookups compile to array containment
+          (has_all) or overlap (has_any) tests.
     """
 
     enum: type[FlagT] | None
 
+    INDEX_STRATEGIES = ("btree", "bits", "gin")
+
+    in_list_max: int = 32
+    """
+    The maximum number of values :ref:`has_any` and :ref:`has_all` lookups
+    will be rewritten to test with ``IN``.
+    """
+
+    _composite_cache_: LRUCache[int, FlagT] | None = None
+    _in_list_lookups_: bool | None = None
+    _index_strategy_: str | None = None
+
     def __init__(
         self,
         enum: type[FlagT] | None = None,
         blank=True,
         default=NOT_PROVIDED,
+        composite_cache_size: int = 1024,
+        in_list_lookups: bool | None = None,
+        index_strategy: str | None = None,
         **kwargs,
     ):
         if enum and default is NOT_PROVIDED:
             default = enum(0)
         super().__init__(enum=enum, default=default, blank=blank, **kwargs)
+        if index_strategy is not None and (
+            index_strategy not in self.INDEX_STRATEGIES
+            or isinstance(self, EnumExtraBigIntegerField)
+        ):
+            raise ValueError(
+                f"index_strategy must be one of {self.INDEX_STRATEGIES} for "
+                f"flag fields of 64 bits or less, not {index_strategy!r}."
+            )
+        self._index_strategy_ = index_strategy
+        self._in_list_lookups_ = in_list_lookups
+        self._composite_cache_ = (
+            LRUCache(composite_cache_size)
+            if self.enum and issubclass(self.enum, int) and composite_cache_size > 0
+            else None
+        )
+
+    def composite_cache_info(self) -> CacheInfo | None:
+        """
+        Statistics for the cache of composite flag values.
+
+        :return: The cache statistics or None if the field has no cache
+        """
+        if self._composite_cache_ is None:
+            return None
+        return self._composite_cache_.info()
+
+    @property
+    def index_strategy(self) -> str | None:
+        """
+        The strategy used to index this field for flag lookups, if any.
+        """
+        return self._index_strategy_
+
+    @property
+    def index_bits(self) -> tuple[int, ...]:
+        """
+        The individual bits of the enumeration's flags. Fields reconstructed
+        without their enumeration (e.g. in migrations) use the values of their
+        choices.
+        """
+        if self.enum:
+            flags: Iterable[int] = _flag_values(self)
+        else:
+            flags = (value for value, _ in self.flatchoices if value is not None)
+        return tuple(get_set_values(reduce(or_, flags, 0)))
+
+    def in_list(self, mask: int, has_all: bool) -> list[int] | None:
+        """
+        Every value that matches a :ref:`has_all` or :ref:`has_any` lookup if
+        the field's domain is limited to combinations of its flags and no more
+        than :attr:`in_list_max` values match.
+
+        :param mask: The flags on the right-hand side of the lookup
+        :param has_all: True for has_all, False for has_any
+        :return: The sorted matching values, or None if they should not be
+            enumerated
+        """
+        if not self.enum or self.in_list_max <= 0:
+            return None
+        if self._in_list_lookups_ is False or (
+            self._in_list_lookups_ is None and not _flag_domain_exact(self)
+        ):
+            return None
+        domain = reduce(or_, _flag_values(self), 0)
+        if has_all:
+            if mask & ~domain:
+                return []
+            free = get_set_values(domain & ~mask)
+            if 1 << len(free) > self.in_list_max:
+                return None
+            return sorted(mask | combination for combination in _combinations(free))
+        bits = get_set_values(domain)
+        mask &= domain
+        if (1 << len(bits)) - (1 << (len(bits) - mask.bit_count())) > self.in_list_max:
+            return None
+        return sorted(
+            combination for combination in _combinations(bits) if combination & mask
+        )
+
+    def _coerce_to_enum(self, value: Any) -> Enum | Any:
+        """
+        Python creates a pseudo-member the first time it sees a composite flag
+        value and interns it on the enumeration class forever. Columns that
+        hold many distinct combinations of flags (e.g. wide bit masks) would
+        grow memory without bound. For integer flags, whose pseudo-members
+        compare and hash by value, we move newly created pseudo-members out
+        of the enumeration class and into a bounded LRU cache instead.
+        """
+        composites = self._composite_cache_
+        if composites is None or value.__class__ is not int:
+            return super()._coerce_to_enum(value)
+        try:
+            return composites[value]
+        except KeyError:
+            pass
+        interned = self.enum._value2member_map_  # type: ignore[union-attr]
+        if value in interned:
+            return super()._coerce_to_enum(value)
+        member = super()._coerce_to_enum(value)
+        if interned.get(value) is member:
+            interned.pop(value, None)
+            composites[value] = member
+        return member
 
     def contribute_to_class(
         self, cls: type[Model], name: str, private_only: bool = False
@@ -1226,21 +2110,9 @@ def contribute_to_class(
         - STRICT: constrained to the enum's range
 
         """
-        if self.constrained and self.enum and self.bit_length <= 64:
-            boundary = getattr(self.enum, "_boundary_", None)
-            is_conform, is_eject, is_strict = (
-                boundary is CONFORM,
-                boundary is EJECT,
-                boundary is STRICT,
-            )
-
-            flags: list[int] = [
-                self._coerce_to_value_type(val)
-                for val in values(self.enum)
-                if val is not None
-            ]
-
-            if is_strict or is_conform or (is_eject and self.strict) and flags:
+        if _flag_domain_constrained(self):
+            flags = _flag_values(self)
+            if flags:
                 constraint = (
                     Q(**{f"{self.name or name}__gte": min(*flags)})
                     & Q(**{f"{self.name or name}__lte": reduce(or_, flags)})
@@ -1268,6 +2140,12 @@ def contribute_to_class(
                     "constraints",
                     cls._meta.constraints,
                 )
+        if isinstance(self, FlagField) and self.index_strategy and self.enum:
+            cls._meta.indexes = [
+                *cls._meta.indexes,
+                *self.flag_indexes(cls, self.name or name),
+            ]
+            cls._meta.original_attrs.setdefault("indexes", cls._meta.indexes)
         if isinstance(self, FlagField):
             # this may have been called by a normal EnumField to bring in flag-like constraints
             # for non flag fields
@@ -1278,6 +2156,64 @@ def contribute_to_class(
                 private_only=private_only,
             )
 
+    def check(self, **kwargs) -> list[checks.CheckMessage]:
+        return [*super().check(**kwargs), *self._check_index_strategy(**kwargs)]
+
+    def _check_index_strategy(
+        self, databases: Sequence[str] | None = None, **kwargs
+    ) -> list[checks.CheckMessage]:
+        """The ``"gin"`` index strategy can only be migrated on PostgreSQL."""
+        if self.index_strategy != "gin" or not databases:
+            return []
+        return [
+            checks.Error(
+                f"index_strategy='gin' requires PostgreSQL, but the {alias!r} "
+                f"database is {connections[alias].vendor}.",
+                hint="Use the 'btree' or 'bits' index strategy instead.",
+                obj=self,
+                id="django_enum.E001",
+            )
+            for alias in databases
+            if router.allow_migrate_model(alias, self.model)
+            and connections[alias].vendor != "postgresql"
+        ]
+
+    def flag_indexes(self, model_class: type[Model], field_name: str) -> list[Index]:
+        """
+        Build the indexes for this field's :attr:`index_strategy`.
+
+        :param model_class: The class of the Model the field is in
+        :param field_name: The name of the field
+        :return: The indexes to add to the model
+        """
+
+        def index_name(suffix: str) -> str:
+            table = model_class._meta.db_table
+            digest = names_digest(table, field_name, suffix, length=6)
+            return f"{table[:11]}_{field_name[:7]}_{digest}_{suffix}"
+
+        if self.index_strategy == "btree":
+            return [Index(fields=[field_name], name=index_name("idx"))]
+        if self.index_strategy == "bits":
+            return [
+                Index(
+                    F(field_name).bitand(bit),
+                    name=index_name(f"b{bit.bit_length() - 1}"),
+                )
+                for bit in self.index_bits
+            ]
+        from django.contrib.postgres.indexes import GinIndex
+
+        return [
+            GinIndex(
+                Func(
+                    *(F(field_name).bitand(bit) for bit in self.index_bits),
+                    template="ARRAY[%(expressions)s]",
+                ),
+                name=index_name("gin"),
+            )
+        ]
+
     def formfield(self, form_class=None, choices_form_class=None, **kwargs):
         """
         An override of :meth:`~django.db.models.Field.formfield` that ensures
@@ -1360,6 +2296,64 @@ class BigIntegerFlagField(
     """
 
 
+class SetFlagField(BigIntegerFlagField[FlagT], Generic[FlagT]):
+    """
+    Flag fields stored in native ``SET`` columns on MySQL and MariaDB. The set
+    has a member for each bit of the enumeration, named by the bit's value, so
+    the column holds the bit mask in 1 to 8 bytes and bitwise operations run on
+    the column as usual. On other databases values are stored as they are by
+    :class:`BigIntegerFlagField`. Check constraints are not generated unless
+    ``constrained`` is True.
+    """
+
+    description = _("A native database set.")
+
+    def __init__(
+        self,
+        enum: type[FlagT] | None = None,
+        db_enum_type: bool | str = True,
+        constrained: bool | None = None,
+        **kwargs,
+    ):
+        super().__init__(enum=enum, constrained=bool(constrained), **kwargs)
+
+    def db_type(self, connection):
+        if connection.vendor == "mysql":
+            members = (f"'{1 << bit}'" for bit in range(max(self.bit_length, 1)))
+            return f"set({', '.join(members)})"
+        return super().db_type(connection)
+
+    def deconstruct(self) -> tuple[str, str, Sequence[Any], dict[str, Any]]:
+        """
+        The bit length determines the members of the set and must be preserved
+        when the field is reconstructed in migrations.
+
+        See :meth:`django.db.models.Field.deconstruct`
+        """
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["bit_length"] = self.bit_length
+        kwargs["db_enum_type"] = True
+        return name, path, args, kwargs
+
+    def from_db_value(
+        self,
+        value: Any,
+        expression,
+        connection,
+    ) -> Any:
+        """
+        Convert the database field value into the Enum type. MySQL returns set
+        columns as comma separated members.
+
+        See :meth:`django.db.models.Field.from_db_value`
+        """
+        if isinstance(value, str):
+            value = value.split(",")
+        if isinstance(value, (list, set, frozenset)):
+            value = sum(int(member) for member in value if member)
+        return super().from_db_value(value, expression, connection)
+
+
 for field in [SmallIntegerFlagField, IntegerFlagField, BigIntegerFlagField]:
     field.register_lookup(HasAnyFlagsLookup)
     field.register_lookup(HasAllFlagsLookup)
@@ -1454,5 +2448,82 @@ def contribute_to_class(self, cls, name, private_only: bool = False):
         BinaryField.contribute_to_class(self, cls, name, private_only=private_only)
 
 
-# ExtraBigIntegerFlagField.register_lookup(HasAnyFlagsExtraBigLookup)
-# ExtraBigIntegerFlagField.register_lookup(HasAllFlagsExtraBigLookup)
+ExtraBigIntegerFlagField.register_lookup(HasAnyFlagsExtraBigLookup)
+ExtraBigIntegerFlagField.register_lookup(HasAllFlagsExtraBigLookup)
+
+
+class BitStringFlagField(ExtraBigIntegerFlagField[FlagT], Generic[FlagT]):
+    """
+    Flag fields stored in native fixed width bit string columns of the
+    enumeration's bit length: ``bit(n)`` on PostgreSQL and ``BIT(n)`` on MySQL
+    and MariaDB when n is 64 or less. Values are converted directly to and from
+    the database representation and bitwise operations run on the column. On
+    other databases values are stored as they are by
+    :class:`ExtraBigIntegerFlagField`.
+    """
+
+    description = _("A fixed width bit string.")
+
+    def native(self, connection) -> bool:
+        """
+        True if the field is stored as a native bit string on the given
+        connection.
+        """
+        return connection.vendor == "postgresql" or (
+            connection.vendor == "mysql" and self.bit_length <= 64
+        )
+
+    def db_type(self, connection):
+        if self.native(connection):
+            return f"bit({max(self.bit_length, 1)})"
+        return super().db_type(connection)
+
+    def deconstruct(self) -> tuple[str, str, Sequence[Any], dict[str, Any]]:
+        """
+        The bit length determines the column width and must be preserved when
+        the field is reconstructed in migrations.
+
+        See :meth:`django.db.models.Field.deconstruct`
+        """
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["bit_length"] = self.bit_length
+        return name, path, args, kwargs
+
+    def get_db_prep_value(self, value: Any, connection, prepared=False):
+        """
+        Convert the field value into a bit string on PostgreSQL or an integer
+        on MySQL.
+
+        See :meth:`django.db.models.Field.get_db_prep_value`
+        """
+        if value is None or not self.native(connection):
+            return super().get_db_prep_value(value, connection, prepared)
+        if isinstance(value, (bytes, memoryview, bytearray)):
+            value = int.from_bytes(value, byteorder="big")
+        else:
+            value = self._try_coerce(value, force=True)
+            value = int(getattr(value, "value", value))
+        if connection.vendor == "postgresql":
+            return format(value, f"0{max(self.bit_length, 1)}b")
+        return value
+
+    def from_db_value(
+        self,
+        value: Any,
+        expression,
+        connection,
+    ) -> Any:
+        """
+        Convert the database field value into the Enum type. PostgreSQL
+        returns bit strings as strings of 0s and 1s, MySQL returns big endian
+        bytes.
+
+        See :meth:`django.db.models.Field.from_db_value`
+        """
+        if isinstance(value, str):
+            return EnumField.from_db_value(self, int(value, 2), expression, connection)
+        return super().from_db_value(value, expression, connection)
+
+
+BitStringFlagField.register_lookup(HasAnyFlagsBitStringLookup)
+BitStringFlagField.register_lookup(HasAllFlagsBitStringLookup)
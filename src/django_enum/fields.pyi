@@ -19,7 +19,7 @@
 type parameters from the null= and primitive= arguments.
 """
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum, Flag
@@ -29,6 +29,7 @@
     BigIntegerField,
     BinaryField,
     Field,
+    Index,
     IntegerField,
     Model,
     PositiveBigIntegerField,
@@ -38,7 +39,7 @@
 )
 from django.db.models.query_utils import DeferredAttribute
 
-from django_enum.utils import SupportedPrimitive
+from django_enum.utils import CacheInfo, SupportedPrimitive
 
 # Class-level TypeVars (encode the generic parameters of each field class)
 PrimitiveT = TypeVar("PrimitiveT", bound=SupportedPrimitive)
@@ -72,6 +73,8 @@ def __get__(
     def __get__(self, instance: Model, owner: Any) -> EnumT: ...
     def __set__(self, instance: Model, value: PrimitiveT | EnumT | None) -> None: ...
 
+class LazyToPythonDeferredAttribute(ToPythonDeferredAttribute[PrimitiveT, EnumT]): ...
+
 # ---------------------------------------------------------------------------
 # EnumField
 # ---------------------------------------------------------------------------
@@ -90,6 +93,7 @@ class EnumField(Field[PrimitiveT | EnumT, EnumT], Generic[PrimitiveT, EnumT]):
     """
 
     descriptor_class: type[ToPythonDeferredAttribute[Any, Any]]
+    constraint_in_max: int
 
     @property
     def enum(self) -> type[EnumT] | None: ...
@@ -98,9 +102,12 @@ def strict(self) -> bool: ...
     @property
     def coerce(self) -> bool: ...
     @property
+    def lazy(self) -> bool: ...
+    @property
     def constrained(self) -> bool: ...
     @property
     def primitive(self) -> type[PrimitiveT] | None: ...
+    def fallback_cache_info(self) -> CacheInfo | None: ...
 
     # __init__ overrides Field.__init__ so that pyright uses this signature
     # for parameter validation instead of Field.__init__(verbose_name, ...).
@@ -109,8 +116,11 @@ def __init__(
         enum: type[Enum] | None = ...,
         primitive: type[SupportedPrimitive] | None = ...,
         strict: bool = ...,
-        coerce: bool = ...,
+        coerce: bool | Literal["lazy"] = ...,
         constrained: bool | None = ...,
+        fallback_cache_size: int = ...,
+        ordinal: bool = ...,
+        db_enum_type: bool | str = ...,
         null: bool = ...,
         **kwargs: Any,
     ) -> None: ...
@@ -122,7 +132,7 @@ def __new__(
         enum: type[_ET] | None = ...,
         primitive: None = ...,
         strict: bool = ...,
-        coerce: bool = ...,
+        coerce: bool | Literal["lazy"] = ...,
         constrained: bool | None = ...,
         null: Literal[False] = ...,
         **kwargs: Any,
@@ -135,7 +145,7 @@ def __new__(
         enum: type[_ET] | None = ...,
         primitive: type[_PT] = ...,
         strict: bool = ...,
-        coerce: bool = ...,
+        coerce: bool | Literal["lazy"] = ...,
         constrained: bool | None = ...,
         null: Literal[False] = ...,
         **kwargs: Any,
@@ -148,7 +158,7 @@ def __new__(
         enum: type[_ET] | None = ...,
         primitive: None = ...,
         strict: bool = ...,
-        coerce: bool = ...,
+        coerce: bool | Literal["lazy"] = ...,
         constrained: bool | None = ...,
         null: Literal[True] = ...,
         **kwargs: Any,
@@ -161,12 +171,14 @@ def __new__(
         enum: type[_ET] | None = ...,
         primitive: type[_PT] = ...,
         strict: bool = ...,
-        coerce: bool = ...,
+        coerce: bool | Literal["lazy"] = ...,
         constrained: bool | None = ...,
         null: Literal[True] = ...,
         **kwargs: Any,
     ) -> EnumField[_PT, _ET | None]: ...
     def deconstruct(self) -> tuple[str, str, Sequence[Any], dict[str, Any]]: ...
+    def coerce_many(self, values: Iterable[Any]) -> list[EnumT | Any]: ...
+    def prep_many(self, values: Iterable[Any]) -> list[Any]: ...
     @staticmethod
     def constraint_name(
         model_class: type[Model], field_name: str, enum: type[EnumT]
@@ -202,6 +214,14 @@ def __new__(
         **kwargs: Any,
     ) -> EnumCharField[_ET | None]: ...
 
+class EnumTypeCharField(EnumCharField[EnumT], Generic[EnumT]):
+    """Enum field stored in a native database enumeration column."""
+
+    db_enum_type: str
+
+    @property
+    def enum_values(self) -> tuple[str, ...]: ...
+
 class EnumFloatField(EnumField[float, EnumT], Generic[EnumT]):
     """A database field supporting enumerations with floating point values."""
 
@@ -270,6 +290,28 @@ class EnumPositiveBigIntegerField(
 ):
     """Enum field backed by a PositiveBigIntegerField (64 bytes)."""
 
+class OrdinalField(EnumField[PrimitiveT, EnumT], Generic[PrimitiveT, EnumT]):
+    """Enum field that stores the declaration order of each value."""
+
+class SmallIntegerOrdinalField(
+    OrdinalField[PrimitiveT, EnumT],
+    PositiveSmallIntegerField,
+    Generic[PrimitiveT, EnumT],
+):
+    """Ordinal field backed by a PositiveSmallIntegerField (2 bytes)."""
+
+class IntegerOrdinalField(
+    OrdinalField[PrimitiveT, EnumT], PositiveIntegerField, Generic[PrimitiveT, EnumT]
+):
+    """Ordinal field backed by a PositiveIntegerField (4 bytes)."""
+
+class BigIntegerOrdinalField(
+    OrdinalField[PrimitiveT, EnumT],
+    PositiveBigIntegerField,
+    Generic[PrimitiveT, EnumT],
+):
+    """Ordinal field backed by a PositiveBigIntegerField (8 bytes)."""
+
 class EnumDateField(EnumField[date, EnumT], Generic[EnumT]):
     """A database field supporting enumerations with date values."""
 
@@ -399,6 +441,17 @@ def __new__(
         null: Literal[True] = ...,
         **kwargs: Any,
     ) -> FlagField[_FT | None]: ...
+    INDEX_STRATEGIES: tuple[str, ...]
+    in_list_max: int
+    @property
+    def index_strategy(self) -> str | None: ...
+    @property
+    def index_bits(self) -> tuple[int, ...]: ...
+    def composite_cache_info(self) -> CacheInfo | None: ...
+    def in_list(self, mask: int, has_all: bool) -> list[int] | None: ...
+    def flag_indexes(
+        self, model_class: type[Model], field_name: str
+    ) -> list[Index]: ...
 
 class SmallIntegerFlagField(
     FlagField[FlagT], EnumPositiveSmallIntegerField[FlagT], Generic[FlagT]
@@ -415,6 +468,9 @@ class BigIntegerFlagField(
 ):
     """Flag field stored in a PositiveBigIntegerField (64 bytes)."""
 
+class SetFlagField(BigIntegerFlagField[FlagT], Generic[FlagT]):
+    """Flag field stored in a native database set column."""
+
 class EnumExtraBigIntegerField(IntEnumField[FlagT], BinaryField, Generic[FlagT]):
     """Enum field for integers wider than 64 bits, stored as binary."""
 
@@ -437,3 +493,8 @@ class ExtraBigIntegerFlagField(
     FlagField[FlagT], EnumExtraBigIntegerField[FlagT], Generic[FlagT]
 ):
     """Flag field for integers wider than 64 bits."""
+
+class BitStringFlagField(ExtraBigIntegerFlagField[FlagT], Generic[FlagT]):
+    """Flag field stored in a native fixed width bit string column."""
+
+    def native(self, connection: Any) -> bool: ...
@@ -0,0 +1,565 @@
+"""
+Migration operations for enumeration fields stored in native database types
+and for adding the check constraints of enumeration fields without blocking
+writes to large tables.
+
+PostgreSQL enumeration types exist independently of the tables that use them,
+so they must be created before the columns of an
+:class:`~django_enum.fields.EnumTypeCharField` and extended when members are
+added to the enumeration. On MySQL and MariaDB the members are part of the
+column definition, so adding members redefines the columns of the type in
+place. Changes to the choices of a field never alter its column on their own,
+:class:`~django.db.migrations.operations.AlterField` operations that only
+change choices do nothing on the database.
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterator, Mapping, Sequence
+from functools import reduce
+from operator import or_
+from typing import Any, ClassVar
+
+from django.core.exceptions import FieldError
+from django.db.migrations.operations import AddConstraint
+from django.db.migrations.operations.base import Operation
+from django.db.models import (
+    BinaryField,
+    Case,
+    CheckConstraint,
+    Expression,
+    F,
+    Model,
+    Q,
+    Value,
+    When,
+)
+from django.db.models.expressions import CombinedExpression
+
+from django_enum.fields import EnumTypeCharField
+from django_enum.utils import get_set_values
+
+__all__ = [
+    "AddConstraintNotValid",
+    "AddEnumValues",
+    "CreateEnumType",
+    "RemapEnumValues",
+    "RemapFlagBits",
+    "ValidateConstraint",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class CreateEnumType(Operation):
+    """
+    Create a PostgreSQL enumeration type. Add this operation before the
+    operation that creates the first column of the type:
+
+    .. code-block:: python
+
+        from django_enum.operations import CreateEnumType
+
+        operations = [
+            CreateEnumType("color", ["R", "G", "B"]),
+            migrations.CreateModel(...),
+        ]
+
+    :param name: The name of the type, see
+        :attr:`~django_enum.fields.EnumTypeCharField.db_enum_type`
+    :param values: The members of the type in declaration order
+    """
+
+    reversible = True
+
+    def __init__(self, name: str, values: Sequence[str]):
+        self.name = name
+        self.values = list(values)
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(
+                f"CREATE TYPE {schema_editor.quote_name(self.name)} AS ENUM "
+                f"({', '.join(map(schema_editor.quote_value, self.values))})"
+            )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(f"DROP TYPE {schema_editor.quote_name(self.name)}")
+
+    def describe(self):
+        return f"Create enumeration type {self.name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"create_enum_type_{self.name.lower()}"
+
+
+class AddEnumValues(Operation):
+    """
+    Append members to a native enumeration type without rewriting the tables
+    that use it. Members that already exist are skipped. On PostgreSQL the
+    members are added to the type. On MySQL and MariaDB every
+    :class:`~django_enum.fields.EnumTypeCharField` column of the type is
+    redefined with the appended members, which does not copy the table.
+    Members can not be removed in place, so reversing this operation leaves
+    them in place.
+
+    .. note::
+
+        Before PostgreSQL 12 members can not be added inside a transaction,
+        set ``atomic = False`` on the migration.
+
+    :param name: The name of the type
+    :param values: The members to add, in order
+    """
+
+    reversible = True
+
+    def __init__(self, name: str, values: Sequence[str]):
+        self.name = name
+        self.values = list(values)
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            for value in self.values:
+                schema_editor.execute(
+                    f"ALTER TYPE {schema_editor.quote_name(self.name)} ADD VALUE "
+                    f"IF NOT EXISTS {schema_editor.quote_value(value)}"
+                )
+        elif schema_editor.connection.vendor == "mysql":
+            for model, field in self.fields(to_state):
+                appended = self.append_to(field)
+                definition, params = schema_editor.column_sql(
+                    model, appended, include_default=False
+                )
+                schema_editor.execute(
+                    f"ALTER TABLE {schema_editor.quote_name(model._meta.db_table)} "
+                    f"MODIFY {schema_editor.quote_name(field.column)} {definition}",
+                    params,
+                )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        pass
+
+    def fields(self, state):
+        """
+        The concrete :class:`~django_enum.fields.EnumTypeCharField` columns of
+        this type in the given project state.
+        """
+        for model in state.apps.get_models():
+            if model._meta.proxy or not model._meta.managed:
+                continue
+            for field in model._meta.local_fields:
+                if (
+                    isinstance(field, EnumTypeCharField)
+                    and field.db_enum_type == self.name
+                ):
+                    yield model, field
+
+    def append_to(self, field: EnumTypeCharField) -> EnumTypeCharField:
+        """
+        A copy of the field with this operation's members appended to its
+        choices.
+        """
+        _, _, args, kwargs = field.deconstruct()
+        existing = set(field.enum_values)
+        kwargs["choices"] = [
+            *kwargs.get("choices", []),
+            *((value, value) for value in self.values if value not in existing),
+        ]
+        # the column is redefined in place, its indexes are left alone
+        kwargs.update(unique=False, primary_key=False)
+        appended = type(field)(*args, **kwargs)
+        appended.set_attributes_from_name(field.name)
+        appended.model = field.model
+        return appended
+
+    def describe(self):
+        return f"Add {', '.join(self.values)} to enumeration type {self.name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"add_enum_values_{self.name.lower()}"
+
+
+class AddConstraintNotValid(AddConstraint):
+    """
+    Add a check constraint, such as the constraints
+    :class:`~django_enum.fields.EnumField` generates, without checking the
+    existing rows of the table. On PostgreSQL the constraint is added
+    ``NOT VALID`` and on Oracle ``ENABLE NOVALIDATE``, so it only holds a brief
+    lock while new rows are checked. Existing rows are checked later by
+    :class:`ValidateConstraint`, which does not block writes. On other
+    databases the constraint is added and checked as usual.
+
+    Replace the ``AddConstraint`` operation ``makemigrations`` generates for an
+    enumeration field with this operation and validate the constraint in a
+    following migration:
+
+    .. code-block:: python
+
+        # 0002_add_status.py
+        operations = [
+            migrations.AddField(...),
+            AddConstraintNotValid(
+                model_name="order",
+                constraint=models.CheckConstraint(...),
+            ),
+        ]
+
+        # 0003_validate_status.py
+        operations = [
+            ValidateConstraint(model_name="order", name="app_Order_status_Status"),
+        ]
+
+    Unlike the PostgreSQL operation of the same name in
+    :mod:`django.contrib.postgres`, this operation can be used in migrations
+    that run on any database.
+
+    :param model_name: The name of the model
+    :param constraint: The check constraint to add
+    """
+
+    suffixes: ClassVar[dict[str, str]] = {
+        "postgresql": "NOT VALID",
+        "oracle": "ENABLE NOVALIDATE",
+    }
+
+    def __init__(self, model_name: str, constraint: CheckConstraint):
+        if not isinstance(constraint, CheckConstraint):
+            raise TypeError(
+                f"AddConstraintNotValid only supports check constraints, not "
+                f"{constraint!r}."
+            )
+        super().__init__(model_name, constraint)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        suffix = self.suffixes.get(schema_editor.connection.vendor)
+        if suffix is None:
+            return super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            constraint_sql = self.constraint.create_sql(model, schema_editor)
+            if constraint_sql:
+                schema_editor.execute(f"{constraint_sql} {suffix}")
+
+    def describe(self):
+        return (
+            f"Create not valid constraint {self.constraint.name} on model "
+            f"{self.model_name}"
+        )
+
+    @property
+    def migration_name_fragment(self):
+        return f"{self.model_name_lower}_{self.constraint.name.lower()}_not_valid"
+
+
+class ValidateConstraint(Operation):
+    """
+    Check the existing rows of a table against a constraint added by
+    :class:`AddConstraintNotValid`. On PostgreSQL this takes a lock that
+    allows reads and writes while the table is scanned. Run it in a separate
+    migration, or a migration that is not atomic, so the lock taken to add the
+    constraint is released first. Does nothing on databases other than
+    PostgreSQL and Oracle, where the constraint was checked when it was added.
+
+    :param model_name: The name of the model
+    :param name: The name of the constraint
+    """
+
+    reversible = True
+
+    statements: ClassVar[dict[str, str]] = {
+        "postgresql": "ALTER TABLE {table} VALIDATE CONSTRAINT {name}",
+        "oracle": "ALTER TABLE {table} MODIFY CONSTRAINT {name} VALIDATE",
+    }
+
+    def __init__(self, model_name: str, name: str):
+        self.model_name = model_name
+        self.name = name
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        statement = self.statements.get(schema_editor.connection.vendor)
+        if statement is None:
+            return
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.execute(
+                statement.format(
+                    table=schema_editor.quote_name(model._meta.db_table),
+                    name=schema_editor.quote_name(self.name),
+                )
+            )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        pass
+
+    def describe(self):
+        return f"Validate constraint {self.name} on model {self.model_name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"{self.model_name.lower()}_validate_{self.name.lower()}"
+
+
+class RemapEnumValues(Operation):
+    """
+    Rewrite the stored values of an enumeration field, for example when the
+    values of an enumeration are renumbered. The table is walked in batches of
+    ``batch_size`` rows to remap in primary key order and each batch is
+    rewritten by a single ``UPDATE`` with a ``CASE`` over the mapping, so
+    every row is only rewritten once even if new values are also old values.
+
+    Check constraints are not changed by this operation. Every rewritten row
+    must satisfy the constraints on the table when its batch is written, so
+    place this operation after the ``RemoveConstraint`` of the old values and
+    the ``AlterField`` that changes the field's choices, and before the
+    ``AddConstraint`` of its new values:
+
+    .. code-block:: python
+
+        from django_enum.operations import RemapEnumValues
+
+        operations = [
+            migrations.RemoveConstraint(...),
+            migrations.AlterField(...),
+            RemapEnumValues("order", "status", {1: 10, 2: 20, 3: 30}),
+            migrations.AddConstraint(...),
+        ]
+
+    Progress is logged to the ``django_enum.operations`` logger after each
+    batch. In a migration that is not atomic each batch is committed on its
+    own, if the migration is interrupted pass the last primary key logged as
+    ``start`` to resume after it.
+
+    The operation is reversible if no two old values are mapped to the same
+    new value.
+
+    :param model_name: The name of the model
+    :param name: The name of the enumeration field
+    :param mapping: The new value of each old value to rewrite
+    :param batch_size: The number of rows to rewrite per ``UPDATE``
+    :param start: Only rewrite rows with primary keys greater than this when
+        migrating forwards
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        name: str,
+        mapping: Mapping[Any, Any],
+        batch_size: int = 10000,
+        start: Any = None,
+    ):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, not {batch_size}.")
+        self.model_name = model_name
+        self.name = name
+        self.mapping = dict(mapping)
+        self.batch_size = batch_size
+        self.start = start
+
+    @property
+    def reversible(self) -> bool:  # type: ignore[override]
+        return len(set(self.mapping.values())) == len(self.mapping)
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        self.remap(app_label, schema_editor, to_state, self.mapping, self.start)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        self.remap(app_label, schema_editor, from_state, self.inverse())
+
+    def inverse(self) -> dict[Any, Any]:
+        """The mapping that reverses this operation."""
+        return {new: old for old, new in self.mapping.items()}
+
+    def update(self, field, mapping: Mapping[Any, Any]) -> tuple[Q, Expression]:
+        """
+        Build the filter that selects the rows to rewrite and the expression
+        that computes their new values.
+        """
+        mapping = {
+            field._coerce_to_value_type(old): field._coerce_to_value_type(new)
+            for old, new in mapping.items()
+        }
+        return Q(**{f"{self.name}__in": list(mapping)}), Case(
+            *(
+                When(**{self.name: old}, then=Value(new, output_field=field))
+                for old, new in mapping.items()
+            ),
+            default=F(self.name),
+            output_field=field,
+        )
+
+    def remap(
+        self,
+        app_label,
+        schema_editor,
+        state,
+        mapping: Mapping[Any, Any],
+        start: Any = None,
+    ):
+        """Rewrite the stored values of the field using the mapping."""
+        model = state.apps.get_model(app_label, self.model_name)
+        if not mapping or not self.allow_migrate_model(
+            schema_editor.connection.alias, model
+        ):
+            return
+        condition, expression = self.update(model._meta.get_field(self.name), mapping)
+        total = 0
+        for last, rows in self.batches(
+            model, schema_editor.connection.alias, condition, expression, start
+        ):
+            total += rows
+            logger.info(
+                "Remapped %d %s.%s values up to primary key %r.",
+                total,
+                model._meta.label,
+                self.name,
+                last,
+            )
+
+    def batches(
+        self,
+        model: type[Model],
+        alias: str,
+        condition: Q,
+        expression: Expression,
+        start: Any = None,
+    ) -> Iterator[tuple[Any, int]]:
+        """
+        Rewrite the rows matching the condition in batches of primary keys,
+        beginning after the start primary key.
+
+        :yield: The last primary key of each batch and its number of rows
+        """
+        rows = model._base_manager.using(alias).filter(condition)
+        last = start
+        while True:
+            batch = rows if last is None else rows.filter(pk__gt=last)
+            pks = batch.values_list("pk", flat=True)
+            end = pks.order_by("pk")[self.batch_size - 1 : self.batch_size].first()
+            if end is None:
+                # the last batch is smaller than batch_size
+                end = pks.order_by("-pk").first()
+                if end is None:
+                    return
+            count = batch.filter(pk__lte=end).update(**{self.name: expression})
+            last = end
+            yield last, count
+
+    def describe(self):
+        return f"Remap values of {self.model_name}.{self.name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"remap_{self.model_name.lower()}_{self.name.lower()}"
+
+
+class RemapFlagBits(RemapEnumValues):
+    """
+    Move, merge, split or retire the bits of a flag field, for example when the
+    flags of an enumeration are reshuffled. Each old bit is mapped to the bits
+    it becomes, or to ``0`` to clear it. Bits that are not in the mapping are
+    kept. Every batch is rewritten on the database by a single bitwise
+    expression that masks out the old bits and ORs each group of bits that
+    moves the same distance back in shifted into place:
+
+    .. code-block:: python
+
+        from django_enum.operations import RemapFlagBits
+
+        # READ and WRITE swap places, DELETE merges into WRITE, ARCHIVE is retired
+        RemapFlagBits("group", "permissions", {1: 2, 2: 1, 4: 2, 8: 0})
+
+    The rows to rewrite are selected with the field's :ref:`has_any` lookup.
+    Batching, progress reporting, resuming with ``start`` and the placement
+    relative to the field's check constraints are the same as
+    :class:`~django_enum.operations.RemapEnumValues`. Only flag fields of 64
+    bits or less are supported.
+
+    The operation is reversible if the old bits are only moved among
+    themselves.
+
+    :param model_name: The name of the model
+    :param name: The name of the flag field
+    :param mapping: The new bits of each old bit to move
+    :param batch_size: The number of rows to rewrite per ``UPDATE``
+    :param start: Only rewrite rows with primary keys greater than this when
+        migrating forwards
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        name: str,
+        mapping: Mapping[int, int | None],
+        batch_size: int = 10000,
+        start: Any = None,
+    ):
+        for bit, bits in mapping.items():
+            if bit <= 0 or bit & (bit - 1):
+                raise ValueError(f"{bit!r} is not a single flag bit.")
+            if bits is not None and bits < 0:
+                raise ValueError(f"{bits!r} is not a combination of flag bits.")
+        super().__init__(
+            model_name,
+            name,
+            {bit: bits or 0 for bit, bits in mapping.items()},
+            batch_size=batch_size,
+            start=start,
+        )
+
+    @property
+    def reversible(self) -> bool:  # type: ignore[override]
+        return sorted(self.mapping.values()) == sorted(self.mapping)
+
+    def update(self, field, mapping: Mapping[int, int]) -> tuple[Q, Expression]:
+        if field.get_lookup("has_all") is None or isinstance(field, BinaryField):
+            raise FieldError(
+                f"{self.__class__.__name__} requires a flag field of 64 bits or "
+                f"less, not {field.__class__.__name__}."
+            )
+
+        def combine(lhs, connector, rhs) -> CombinedExpression:
+            return CombinedExpression(lhs, connector, Value(rhs), output_field=field)
+
+        # group the old bits by the distance they move
+        shifts: dict[int, int] = defaultdict(int)
+        for old, bits in mapping.items():
+            for new in get_set_values(bits):
+                shifts[new.bit_length() - old.bit_length()] |= old
+        moved = reduce(or_, mapping, 0)
+        expression = combine(F(self.name), CombinedExpression.BITAND, ~moved)
+        for shift, bits in sorted(shifts.items()):
+            part = combine(F(self.name), CombinedExpression.BITAND, bits)
+            if shift > 0:
+                part = combine(part, CombinedExpression.BITLEFTSHIFT, shift)
+            elif shift < 0:
+                part = combine(part, CombinedExpression.BITRIGHTSHIFT, -shift)
+            expression = CombinedExpression(
+                expression, CombinedExpression.BITOR, part, output_field=field
+            )
+        return Q(**{f"{self.name}__has_any": moved}), expression
+
+    def describe(self):
+        return f"Remap flags of {self.model_name}.{self.name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"remap_flags_{self.model_name.lower()}_{self.name.lower()}"
@@ -1,14 +1,130 @@
 """
-Specialized has_any and has_all query lookups for flag enumerations.
+Specialized has_any and has_all query lookups, database functions and bitwise
+aggregates for flag enumerations.
 """
 
-# from django.core.exceptions import FieldError
-from django.db.models.lookups import Lookup
+from enum import Flag
+from functools import reduce
+from operator import and_, or_, xor
 
-# from django_enum.utils import get_set_bits
+from django.core.exceptions import EmptyResultSet, FieldError
+from django.db import NotSupportedError
+from django.db.backends.signals import connection_created
+from django.db.models import (
+    Aggregate,
+    BinaryField,
+    Case,
+    Count,
+    Expression,
+    F,
+    Func,
+    PositiveSmallIntegerField,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
+from django.db.models.expressions import CombinedExpression
+from django.db.models.lookups import FieldGetDbPrepValueMixin, In, Lookup
 
+from django_enum.utils import get_set_values
 
-class HasAllFlagsLookup(Lookup):
+
+class EnumIn(In):
+    """
+    The ``in`` lookup for enumeration fields. Lists of values are prepared
+    with :meth:`~django_enum.fields.EnumField.prep_many`, so each distinct
+    value is only converted once.
+    """
+
+    def get_prep_lookup(self):
+        if self.prepare_rhs and not hasattr(self.rhs, "resolve_expression"):
+            values = list(self.rhs)
+            if not any(hasattr(value, "resolve_expression") for value in values):
+                return self.lhs.output_field.prep_many(values)
+            self.rhs = values
+        return super().get_prep_lookup()
+
+
+class FlagLookup(Lookup):
+    """
+    A common base class for flag lookups. Lookups with constant right-hand
+    sides are simplified where possible: an empty right-hand side is folded to
+    a constant condition and flag fields that can enumerate every matching
+    value (see :meth:`~django_enum.fields.FlagField.in_list`) compile to an
+    ``IN`` list, which unlike bitwise operations can use an index. Fields
+    with a ``"bits"`` or ``"gin"``
+    :attr:`~django_enum.fields.FlagField.index_strategy` compile to the
+    expressions their indexes are built on. Their bits are inlined into the
+    SQL so that the planner can match them to the indexes.
+    """
+
+    has_all: bool
+    bit_join: str
+
+    def empty_rhs_sql(self, lhs_sql: str, lhs_params) -> tuple[str, list]:
+        raise NotImplementedError
+
+    def bitwise_sql(
+        self, lhs_sql: str, lhs_params, rhs_sql: str, rhs_params, connection
+    ) -> tuple[str, list]:
+        raise NotImplementedError
+
+    def bits_sql(self, lhs_sql: str, lhs_params, mask: int, connection):
+        """Test each flag in the mask the way the ``"bits"`` indexes do."""
+        bits = get_set_values(mask)
+        tests = [
+            f"BITAND({lhs_sql}, {bit}) = {bit}"
+            if connection.vendor == "oracle"
+            else f"{lhs_sql} & {bit} = {bit}"
+            for bit in bits
+        ]
+        return f"({self.bit_join.join(tests)})", list(lhs_params) * len(bits)
+
+    def gin_sql(self, lhs_sql: str, lhs_params, mask: int, connection):
+        """
+        Test the array of masked flags the ``"gin"`` index is built on for
+        containment of (has_all) or overlap with (has_any) the mask's flags.
+        """
+        field = self.lhs.output_field
+        element = "bigint" if field.db_type(connection) == "bigint" else "integer"
+        array = ", ".join(f"({lhs_sql} & {bit})" for bit in field.index_bits)
+        flags = ", ".join(str(bit) for bit in get_set_values(mask))
+        return (
+            f"ARRAY[{array}] {'@>' if self.has_all else '&&'} "
+            f"CAST(ARRAY[{flags}] AS {element}[])"
+        ), list(lhs_params) * len(field.index_bits)
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        if self.rhs_is_direct_value() and self.rhs is not None:
+            mask = int(self.rhs)
+            if not mask:
+                return self.empty_rhs_sql(lhs_sql, lhs_params)
+            field = self.lhs.output_field
+            strategy = getattr(field, "index_strategy", None)
+            if strategy == "bits":
+                return self.bits_sql(lhs_sql, lhs_params, mask, connection)
+            if (
+                strategy == "gin"
+                and connection.vendor == "postgresql"
+                and not mask & ~reduce(or_, field.index_bits, 0)
+            ):
+                return self.gin_sql(lhs_sql, lhs_params, mask, connection)
+            in_list = getattr(field, "in_list", None)
+            matches = in_list(mask, self.has_all) if in_list else None
+            if matches is not None:
+                if not matches:
+                    raise EmptyResultSet
+                return f"{lhs_sql} IN ({', '.join(['%s'] * len(matches))})", [
+                    *lhs_params,
+                    *matches,
+                ]
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return self.bitwise_sql(lhs_sql, lhs_params, rhs_sql, rhs_params, connection)
+
+
+class HasAllFlagsLookup(FlagLookup):
     """
     Query whether the left-hand side has all the bit flags on the right-hand
     side. This lookup bitwise ANDs the left-hand side with the right-hand side
@@ -16,10 +132,15 @@ class HasAllFlagsLookup(Lookup):
     """
 
     lookup_name = "has_all"
+    has_all = True
+    bit_join = " AND "
 
-    def as_sql(self, compiler, connection):
-        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
-        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+    def empty_rhs_sql(self, lhs_sql: str, lhs_params) -> tuple[str, list]:
+        return f"{lhs_sql} IS NOT NULL", list(lhs_params)
+
+    def bitwise_sql(
+        self, lhs_sql: str, lhs_params, rhs_sql: str, rhs_params, connection
+    ) -> tuple[str, list]:
         return (
             f"BITAND({lhs_sql}, {rhs_sql}) = {rhs_sql}"
             if connection.vendor == "oracle"
@@ -27,52 +148,7 @@ def as_sql(self, compiler, connection):
         ), [*lhs_params, *rhs_params, *rhs_params]
 
 
-# class ExtraBigFlagMixin:
-#
-#     def get_prep_lookup(self):
-#         return self.lhs.output_field.to_python(super().get_prep_lookup())
-#
-#     def get_rhs_op(self, connection, rhs):
-#         if connection.vendor == 'postgresql':
-#             return connection.operators['exact'] % '1'
-#         raise FieldError(
-#             f'{connection.vendor} does not support {self.lookup_name} on '
-#             f'ExtraBigIntegerFlagFields.'
-#         )
-
-
-# class HasAllFlagsExtraBigLookup(
-#     ExtraBigFlagMixin,
-#     HasAllFlagsLookup
-# ):
-#     """
-#     Support for bitwise has_all lookup on extra big integers (>64 bits)
-#     stored as binary columns.
-#
-#     get_bit(, 0) AND get_bit(, 7) = 1;
-#     """
-#
-#     def process_lhs(self, compiler, connection, lhs=None):
-#         lhs_sql, lhs_params = Exact.process_lhs(
-#               self,
-#               compiler,
-#               connection,
-#               lhs
-#         )
-#         rhs_sql, rhs_params = Exact.process_rhs(self, compiler, connection)
-#         bits = get_set_bits(rhs_params[0])
-#         if self.rhs:
-#             ret = ' AND '.join(
-#                 [
-#                     f'get_bit({lhs_sql}, %s)' for _ in range(len(bits))
-#                 ]
-#             ), bits
-#             print(ret)
-#             return ret
-#         return lhs_sql, lhs_params
-
-
-class HasAnyFlagsLookup(Lookup):
+class HasAnyFlagsLookup(FlagLookup):
     """
     Query whether the left-hand side has any of the bit flags on the right-hand
     side. This lookup bitwise ANDs the left-hand side with the right-hand side
@@ -80,10 +156,15 @@ class HasAnyFlagsLookup(Lookup):
     """
 
     lookup_name = "has_any"
+    has_all = False
+    bit_join = " OR "
 
-    def as_sql(self, compiler, connection):
-        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
-        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+    def empty_rhs_sql(self, lhs_sql: str, lhs_params) -> tuple[str, list]:
+        raise EmptyResultSet
+
+    def bitwise_sql(
+        self, lhs_sql: str, lhs_params, rhs_sql: str, rhs_params, connection
+    ) -> tuple[str, list]:
         return (
             f"BITAND({lhs_sql}, {rhs_sql}) <> 0"
             if connection.vendor == "oracle"
@@ -91,35 +172,556 @@ def as_sql(self, compiler, connection):
         ), [*lhs_params, *rhs_params]
 
 
-# class HasAnyFlagsExtraBigLookup(
-#     ExtraBigFlagMixin,
-#     HasAnyFlagsLookup
-# ):
-#     """
-#     Support for bitwise has_any lookup on extra big integers (>64 bits)
-#     stored as binary columns.
-#     """
-#
-#     def process_lhs(self, compiler, connection, lhs=None):
-#         lhs_sql, lhs_params = Exact.process_lhs(
-#               self,
-#               compiler,
-#               connection,
-#               lhs
-#         )
-#         rhs_sql, rhs_params = Exact.process_rhs(self, compiler, connection)
-#         bits = get_set_bits(rhs_params[0])
-#         if self.rhs:
-#             ret = ' OR '.join(
-#                 [
-#                     f'get_bit({lhs_sql}, %s)' for _ in range(len(bits))
-#                 ]
-#             ), [*bits, 1]
-#             print(ret)
-#             return ret
-#         return lhs_sql, lhs_params
-#
-#     def process_rhs(self, compiler, connection):
-#         rhs_sql, rhs_params = Exact.process_rhs(self, compiler, connection)
-#         rhs_params[0] = 0
-#         return rhs_sql, rhs_params
+def _from_bytes(value) -> int:
+    return int.from_bytes(value, byteorder="big")
+
+
+def _sqlite_has_all(lhs, rhs):
+    if lhs is None or rhs is None:
+        return None
+    rhs = _from_bytes(rhs)
+    return _from_bytes(lhs) & rhs == rhs
+
+
+def _sqlite_has_any(lhs, rhs):
+    if lhs is None or rhs is None:
+        return None
+    return _from_bytes(lhs) & _from_bytes(rhs) != 0
+
+
+def _sqlite_bit_count(value):
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        value = _from_bytes(value)
+    return value.bit_count()
+
+
+class _SQLiteBitAggregate:
+    combine: staticmethod
+
+    def __init__(self):
+        self.value = None
+
+    def step(self, value):
+        if value is not None:
+            self.value = (
+                value if self.value is None else self.combine(self.value, value)
+            )
+
+    def finalize(self):
+        return self.value
+
+
+class _SQLiteBitOr(_SQLiteBitAggregate):
+    combine = staticmethod(or_)
+
+
+class _SQLiteBitAnd(_SQLiteBitAggregate):
+    combine = staticmethod(and_)
+
+
+class _SQLiteBitXor(_SQLiteBitAggregate):
+    combine = staticmethod(xor)
+
+
+def _register_sqlite_functions(sender, connection, **kwargs):
+    """
+    SQLite has no bitwise operations on blobs and no bitwise aggregates, so the
+    extra big flag lookups and the flag aggregates are implemented as
+    functions registered on each new connection.
+    """
+    if connection.vendor == "sqlite":
+        for name, func in [
+            ("django_enum_has_all", _sqlite_has_all),
+            ("django_enum_has_any", _sqlite_has_any),
+        ]:
+            connection.connection.create_function(name, 2, func, deterministic=True)
+        connection.connection.create_function(
+            "django_enum_bit_count", 1, _sqlite_bit_count, deterministic=True
+        )
+        for name, aggregate in [
+            ("django_enum_bit_or", _SQLiteBitOr),
+            ("django_enum_bit_and", _SQLiteBitAnd),
+            ("django_enum_bit_xor", _SQLiteBitXor),
+        ]:
+            connection.connection.create_aggregate(name, 1, aggregate)
+
+
+connection_created.connect(_register_sqlite_functions)
+
+
+class ExtraBigFlagMixin:
+    """
+    Support for bitwise lookups on extra big integers (>64 bits) stored as
+    variable length big endian binary strings. On PostgreSQL the lookup is
+    compiled into tests of the individual bytes of the stored value that
+    overlap the set bytes of the right-hand side, which must be a constant.
+    On SQLite it calls a registered function.
+    """
+
+    sqlite_function: str
+    byte_join: str
+
+    def byte_test(self, byte_sql: str, byte: int) -> str:
+        raise NotImplementedError
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        if connection.vendor == "sqlite":
+            rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+            return f"{self.sqlite_function}({lhs_sql}, {rhs_sql})", [
+                *lhs_params,
+                *rhs_params,
+            ]
+        if connection.vendor == "postgresql" and not hasattr(self.rhs, "as_sql"):
+            mask = _from_bytes(self.rhs)
+            length = f"octet_length({lhs_sql})"
+            tests, params = [], []
+            # byte k of the little endian mask is the k-th byte from the end of
+            # the stored value, which may be shorter than the mask
+            for k, byte in enumerate(
+                mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+            ):
+                if byte:
+                    tests.append(
+                        self.byte_test(
+                            f"(CASE WHEN {length} > {k} THEN "
+                            f"get_byte({lhs_sql}, {length} - {k + 1}) ELSE 0 END)",
+                            byte,
+                        )
+                    )
+                    params.extend(lhs_params * 3)
+            if not tests:
+                return self.empty_rhs_sql(lhs_sql, lhs_params)
+            return f"({self.byte_join.join(tests)})", params
+        raise NotSupportedError(
+            f"{self.lookup_name} is not supported on ExtraBigIntegerFlagFields "
+            f"with {connection.vendor} or non-constant right-hand sides."
+        )
+
+
+class HasAllFlagsExtraBigLookup(ExtraBigFlagMixin, HasAllFlagsLookup):
+    """
+    Support for bitwise has_all lookup on extra big integers (>64 bits)
+    stored as binary columns.
+    """
+
+    sqlite_function = "django_enum_has_all"
+    byte_join = " AND "
+
+    def byte_test(self, byte_sql: str, byte: int) -> str:
+        return f"{byte_sql} & {byte} = {byte}"
+
+
+class HasAnyFlagsExtraBigLookup(ExtraBigFlagMixin, HasAnyFlagsLookup):
+    """
+    Support for bitwise has_any lookup on extra big integers (>64 bits)
+    stored as binary columns.
+    """
+
+    sqlite_function = "django_enum_has_any"
+    byte_join = " OR "
+
+    def byte_test(self, byte_sql: str, byte: int) -> str:
+        return f"{byte_sql} & {byte} <> 0"
+
+
+class BitStringFlagMixin(FieldGetDbPrepValueMixin):
+    """
+    Support for bitwise lookups on flags stored in native bit string columns.
+    The right-hand side is cast to the column's bit string type on PostgreSQL,
+    where bitwise operators require operands of the same width. When the
+    column is not a native bit string the lookup falls back to the extra big
+    flag implementation.
+    """
+
+    def bit_string_sql(
+        self, lhs_sql: str, lhs_params, rhs_sql: str, rhs_params, zero: str
+    ) -> tuple[str, list]:
+        raise NotImplementedError
+
+    def as_sql(self, compiler, connection):
+        field = self.lhs.output_field
+        if not field.native(connection):
+            return super().as_sql(compiler, connection)
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        zero = "0"
+        if connection.vendor == "postgresql":
+            rhs_sql = f"CAST({rhs_sql} AS {field.db_type(connection)})"
+            zero = f"CAST(0 AS {field.db_type(connection)})"
+        return self.bit_string_sql(lhs_sql, lhs_params, rhs_sql, rhs_params, zero)
+
+
+class HasAllFlagsBitStringLookup(BitStringFlagMixin, HasAllFlagsExtraBigLookup):
+    """
+    Support for bitwise has_all lookup on flags stored as bit strings.
+    """
+
+    def bit_string_sql(
+        self, lhs_sql: str, lhs_params, rhs_sql: str, rhs_params, zero: str
+    ) -> tuple[str, list]:
+        return f"{lhs_sql} & {rhs_sql} = {rhs_sql}", [
+            *lhs_params,
+            *rhs_params,
+            *rhs_params,
+        ]
+
+
+class HasAnyFlagsBitStringLookup(BitStringFlagMixin, HasAnyFlagsExtraBigLookup):
+    """
+    Support for bitwise has_any lookup on flags stored as bit strings.
+    """
+
+    def bit_string_sql(
+        self, lhs_sql: str, lhs_params, rhs_sql: str, rhs_params, zero: str
+    ) -> tuple[str, list]:
+        return f"{lhs_sql} & {rhs_sql} <> {zero}", [*lhs_params, *rhs_params]
+
+
+def _width_bits(field) -> list[int]:
+    """
+    Every bit up to the highest flag of a field's enumeration, for databases
+    that must operate on each bit individually.
+    """
+    return [
+        1 << bit
+        for bit in range(reduce(or_, getattr(field, "index_bits", ()), 0).bit_length())
+    ]
+
+
+class FlagAggregate(Aggregate):
+    """
+    A common base class for aggregates that combine the flags of each row in a
+    group with a bitwise operator. The result is resolved to the field's flag
+    enumeration and is None for groups with no non-null values. Only flag
+    fields of 64 bits or less, or native bit string columns on PostgreSQL are
+    supported.
+    """
+
+    sqlite_function: str
+
+    def oracle_bit_sql(self, bit_sql: str, bit: int) -> str:
+        """The aggregate of a single bit of the rows on Oracle."""
+        raise NotImplementedError
+
+    def source_sql(self, compiler, connection) -> tuple[str, list]:
+        expression = self.get_source_expressions()[0]
+        if self.filter:
+            expression = Case(When(self.filter, then=expression))
+        return compiler.compile(expression)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection, function=self.sqlite_function, **extra_context
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        # bitwise aggregates of no rows are 0, or every bit set for BIT_AND, on
+        # MySQL where other databases give null
+        sql, params = self.as_sql(compiler, connection, **extra_context)
+        source_sql, source_params = self.source_sql(compiler, connection)
+        return f"CASE WHEN COUNT({source_sql}) > 0 THEN {sql} END", [
+            *source_params,
+            *params,
+        ]
+
+    def as_oracle(self, compiler, connection, **extra_context):
+        # Oracle has no bitwise aggregates before 21c, so the result is built up
+        # from aggregates of each bit the flag enumeration can hold
+        source_sql, source_params = self.source_sql(compiler, connection)
+        bits = _width_bits(self.output_field)
+        if not bits:
+            return "NULL", []
+        return "({})".format(
+            " + ".join(
+                self.oracle_bit_sql(f"BITAND({source_sql}, {bit})", bit) for bit in bits
+            )
+        ), source_params * len(bits)
+
+
+class FlagOr(FlagAggregate):
+    """
+    Aggregate the union of the flags set in each row of a group.
+
+    .. code-block:: python
+
+        Team.objects.annotate(permissions=FlagOr("members__permissions"))
+    """
+
+    function = "BIT_OR"
+    name = "FlagOr"
+    sqlite_function = "django_enum_bit_or"
+
+    def oracle_bit_sql(self, bit_sql: str, bit: int) -> str:
+        return f"MAX({bit_sql})"
+
+
+class FlagAnd(FlagAggregate):
+    """
+    Aggregate the intersection of the flags set in each row of a group.
+    """
+
+    function = "BIT_AND"
+    name = "FlagAnd"
+    sqlite_function = "django_enum_bit_and"
+
+    def oracle_bit_sql(self, bit_sql: str, bit: int) -> str:
+        return f"MIN({bit_sql})"
+
+
+class FlagXor(FlagAggregate):
+    """
+    Aggregate the flags set in an odd number of the rows of a group. Requires
+    PostgreSQL 14 or later.
+    """
+
+    function = "BIT_XOR"
+    name = "FlagXor"
+    sqlite_function = "django_enum_bit_xor"
+
+    def oracle_bit_sql(self, bit_sql: str, bit: int) -> str:
+        return f"MOD(SUM({bit_sql}) / {bit}, 2) * {bit}"
+
+
+class FlagCount(Func):
+    """
+    The number of flags set in each value of a flag field. This can be used to
+    annotate, order or filter rows by the number of flags they have:
+
+    .. code-block:: python
+
+        Group.objects.annotate(num_permissions=FlagCount("permissions")).order_by(
+            "-num_permissions"
+        )
+
+    Compiles to ``BIT_COUNT`` on MySQL and ``bit_count`` on PostgreSQL 14 or
+    later. Older versions of PostgreSQL and Oracle sum a test of each bit of the
+    enumeration and SQLite calls a function registered on each connection.
+    """
+
+    function = "BIT_COUNT"
+    arity = 1
+    output_field = PositiveSmallIntegerField()
+
+    def bit_sum_sql(self, compiler, connection, bit_and) -> tuple[str, list]:
+        """The sum of a test of each bit of the enumeration."""
+        source_sql, source_params = compiler.compile(self.source_expressions[0])
+        bits = _width_bits(self.source_expressions[0].output_field)
+        if not bits:
+            return "0", []
+        return "({})".format(
+            " + ".join(f"SIGN({bit_and(source_sql, bit)})" for bit in bits)
+        ), source_params * len(bits)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection, function="django_enum_bit_count", **extra_context
+        )
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        field = self.source_expressions[0].output_field
+        if getattr(field, "native", None) and field.native(connection):
+            if getattr(connection, "pg_version", 0) >= 140000:
+                return self.as_sql(
+                    compiler, connection, function="bit_count", **extra_context
+                )
+            # get_bit indexes bit strings from their leftmost bit
+            width = max(field.bit_length, 1)
+            return self.bit_sum_sql(
+                compiler,
+                connection,
+                lambda source, bit: f"get_bit({source}, {width - bit.bit_length()})",
+            )
+        if getattr(connection, "pg_version", 0) >= 140000:
+            # bit_count is defined on bytea and bit strings, but not integers
+            template = "bit_count(%(expressions)s)"
+            if not isinstance(field, BinaryField):
+                template = "bit_count(CAST(CAST(%(expressions)s AS bigint) AS bit(64)))"
+            return self.as_sql(compiler, connection, template=template, **extra_context)
+        return self.bit_sum_sql(
+            compiler, connection, lambda source, bit: f"({source} & {bit})"
+        )
+
+    def as_oracle(self, compiler, connection, **extra_context):
+        return self.bit_sum_sql(
+            compiler, connection, lambda source, bit: f"BITAND({source}, {bit})"
+        )
+
+
+class FlagBit(HasAllFlagsLookup):
+    """
+    Test if a flag, or all of a combination of flags, is set in each value of
+    a flag field. This is a boolean expression equivalent to the
+    :ref:`has_all` lookup, which can also be annotated and ordered on:
+
+    .. code-block:: python
+
+        Group.objects.annotate(can_edit=FlagBit("permissions", Permissions.EDIT))
+    """
+
+    def __init__(self, expression, flag):
+        self.flag = flag
+        super().__init__(
+            F(expression) if isinstance(expression, str) else expression, flag
+        )
+
+    def resolve_expression(self, *args, **kwargs):
+        resolved = super().resolve_expression(*args, **kwargs)
+        # defer to the has_all lookup registered on the field, which prepares
+        # constant flags for the field's column type
+        lookup = resolved.lhs.output_field.get_lookup("has_all")
+        if lookup is None:
+            raise FieldError(
+                f"FlagBit requires a flag field, not "
+                f"{resolved.lhs.output_field.__class__.__name__}."
+            )
+        return lookup(
+            resolved.lhs,
+            resolved.rhs if hasattr(self.flag, "resolve_expression") else self.flag,
+        )
+
+
+def flag_histogram(queryset: QuerySet, field: str) -> dict[Flag | int, int]:
+    """
+    Count the rows of a queryset that have each flag of a flag field set. The
+    counts are computed in a single query of filtered ``COUNT`` aggregates, one
+    for each flag, that use the field's :ref:`has_all` lookup and therefore any
+    indexes declared by its
+    :attr:`~django_enum.fields.FlagField.index_strategy`. Null rows are not
+    counted.
+
+    .. code-block:: python
+
+        from django_enum.query import flag_histogram
+
+        flag_histogram(Group.objects.all(), "permissions")
+        # {Permissions.READ: 1024, Permissions.WRITE: 256, Permissions.EXECUTE: 12}
+
+    :param queryset: The queryset to count the rows of
+    :param field: The name of a flag field on the queryset's model
+    :return: A dictionary mapping each single bit flag of the enumeration to
+        the number of rows that have it set. Fields without an enumeration, like
+        those of historical models in migrations, are keyed by the integer value
+        of each flag.
+    :raises TypeError: If the field is not a flag field
+    """
+    model_field = queryset.model._meta.get_field(field)
+    if model_field.get_lookup("has_all") is None:
+        raise TypeError(f"{queryset.model.__name__}.{field} must be a flag field.")
+    # named combinations of flags are not counted separately
+    members = [
+        model_field.enum(bit) if model_field.enum else bit
+        for bit in model_field.index_bits
+    ]
+    counts = queryset.aggregate(
+        **{
+            f"_{idx}": Count(field, filter=Q(**{f"{field}__has_all": member}))
+            for idx, member in enumerate(members)
+        }
+    )
+    return {member: counts[f"_{idx}"] for idx, member in enumerate(members)}
+
+
+class _BitXor(CombinedExpression):
+    def as_oracle(self, compiler, connection, **extra_context):
+        # Oracle has no bitwise exclusive or: a ^ b = a + b - 2 * (a & b)
+        lhs_sql, lhs_params = compiler.compile(self.lhs)
+        rhs_sql, rhs_params = compiler.compile(self.rhs)
+        return f"({lhs_sql} + {rhs_sql} - 2 * BITAND({lhs_sql}, {rhs_sql}))", [
+            *lhs_params,
+            *rhs_params,
+            *lhs_params,
+            *rhs_params,
+        ]
+
+
+class FlagUpdate(Expression):
+    """
+    A common base class for expressions that change flags of a flag field in
+    place on the database, for use in :meth:`~django.db.models.query.QuerySet.update`
+    and :meth:`~django.db.models.query.QuerySet.bulk_update`. The flags must be
+    flags of the field's enumeration, so the result stays within the range of
+    the field. Fields of historical models in migrations have no enumeration,
+    so their flags are not checked. Only flag fields of 64 bits or less are
+    supported.
+    """
+
+    connector: str
+    combined_class = CombinedExpression
+
+    def __init__(self, expression, flag):
+        super().__init__()
+        self.expression = F(expression) if isinstance(expression, str) else expression
+        self.flag = flag
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.expression!r}, {self.flag!r})"
+
+    def get_source_expressions(self):
+        return [self.expression]
+
+    def set_source_expressions(self, exprs):
+        (self.expression,) = exprs
+
+    def operand(self, flag: int) -> int:
+        """The right-hand side of the bitwise operation for the given flags."""
+        return flag
+
+    def resolve_expression(
+        self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False
+    ):
+        lhs = self.expression.resolve_expression(
+            query, allow_joins, reuse, summarize, for_save
+        )
+        field = lhs.output_field
+        if field.get_lookup("has_all") is None or isinstance(field, BinaryField):
+            raise FieldError(
+                f"{self.__class__.__name__} requires a flag field of 64 bits or "
+                f"less, not {field.__class__.__name__}."
+            )
+        flag = int(getattr(self.flag, "value", self.flag))
+        # historical fields in migrations have no enumeration to check against
+        if field.enum and flag & ~reduce(or_, field.index_bits, 0):
+            raise ValueError(
+                f"{self.flag!r} is not a combination of the flags of {field.enum}."
+            )
+        return self.combined_class(
+            lhs, self.connector, Value(self.operand(flag)), output_field=field
+        ).resolve_expression(query, allow_joins, reuse, summarize, for_save)
+
+
+class FlagSet(FlagUpdate):
+    """
+    Set flags on a flag field, compiles to ``field | flags``:
+
+    .. code-block:: python
+
+        User.objects.filter(is_staff=True).update(
+            permissions=FlagSet("permissions", Permissions.ADMIN)
+        )
+    """
+
+    connector = CombinedExpression.BITOR
+
+
+class FlagClear(FlagUpdate):
+    """
+    Clear flags on a flag field, compiles to ``field & ~flags``.
+    """
+
+    connector = CombinedExpression.BITAND
+
+    def operand(self, flag: int) -> int:
+        return ~flag
+
+
+class FlagToggle(FlagUpdate):
+    """
+    Toggle flags on a flag field, compiles to ``field # flags`` on PostgreSQL,
+    ``field ^ flags`` on MySQL and an arithmetic equivalent on Oracle.
+    """
+
+    connector = CombinedExpression.BITXOR
+    combined_class = _BitXor
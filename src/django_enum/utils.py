@@ -1,19 +1,26 @@
 """Utility routines for django_enum."""
 
 import sys
-from collections.abc import Generator
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum, Flag, IntFlag
 from importlib.util import find_spec
+from threading import Lock
 from typing import (
     TYPE_CHECKING,
     Any,
+    Generic,
+    NamedTuple,
     TypeVar,
     get_args,
 )
 
 __all__ = [
+    "DECOMPOSE_CACHE_SIZE",
+    "CacheInfo",
+    "LRUCache",
     "SupportedPrimitive",
     "choices",
     "decimal_params",
@@ -37,6 +44,8 @@
 T = TypeVar("T")
 E = TypeVar("E", bound=Enum)
 F = TypeVar("F", bound=Flag)
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
 
 SupportedPrimitive = int | str | float | date | datetime | time | timedelta | Decimal
 
@@ -55,9 +64,35 @@ def with_typehint(baseclass: type[T]) -> type[T]:
     return object  # type: ignore
 
 
+def _enum_cache(enum: type[Enum] | None, key: Hashable, compute: Callable[[], T]) -> T:
+    """
+    Memoize facts about an enumeration class. Each fact is computed at most
+    once per enumeration class. Results are stored on the enumeration class
+    itself so they share its lifetime and redefined enumerations (e.g. on
+    autoreload) are recomputed. Results must not be mutated.
+
+    :param enum: The enumeration class the result is for
+    :param key: A key identifying the computation
+    :param compute: A callable that computes the result
+    :return: The result of the computation
+    """
+    if enum is None:
+        return compute()
+    # do not use getattr, subclasses must not share their parent's results
+    cache = enum.__dict__.get("_django_enum_cache_")
+    if cache is None:
+        cache = {}
+        enum._django_enum_cache_ = cache  # type: ignore[attr-defined]
+    try:
+        return cache[key]
+    except KeyError:
+        result = cache[key] = compute()
+        return result
+
+
 def choices(
     enum_cls: type[Enum] | None, override: bool = False, aliases: bool = True
-) -> list[tuple[Any, str]]:
+) -> tuple[tuple[Any, str], ...]:
     """
     Get the Django choices for an enumeration type. If the enum type has a
     choices attribute, it will be used. Otherwise, the choices will be derived
@@ -70,12 +105,16 @@ def choices(
     :param enum_cls: The enumeration type
     :param override: Do not defer to choices attribute on the class if True
     :param aliases: Include first-class aliases in the result if True (default: True)
-    :return: A list of (value, label) pairs
+    :return: A tuple of (value, label) pairs
     """
-    return (
-        (getattr(enum_cls, "choices", []) if not override else [])
-        or (
-            [
+    if not enum_cls:
+        return ()
+    return _enum_cache(
+        enum_cls,
+        ("choices", override, aliases),
+        lambda: tuple(
+            (getattr(enum_cls, "choices", []) if not override else [])
+            or [
                 *(
                     [(None, enum_cls.__empty__)]  # type: ignore[attr-defined]
                     if hasattr(enum_cls, "__empty__")
@@ -86,61 +125,75 @@ def choices(
                     for member in members(enum_cls, aliases=aliases)
                 ],
             ]
-        )
-        if enum_cls
-        else []
+        ),
     )
 
 
 def names(
     enum_cls: type[Enum] | None, override: bool = False, aliases: bool = True
-) -> list[Any]:
+) -> tuple[Any, ...]:
     """
-    Return a list of names to use for the enumeration type. This is used
-    for compat with enums that do not inherit from Django's Choices type.
+    Return the names to use for the enumeration type. This is used for compat
+    with enums that do not inherit from Django's Choices type.
 
     :param enum_cls: The enumeration type
     :param override: Do not defer to names attribute on the class if True
     :param aliases: Include first-class aliases in the result if True (default: True)
-    :return: A list of labels
+    :return: A tuple of names
     """
-    return (
-        (getattr(enum_cls, "names", []) if not override else [])
-        or (
-            [
+    if not enum_cls:
+        return ()
+    return _enum_cache(
+        enum_cls,
+        ("names", override, aliases),
+        lambda: tuple(
+            (getattr(enum_cls, "names", []) if not override else [])
+            or [
                 *(["__empty__"] if hasattr(enum_cls, "__empty__") else []),
                 *[member.name for member in members(enum_cls, aliases=aliases)],
             ]
-        )
-        if enum_cls
-        else []
+        ),
     )
 
 
-def labels(enum_cls: type[Enum] | None) -> list[Any]:
+def labels(enum_cls: type[Enum] | None) -> tuple[Any, ...]:
     """
-    Return a list of labels to use for the enumeration type. See choices.
+    Return the labels to use for the enumeration type. See choices.
 
     This is used for compat with enums that do not inherit from Django's
     Choices type.
 
     :param enum_cls: The enumeration type
-    :return: A list of labels
+    :return: A tuple of labels
     """
-    return getattr(enum_cls, "labels", [label for _, label in choices(enum_cls)])
+    return _enum_cache(
+        enum_cls,
+        "labels",
+        lambda: tuple(
+            getattr(enum_cls, "labels", None)
+            or [label for _, label in choices(enum_cls)]
+        ),
+    )
 
 
-def values(enum_cls: type[Enum] | None) -> list[Any]:
+def values(enum_cls: type[Enum] | None) -> tuple[Any, ...]:
     """
-    Return a list of the values of an enumeration type.
+    Return the values of an enumeration type.
 
     This is used for compat with enums that do not inherit from Django's
     Choices type.
 
     :param enum_cls: The enumeration type
-    :return: A list of values
+    :return: A tuple of values
     """
-    return getattr(enum_cls, "values", [value for value, _ in choices(enum_cls)])
+    return _enum_cache(
+        enum_cls,
+        "values",
+        lambda: tuple(
+            getattr(enum_cls, "values", None)
+            or [value for value, _ in choices(enum_cls)]
+        ),
+    )
 
 
 def determine_primitive(enum: type[Enum]) -> type | None:
@@ -231,6 +284,18 @@ def decimal_params(
     return {"max_digits": max_digits, "decimal_places": decimal_places}
 
 
+def _iter_set_values(value: int) -> Iterator[int]:
+    """
+    Yield the integer value of each set bit of a non-negative integer from
+    lowest to highest. Each step isolates the lowest set bit, so this costs
+    O(popcount) instead of O(bit_length).
+    """
+    while value:
+        lowest = value & -value
+        yield lowest
+        value ^= lowest
+
+
 def get_set_bits(flag: int | IntFlag | None) -> list[int]:
     """
     Return the indices of the bits set in the flag.
@@ -239,7 +304,10 @@ def get_set_bits(flag: int | IntFlag | None) -> list[int]:
     :return: A list of indices of the set bits
     """
     if flag:
-        return [i for i in range(flag.bit_length()) if flag & (1 << i)]
+        value = int(flag)
+        if value < 0:
+            return [i for i in range(value.bit_length()) if value & (1 << i)]
+        return [bit.bit_length() - 1 for bit in _iter_set_values(value)]
     return []
 
 
@@ -251,10 +319,41 @@ def get_set_values(flag: int | IntFlag | None) -> list[int]:
     :return: A list of flag integers
     """
     if flag:
-        return [1 << i for i in range(flag.bit_length()) if (flag >> i) & 1]
+        value = int(flag)
+        if value < 0:
+            return [1 << i for i in range(value.bit_length()) if (value >> i) & 1]
+        return list(_iter_set_values(value))
     return []
 
 
+DECOMPOSE_CACHE_SIZE = 256
+"""
+The number of decompositions :func:`decompose` remembers per flag class.
+"""
+
+
+def _flag_table(enum: type[F]) -> tuple[dict[int, F] | None, tuple[tuple[int, F], ...]]:
+    """
+    Precompute the tables :func:`decompose` uses for a flag class. Returns a
+    mapping of bit values to members if every member is a distinct single bit
+    declared in ascending order - in which case decomposing by set bits gives
+    the same result as scanning the members. The second element is a tuple of
+    (value, member) pairs in declaration order for scanning.
+    """
+    scan = tuple(
+        (member.value, member)
+        for member in enum.__members__.values()
+        if member.value != 0
+    )
+    bit_values = [value for value, _ in scan]
+    if all(
+        isinstance(value, int) and value > 0 and is_power_of_two(value)
+        for value in bit_values
+    ) and bit_values == sorted(set(bit_values)):
+        return {value: member for value, member in scan}, scan
+    return None, scan
+
+
 def decompose(flags: F | None) -> list[F]:
     """
     Get the activated flags in a :class:`~enum.Flag` instance. For example:
@@ -271,20 +370,35 @@ class Permissions(IntFlag):
             [Permissions.READ, Permissions.Write]
         )
 
+    The most recently used decompositions of each flag class are memoized,
+    see :data:`DECOMPOSE_CACHE_SIZE`.
 
     :param: flags: The flag instance to decompose
     :return: A list of the :class:`~enum.Flag` instances comprising the flag.
     """
     if not flags:
         return []
-    return [
-        flg
-        for flg in type(flags).__members__.values()
-        if flg in flags and flg is not type(flags)(0)
-    ]
+    enum = type(flags)
+    value = flags.value
+    decompositions: LRUCache[int, tuple[F, ...]] = _enum_cache(
+        enum, "decompositions", lambda: LRUCache(DECOMPOSE_CACHE_SIZE)
+    )
+    try:
+        return list(decompositions[value])
+    except KeyError:
+        pass
+    bit_members, scan = _enum_cache(enum, "flag_table", lambda: _flag_table(enum))
+    if bit_members is not None and value > 0:
+        members = tuple(
+            bit_members[bit] for bit in _iter_set_values(value) if bit in bit_members
+        )
+    else:
+        members = tuple(member for flg, member in scan if flg & value == flg)
+    decompositions[value] = members
+    return list(members)
 
 
-def members(enum: type[E], aliases: bool = True) -> Generator[E, None, None]:
+def members(enum: type[E], aliases: bool = True) -> tuple[E, ...]:
     """
     Get the members of an enumeration class. This can be tricky to do
     in a python version agnostic way, so it is recommended to
@@ -297,8 +411,14 @@ def members(enum: type[E], aliases: bool = True) -> Generator[E, None, None]:
 
     :param enum_cls: The enumeration class
     :param aliases: Include aliases in the result if True (default: True)
-    :return: A generator that yields the enumeration members
+    :return: A tuple of the enumeration members
     """
+    return _enum_cache(
+        enum, ("members", aliases), lambda: tuple(_members(enum, aliases))
+    )
+
+
+def _members(enum: type[E], aliases: bool) -> Iterator[E]:
     if aliases:
         if PROPERTIES_ENABLED:
             from enum_properties import SymmetricMixin
@@ -323,3 +443,70 @@ def members(enum: type[E], aliases: bool = True) -> Generator[E, None, None]:
         else:
             for name in enum._member_names_:
                 yield enum[name]  # type: ignore[misc]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for a :class:`LRUCache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A thread safe mapping of bounded size that evicts the least recently used
+    entry when it is full. Lookups are counted as hits or misses, see
+    :meth:`info`.
+
+    :param maxsize: The maximum number of entries to hold
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def __getitem__(self, key: K) -> V:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                raise
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key: K, value: V):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __reduce__(self):
+        # copies and pickles start out empty, the lock can not be shared
+        return self.__class__, (self.maxsize,)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self):
+        """Remove all entries and reset the hit and miss counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        :return: The hit and miss counts and the current and maximum sizes of
+            the cache.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
@@ -8,7 +8,7 @@
 from time import perf_counter
 
 from django.db import connection
-from django.db.models import Q
+from django.db.models import F, Q
 from django.test import SimpleTestCase, TestCase, override_settings
 from django.test.utils import CaptureQueriesContext
 from tqdm import tqdm
@@ -16,7 +16,8 @@
 from tests.benchmark import enums as benchmark_enums
 from tests.benchmark import models as benchmark_models
 from tests.oracle_patch import patch_oracle
-from django_enum.utils import get_set_bits
+from django_enum import EnumField
+from django_enum.utils import decompose, get_set_bits, get_set_values
 
 try:
     import enum_properties
@@ -109,6 +110,18 @@ def create(self, obj=None):
                 Model.objects.bulk_create(queue)
                 queue.clear()
 
+    def build(self, Model, **columns):
+        """
+        Build model instances from columns of field values. Enum columns are
+        coerced in bulk so each distinct value is only resolved once.
+        """
+        for name, values in columns.items():
+            field = Model._meta.get_field(name)
+            if isinstance(field, EnumField):
+                columns[name] = field.coerce_many(values)
+        names = list(columns.keys())
+        return [Model(**dict(zip(names, row))) for row in zip(*columns.values())]
+
 
 if ENUM_PROPERTIES_INSTALLED:
     from tests.enum_prop.enums import (
@@ -282,6 +295,38 @@ def test_benchmark(self):
                 f"ChoiceField: {choice_time}"
             )
 
+        def test_coerce_many_benchmark(self):
+            columns = {
+                "small_pos_int": ["VAL2", 2, "Value 2"] * (self.COUNT // 3),
+                "big_int": ["VAL2", 2, "Value 2"] * (self.COUNT // 3),
+                "constant": ["φ", "Pi", "e"] * (self.COUNT // 3),
+                "text": ["V TWo", "V22", "Value2"] * (self.COUNT // 3),
+                "dj_text_enum": ["A", "B", "C"] * (self.COUNT // 3),
+            }
+
+            row_start = perf_counter()
+            names = list(columns.keys())
+            for row in zip(*columns.values()):
+                self.MODEL_CLASS(**dict(zip(names, row)))
+            row_stop = perf_counter()
+
+            many_start = perf_counter()
+            objects = self.build(
+                self.MODEL_CLASS, **{name: list(col) for name, col in columns.items()}
+            )
+            many_stop = perf_counter()
+
+            row_time = row_stop - row_start
+            many_time = many_stop - many_start
+            print(
+                f"(EnumTester) Build Instances -> "
+                f"Per Row: {row_time} "
+                f"coerce_many: {many_time}"
+            )
+            self.assertEqual(len(objects), 3 * (self.COUNT // 3))
+            self.assertIs(objects[0].text, TextEnum.VALUE2)
+            self.assertTrue(many_time < row_time)
+
         def test_single_field_benchmark(self):
             enum_start = perf_counter()
             for idx in range(0, self.COUNT):
@@ -345,6 +390,425 @@ def test_single_field_benchmark(self):
             self.assertTrue((no_coerce_time / choice_time) < 2)
 
 
+class CompositeMemoryBenchmark(BulkCreateMixin, TestCase):
+    """
+    Read back many rows of random composite masks from the widest flag
+    benchmark models and measure how much memory their composite flag values
+    hold on to, with and without the bounded composite cache.
+    """
+
+    COUNT = 20000
+
+    FLAG_MODELS = [
+        benchmark_models.FlagTester031,
+        benchmark_models.FlagTester047,
+        benchmark_models.FlagTester062,
+    ]
+
+    def setUp(self):
+        for FlagModel in self.FLAG_MODELS:
+            for _ in range(self.COUNT):
+                self.create(FlagModel(flags=random.getrandbits(FlagModel.num_flags)))
+        self.create()
+
+    def read(self, FlagModel, bounded):
+        import gc
+        import tracemalloc
+
+        field = FlagModel._meta.get_field("flags")
+        composites = field._composite_cache_
+        composites.clear()
+        if not bounded:
+            field._composite_cache_ = None
+        interned = set(field.enum._value2member_map_)
+        gc.collect()
+        tracemalloc.start()
+        start = perf_counter()
+        try:
+            for _ in FlagModel.objects.iterator(chunk_size=2048):
+                continue
+            read_time = perf_counter() - start
+            gc.collect()
+            held = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+            field._composite_cache_ = composites
+        # release composites python interned so the next run starts clean
+        growth = set(field.enum._value2member_map_) - interned
+        for value in growth:
+            del field.enum._value2member_map_[value]
+        return read_time, held, len(growth)
+
+    def test_composite_memory_benchmark(self):
+        for FlagModel in self.FLAG_MODELS:
+            unbounded_time, unbounded_held, unbounded_growth = self.read(
+                FlagModel, bounded=False
+            )
+            bounded_time, bounded_held, bounded_growth = self.read(
+                FlagModel, bounded=True
+            )
+            print(
+                f"({FlagModel.num_flags} flags) Read {self.COUNT} Composites -> "
+                f"Unbounded: {unbounded_time:.3f}s, {unbounded_held} bytes held, "
+                f"{unbounded_growth} interned "
+                f"Bounded: {bounded_time:.3f}s, {bounded_held} bytes held, "
+                f"{bounded_growth} interned"
+            )
+            self.assertEqual(bounded_growth, 0)
+            self.assertTrue(bounded_held < unbounded_held)
+
+
+class FlagAnalyticsBenchmark(BulkCreateMixin, TestCase):
+    """
+    Compare vectorized flag analytics over numpy arrays against reading the
+    enumeration values of every row and testing them in Python.
+    """
+
+    COUNT = 20000
+
+    FLAG_MODELS = [
+        benchmark_models.FlagTester015,
+        benchmark_models.FlagTester031,
+        benchmark_models.FlagTester062,
+    ]
+
+    def setUp(self):
+        for FlagModel in self.FLAG_MODELS:
+            for _ in range(self.COUNT):
+                self.create(FlagModel(flags=random.getrandbits(FlagModel.num_flags)))
+        self.create()
+
+    def test_flag_analytics_benchmark(self):
+        from django_enum.analytics import bit_frequency, flag_array, has_all, has_any
+
+        for FlagModel in self.FLAG_MODELS:
+            FlagEnum = FlagModel._meta.get_field("flags").enum
+            mask = reduce(or_, random.sample(list(FlagEnum), k=3))
+
+            start = perf_counter()
+            flags = list(FlagModel.objects.values_list("flags", flat=True))
+            py_any = sum(1 for flag in flags if flag & mask)
+            py_all = sum(1 for flag in flags if flag & mask == mask)
+            py_freq = {
+                member: sum(1 for flag in flags if member in flag)
+                for member in FlagEnum
+            }
+            py_time = perf_counter() - start
+
+            start = perf_counter()
+            array = flag_array(FlagModel.objects.all(), "flags")
+            np_any = int(has_any(array, mask).sum())
+            np_all = int(has_all(array, mask).sum())
+            np_freq = bit_frequency(array, FlagEnum)
+            np_time = perf_counter() - start
+
+            print(
+                f"({FlagModel.num_flags} flags) Analyze {self.COUNT} rows -> "
+                f"Python: {py_time:.3f}s NumPy: {np_time:.3f}s"
+            )
+            self.assertEqual((py_any, py_all, py_freq), (np_any, np_all, np_freq))
+            self.assertTrue(np_time < py_time)
+
+
+class FlagAggregateBenchmark(BulkCreateMixin, TestCase):
+    """
+    Compare grouped FlagOr aggregates, FlagCount rankings, flag histograms and
+    FlagSet updates against doing the same work in Python or with a query per
+    flag.
+    """
+
+    COUNT = 20000
+    GROUPS = 16
+
+    FLAG_MODELS = [
+        benchmark_models.FlagTester015,
+        benchmark_models.FlagTester031,
+        benchmark_models.FlagTester062,
+    ]
+
+    def setUp(self):
+        for FlagModel in self.FLAG_MODELS:
+            for _ in range(self.COUNT):
+                self.create(FlagModel(flags=random.getrandbits(FlagModel.num_flags)))
+        self.create()
+
+    def test_flag_aggregate_benchmark(self):
+        from django_enum.query import FlagOr
+
+        for FlagModel in self.FLAG_MODELS:
+            FlagEnum = FlagModel._meta.get_field("flags").enum
+
+            start = perf_counter()
+            py_union = {}
+            for pk, flags in FlagModel.objects.values_list("pk", "flags"):
+                group = pk % self.GROUPS
+                py_union[group] = py_union.get(group, FlagEnum(0)) | flags
+            py_time = perf_counter() - start
+
+            start = perf_counter()
+            db_union = dict(
+                FlagModel.objects.annotate(group=F("pk") % self.GROUPS)
+                .values("group")
+                .annotate(union=FlagOr("flags"))
+                .values_list("group", "union")
+            )
+            db_time = perf_counter() - start
+
+            print(
+                f"({FlagModel.num_flags} flags) Union of {self.COUNT} rows in "
+                f"{self.GROUPS} groups -> Python: {py_time:.3f}s "
+                f"FlagOr: {db_time:.3f}s"
+            )
+            self.assertEqual(py_union, db_union)
+            self.assertTrue(db_time < py_time)
+
+    def test_flag_histogram_benchmark(self):
+        from django_enum.query import flag_histogram
+
+        for FlagModel in self.FLAG_MODELS:
+            FlagEnum = FlagModel._meta.get_field("flags").enum
+
+            start = perf_counter()
+            counts = {
+                member: FlagModel.objects.filter(flags__has_all=member).count()
+                for member in FlagEnum
+            }
+            count_time = perf_counter() - start
+
+            start = perf_counter()
+            histogram = flag_histogram(FlagModel.objects.all(), "flags")
+            histogram_time = perf_counter() - start
+
+            print(
+                f"({FlagModel.num_flags} flags) Histogram of {self.COUNT} rows -> "
+                f"COUNT per flag: {count_time:.3f}s flag_histogram: "
+                f"{histogram_time:.3f}s"
+            )
+            self.assertEqual(counts, histogram)
+            self.assertTrue(histogram_time < count_time)
+
+    def test_flag_update_benchmark(self):
+        from django_enum.query import FlagSet
+
+        for FlagModel in self.FLAG_MODELS:
+            FlagEnum = FlagModel._meta.get_field("flags").enum
+            flag = list(FlagEnum)[-1]
+
+            start = perf_counter()
+            objs = list(FlagModel.objects.all())
+            for obj in objs:
+                obj.flags = obj.flags | flag
+            FlagModel.objects.bulk_update(objs, ["flags"], batch_size=500)
+            py_time = perf_counter() - start
+
+            start = perf_counter()
+            FlagModel.objects.update(flags=FlagSet("flags", flag))
+            db_time = perf_counter() - start
+
+            print(
+                f"({FlagModel.num_flags} flags) Set a flag on {self.COUNT} rows -> "
+                f"read-modify-write: {py_time:.3f}s FlagSet: {db_time:.3f}s"
+            )
+            self.assertEqual(
+                FlagModel.objects.filter(flags__has_all=flag).count(), len(objs)
+            )
+            self.assertTrue(db_time < py_time)
+
+    def test_flag_count_benchmark(self):
+        from django_enum.query import FlagCount
+
+        for FlagModel in self.FLAG_MODELS:
+            start = perf_counter()
+            py_top = [
+                pk
+                for pk, _ in sorted(
+                    FlagModel.objects.values_list("pk", "flags"),
+                    key=lambda row: (-row[1].value.bit_count(), row[0]),
+                )[:100]
+            ]
+            py_time = perf_counter() - start
+
+            start = perf_counter()
+            db_top = list(
+                FlagModel.objects.annotate(num_flags=FlagCount("flags"))
+                .order_by("-num_flags", "pk")
+                .values_list("pk", flat=True)[:100]
+            )
+            db_time = perf_counter() - start
+
+            print(
+                f"({FlagModel.num_flags} flags) Top 100 of {self.COUNT} rows by "
+                f"number of flags -> Python: {py_time:.3f}s FlagCount: {db_time:.3f}s"
+            )
+            self.assertEqual(py_top, db_top)
+            self.assertTrue(db_time < py_time)
+
+
+class ExtraBigFlagLookupBenchmark(BulkCreateMixin, TestCase):
+    """
+    Compare has_any and has_all lookups on flag fields wider than 64 bits
+    against loading every row and testing the flags in Python.
+    """
+
+    COUNT = 20000
+
+    def setUp(self):
+        from tests.djenum.models import EnumFlagTester
+
+        self.MODEL_CLASS = EnumFlagTester
+        FlagEnum = EnumFlagTester._meta.get_field("extra_big_pos").enum
+        for _ in range(self.COUNT):
+            self.create(
+                EnumFlagTester(
+                    extra_big_pos=reduce(
+                        or_, random.sample(list(FlagEnum), k=2), FlagEnum(0)
+                    )
+                )
+            )
+        self.create()
+
+    def test_extra_big_lookup_benchmark(self):
+        if connection.vendor not in ["sqlite", "postgresql"]:
+            return
+        FlagEnum = self.MODEL_CLASS._meta.get_field("extra_big_pos").enum
+        for query in [FlagEnum.ONE, FlagEnum.FOUR, FlagEnum.ONE | FlagEnum.FIVE]:
+            for lookup, test in [
+                ("has_any", lambda val: bool(val & query)),
+                ("has_all", lambda val: val & query == query),
+            ]:
+                start = perf_counter()
+                scan = [
+                    pk
+                    for pk, val in self.MODEL_CLASS.objects.values_list(
+                        "pk", "extra_big_pos"
+                    )
+                    if test(val)
+                ]
+                scan_time = perf_counter() - start
+
+                start = perf_counter()
+                sql = list(
+                    self.MODEL_CLASS.objects.filter(
+                        **{f"extra_big_pos__{lookup}": query}
+                    ).values_list("pk", flat=True)
+                )
+                sql_time = perf_counter() - start
+
+                print(
+                    f"({connection.vendor}) extra_big_pos__{lookup}={query!r} "
+                    f"x {self.COUNT} -> Scan: {scan_time:.3f}s Lookup: {sql_time:.3f}s"
+                )
+                self.assertEqual(set(scan), set(sql))
+                self.assertTrue(sql_time < scan_time)
+
+
+class FlagUtilsBenchmark(SimpleTestCase):
+    """
+    Compare bit iteration and flag decomposition against the scanning
+    implementations they replaced at several flag widths.
+    """
+
+    COUNT = 20000
+    DISTINCT = 500
+
+    @staticmethod
+    def scan_set_bits(flag):
+        return [i for i in range(flag.bit_length()) if flag & (1 << i)]
+
+    @staticmethod
+    def scan_set_values(flag):
+        return [1 << i for i in range(flag.bit_length()) if (flag >> i) & 1]
+
+    @staticmethod
+    def scan_decompose(flags):
+        return [
+            flg
+            for flg in type(flags).__members__.values()
+            if flg in flags and flg is not type(flags)(0)
+        ]
+
+    def time(self, func, masks):
+        start = perf_counter()
+        for mask in masks:
+            func(mask)
+        return perf_counter() - start
+
+    def test_flag_utils_benchmark(self):
+        for num_flags in [16, 32, 62]:
+            FlagEnum = benchmark_enums.enums[num_flags - 1]
+            # sparse masks (a few flags set) are the common case
+            distinct = [
+                reduce(or_, random.sample(list(FlagEnum), k=3))
+                for _ in range(self.DISTINCT)
+            ]
+            masks = [random.choice(distinct) for _ in range(self.COUNT)]
+            ints = [int(mask) for mask in masks]
+            for name, scan, fast, args in [
+                ("get_set_bits", self.scan_set_bits, get_set_bits, ints),
+                ("get_set_values", self.scan_set_values, get_set_values, ints),
+                ("decompose", self.scan_decompose, decompose, masks),
+            ]:
+                scan_time = self.time(scan, args)
+                fast_time = self.time(fast, args)
+                print(
+                    f"({num_flags} flags) {name} x {self.COUNT} -> "
+                    f"Scan: {scan_time:.4f}s Fast: {fast_time:.4f}s"
+                )
+                self.assertTrue(fast_time < scan_time)
+
+
+class StartupBenchmark(SimpleTestCase):
+    """
+    Time the declaration of many models with enum fields over a handful of
+    shared enumerations. Field analysis is memoized per enumeration class, the
+    cold run discards this memo before each model to simulate per-field
+    analysis.
+    """
+
+    MODELS = 200
+
+    def declare_models(self, cold):
+        from django.db.models import Model
+
+        from tests.djenum import enums
+
+        shared = [
+            enums.SmallPosIntEnum,
+            enums.BigIntEnum,
+            enums.Constants,
+            enums.TextEnum,
+            enums.DateEnum,
+            enums.DecimalEnum,
+            enums.DurationEnum,
+            enums.PositiveFlagEnum,
+            enums.ExtraBigPositiveFlagEnum,
+        ]
+        start = perf_counter()
+        for idx in range(self.MODELS):
+            if cold:
+                for enum in shared:
+                    enum.__dict__.get("_django_enum_cache_", {}).clear()
+            attrs = {
+                "__module__": __name__,
+                "Meta": type("Meta", (), {"abstract": True}),
+            }
+            for enum_idx, enum in enumerate(shared):
+                attrs[f"field{enum_idx}"] = EnumField(enum, null=True, blank=True)
+                attrs[f"strict{enum_idx}"] = EnumField(enum, strict=False)
+            type(f"StartupModel{idx}", (Model,), attrs)
+        return perf_counter() - start
+
+    def test_startup_benchmark(self):
+        cold_time = self.declare_models(cold=True)
+        warm_time = self.declare_models(cold=False)
+        print(
+            f"Declare {self.MODELS} Models -> "
+            f"Analyzed per field: {cold_time} "
+            f"Analyzed per enum: {warm_time}"
+        )
+        self.assertTrue(warm_time < cold_time)
+
+
 @override_settings(
     DEBUG=False,
     INSTALLED_APPS=[
@@ -456,3 +456,14 @@ class NestStatusInt(int, Enum):
     DONE = 3
     REJECTED = 4
     CANCELLED = 5
+
+
+# a code list with many values, mostly in contiguous blocks
+CodeEnum = IntegerChoices(
+    "CodeEnum",
+    [
+        (f"C{code}", code)
+        for code in [7, 11, 13, *range(100, 200), *range(300, 303), 400, 401, 1000]
+    ],
+    module=__name__,
+)
@@ -0,0 +1,128 @@
+# Generated by Django 5.2.18 on 2026-10-16 17:41
+
+import datetime
+import django_enum.fields
+from django.db import migrations, models
+from tests.compat import CheckConstraint
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tests_djenum", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LazyCoerceTester",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "small_pos_int",
+                    django_enum.fields.EnumPositiveSmallIntegerField(
+                        blank=True,
+                        choices=[
+                            (0, "Value 1"),
+                            (2, "Value 2"),
+                            (32767, "Value 32767"),
+                        ],
+                        default=None,
+                        null=True,
+                    ),
+                ),
+                (
+                    "text",
+                    django_enum.fields.EnumCharField(
+                        blank=True,
+                        choices=[
+                            ("V1", "Value1"),
+                            ("V22", "Value2"),
+                            ("V333", "Value3"),
+                            ("D", "Default"),
+                        ],
+                        default=None,
+                        max_length=4,
+                        null=True,
+                    ),
+                ),
+                (
+                    "date_enum",
+                    django_enum.fields.EnumDateField(
+                        blank=True,
+                        choices=[
+                            (datetime.date(1984, 8, 7), "BRIAN"),
+                            (datetime.date(1989, 7, 27), "EMMA"),
+                            (datetime.date(2016, 9, 9), "HUGO"),
+                        ],
+                        default=datetime.date(1989, 7, 27),
+                    ),
+                ),
+                (
+                    "non_strict_int",
+                    django_enum.fields.EnumPositiveSmallIntegerField(
+                        blank=True,
+                        choices=[
+                            (0, "Value 1"),
+                            (2, "Value 2"),
+                            (32767, "Value 32767"),
+                        ],
+                        default=5,
+                    ),
+                ),
+                (
+                    "flag",
+                    django_enum.fields.IntegerFlagField(
+                        blank=True,
+                        choices=[
+                            (67108864, "ONE"),
+                            (134217728, "TWO"),
+                            (268435456, "THREE"),
+                            (536870912, "FOUR"),
+                            (1073741824, "FIVE"),
+                        ],
+                        default=0,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    CheckConstraint(
+                        condition=models.Q(
+                            ("small_pos_int__in", [0, 2, 32767]),
+                            ("small_pos_int__isnull", True),
+                            _connector="OR",
+                        ),
+                        name="tests_djenum_LazyCoerceTester_small_pos_int_SmallPosIntEnum",
+                    ),
+                    CheckConstraint(
+                        condition=models.Q(
+                            ("text__in", ["V1", "V22", "V333", "D"]),
+                            ("text__isnull", True),
+                            _connector="OR",
+                        ),
+                        name="tests_djenum_LazyCoerceTester_text_TextEnum",
+                    ),
+                    CheckConstraint(
+                        condition=models.Q(
+                            (
+                                "date_enum__in",
+                                [
+                                    datetime.date(1984, 8, 7),
+                                    datetime.date(1989, 7, 27),
+                                    datetime.date(2016, 9, 9),
+                                ],
+                            )
+                        ),
+                        name="tests_djenum_LazyCoerceTester_date_enum_DateEnum",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.18 on 2026-10-16 18:36
+
+import django_enum.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tests_djenum", "0002_lazy_coerce_tester"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BitStringTester",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "small_pos",
+                    django_enum.fields.BitStringFlagField(
+                        bit_length=15,
+                        blank=True,
+                        choices=[
+                            (1024, "ONE"),
+                            (2048, "TWO"),
+                            (4096, "THREE"),
+                            (8192, "FOUR"),
+                            (16384, "FIVE"),
+                        ],
+                        default=None,
+                        editable=True,
+                        null=True,
+                    ),
+                ),
+                (
+                    "pos",
+                    django_enum.fields.BitStringFlagField(
+                        bit_length=31,
+                        blank=True,
+                        choices=[
+                            (67108864, "ONE"),
+                            (134217728, "TWO"),
+                            (268435456, "THREE"),
+                            (536870912, "FOUR"),
+                            (1073741824, "FIVE"),
+                        ],
+                        default=0,
+                        editable=True,
+                    ),
+                ),
+                (
+                    "extra_big_pos",
+                    django_enum.fields.BitStringFlagField(
+                        bit_length=66,
+                        blank=True,
+                        choices=[
+                            (1, "ONE"),
+                            (2, "TWO"),
+                            (9223372036854775808, "THREE"),
+                            (18446744073709551616, "FOUR"),
+                            (36893488147419103232, "FIVE"),
+                        ],
+                        db_index=True,
+                        default=0,
+                        editable=True,
+                    ),
+                ),
+            ],
+        ),
+    ]
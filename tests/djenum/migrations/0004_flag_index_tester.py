@@ -0,0 +1,92 @@
+# Generated by Django 5.2.18 on 2026-10-16 18:47
+
+import django.db.models.expressions
+import django_enum.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tests_djenum", "0003_bit_string_tester"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FlagIndexTester",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "btree",
+                    django_enum.fields.IntegerFlagField(
+                        blank=True,
+                        choices=[
+                            (67108864, "ONE"),
+                            (134217728, "TWO"),
+                            (268435456, "THREE"),
+                            (536870912, "FOUR"),
+                            (1073741824, "FIVE"),
+                        ],
+                        default=0,
+                    ),
+                ),
+                (
+                    "bits",
+                    django_enum.fields.SmallIntegerFlagField(
+                        blank=True,
+                        choices=[
+                            (1024, "ONE"),
+                            (2048, "TWO"),
+                            (4096, "THREE"),
+                            (8192, "FOUR"),
+                            (16384, "FIVE"),
+                        ],
+                        default=None,
+                        null=True,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["btree"], name="tests_djenu_btree_5bffde_idx"),
+                    models.Index(
+                        django.db.models.expressions.CombinedExpression(
+                            models.F("bits"), "&", models.Value(1024)
+                        ),
+                        name="tests_djenu_bits_35bfd1_b10",
+                    ),
+                    models.Index(
+                        django.db.models.expressions.CombinedExpression(
+                            models.F("bits"), "&", models.Value(2048)
+                        ),
+                        name="tests_djenu_bits_a73802_b11",
+                    ),
+                    models.Index(
+                        django.db.models.expressions.CombinedExpression(
+                            models.F("bits"), "&", models.Value(4096)
+                        ),
+                        name="tests_djenu_bits_55cbc5_b12",
+                    ),
+                    models.Index(
+                        django.db.models.expressions.CombinedExpression(
+                            models.F("bits"), "&", models.Value(8192)
+                        ),
+                        name="tests_djenu_bits_4b7525_b13",
+                    ),
+                    models.Index(
+                        django.db.models.expressions.CombinedExpression(
+                            models.F("bits"), "&", models.Value(16384)
+                        ),
+                        name="tests_djenu_bits_152bc5_b14",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,160 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:11
+
+import django_enum.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tests_djenum", "0004_flag_index_tester"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CodeConstraintTester",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "code",
+                    django_enum.fields.EnumPositiveSmallIntegerField(
+                        blank=True,
+                        choices=[
+                            (7, "C7"),
+                            (11, "C11"),
+                            (13, "C13"),
+                            (100, "C100"),
+                            (101, "C101"),
+                            (102, "C102"),
+                            (103, "C103"),
+                            (104, "C104"),
+                            (105, "C105"),
+                            (106, "C106"),
+                            (107, "C107"),
+                            (108, "C108"),
+                            (109, "C109"),
+                            (110, "C110"),
+                            (111, "C111"),
+                            (112, "C112"),
+                            (113, "C113"),
+                            (114, "C114"),
+                            (115, "C115"),
+                            (116, "C116"),
+                            (117, "C117"),
+                            (118, "C118"),
+                            (119, "C119"),
+                            (120, "C120"),
+                            (121, "C121"),
+                            (122, "C122"),
+                            (123, "C123"),
+                            (124, "C124"),
+                            (125, "C125"),
+                            (126, "C126"),
+                            (127, "C127"),
+                            (128, "C128"),
+                            (129, "C129"),
+                            (130, "C130"),
+                            (131, "C131"),
+                            (132, "C132"),
+                            (133, "C133"),
+                            (134, "C134"),
+                            (135, "C135"),
+                            (136, "C136"),
+                            (137, "C137"),
+                            (138, "C138"),
+                            (139, "C139"),
+                            (140, "C140"),
+                            (141, "C141"),
+                            (142, "C142"),
+                            (143, "C143"),
+                            (144, "C144"),
+                            (145, "C145"),
+                            (146, "C146"),
+                            (147, "C147"),
+                            (148, "C148"),
+                            (149, "C149"),
+                            (150, "C150"),
+                            (151, "C151"),
+                            (152, "C152"),
+                            (153, "C153"),
+                            (154, "C154"),
+                            (155, "C155"),
+                            (156, "C156"),
+                            (157, "C157"),
+                            (158, "C158"),
+                            (159, "C159"),
+                            (160, "C160"),
+                            (161, "C161"),
+                            (162, "C162"),
+                            (163, "C163"),
+                            (164, "C164"),
+                            (165, "C165"),
+                            (166, "C166"),
+                            (167, "C167"),
+                            (168, "C168"),
+                            (169, "C169"),
+                            (170, "C170"),
+                            (171, "C171"),
+                            (172, "C172"),
+                            (173, "C173"),
+                            (174, "C174"),
+                            (175, "C175"),
+                            (176, "C176"),
+                            (177, "C177"),
+                            (178, "C178"),
+                            (179, "C179"),
+                            (180, "C180"),
+                            (181, "C181"),
+                            (182, "C182"),
+                            (183, "C183"),
+                            (184, "C184"),
+                            (185, "C185"),
+                            (186, "C186"),
+                            (187, "C187"),
+                            (188, "C188"),
+                            (189, "C189"),
+                            (190, "C190"),
+                            (191, "C191"),
+                            (192, "C192"),
+                            (193, "C193"),
+                            (194, "C194"),
+                            (195, "C195"),
+                            (196, "C196"),
+                            (197, "C197"),
+                            (198, "C198"),
+                            (199, "C199"),
+                            (300, "C300"),
+                            (301, "C301"),
+                            (302, "C302"),
+                            (400, "C400"),
+                            (401, "C401"),
+                            (1000, "C1000"),
+                        ],
+                        default=None,
+                        null=True,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            ("code__range", (100, 199)),
+                            ("code__range", (300, 302)),
+                            ("code__in", [7, 11, 13, 400, 401, 1000]),
+                            ("code__isnull", True),
+                            _connector="OR",
+                        ),
+                        name="tests_djenum_CodeConstraintTester_code_CodeEnum",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,279 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:17
+
+import datetime
+import django_enum.fields
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tests_djenum", "0005_code_constraint_tester"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrdinalTester",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "text",
+                    django_enum.fields.SmallIntegerOrdinalField(
+                        blank=True,
+                        choices=[
+                            ("V1", "Value1"),
+                            ("V22", "Value2"),
+                            ("V333", "Value3"),
+                            ("D", "Default"),
+                        ],
+                        default="V1",
+                    ),
+                ),
+                (
+                    "dj_text",
+                    django_enum.fields.SmallIntegerOrdinalField(
+                        blank=True,
+                        choices=[("A", "Label A"), ("B", "Label B"), ("C", "Label C")],
+                        default=None,
+                        null=True,
+                    ),
+                ),
+                (
+                    "constant",
+                    django_enum.fields.SmallIntegerOrdinalField(
+                        blank=True,
+                        choices=[
+                            (None, "NONE"),
+                            (3.141592653589793, "PI"),
+                            (2.71828, "e"),
+                            (1.618033988749895, "GOLDEN_RATIO"),
+                        ],
+                        default=None,
+                        null=True,
+                    ),
+                ),
+                (
+                    "decimal",
+                    django_enum.fields.SmallIntegerOrdinalField(
+                        blank=True,
+                        choices=[
+                            (Decimal("0.99"), "ONE"),
+                            (Decimal("0.999"), "TWO"),
+                            (Decimal("0.9999"), "THREE"),
+                            (Decimal("99.9999"), "FOUR"),
+                            (Decimal("999"), "FIVE"),
+                        ],
+                        default=None,
+                        null=True,
+                    ),
+                ),
+                (
+                    "date",
+                    django_enum.fields.SmallIntegerOrdinalField(
+                        blank=True,
+                        choices=[
+                            (datetime.date(1984, 8, 7), "BRIAN"),
+                            (datetime.date(1989, 7, 27), "EMMA"),
+                            (datetime.date(2016, 9, 9), "HUGO"),
+                        ],
+                        default=None,
+                        null=True,
+                    ),
+                ),
+                (
+                    "code",
+                    django_enum.fields.SmallIntegerOrdinalField(
+                        blank=True,
+                        choices=[
+                            (7, "C7"),
+                            (11, "C11"),
+                            (13, "C13"),
+                            (100, "C100"),
+                            (101, "C101"),
+                            (102, "C102"),
+                            (103, "C103"),
+                            (104, "C104"),
+                            (105, "C105"),
+                            (106, "C106"),
+                            (107, "C107"),
+                            (108, "C108"),
+                            (109, "C109"),
+                            (110, "C110"),
+                            (111, "C111"),
+                            (112, "C112"),
+                            (113, "C113"),
+                            (114, "C114"),
+                            (115, "C115"),
+                            (116, "C116"),
+                            (117, "C117"),
+                            (118, "C118"),
+                            (119, "C119"),
+                            (120, "C120"),
+                            (121, "C121"),
+                            (122, "C122"),
+                            (123, "C123"),
+                            (124, "C124"),
+                            (125, "C125"),
+                            (126, "C126"),
+                            (127, "C127"),
+                            (128, "C128"),
+                            (129, "C129"),
+                            (130, "C130"),
+                            (131, "C131"),
+                            (132, "C132"),
+                            (133, "C133"),
+                            (134, "C134"),
+                            (135, "C135"),
+                            (136, "C136"),
+                            (137, "C137"),
+                            (138, "C138"),
+                            (139, "C139"),
+                            (140, "C140"),
+                            (141, "C141"),
+                            (142, "C142"),
+                            (143, "C143"),
+                            (144, "C144"),
+                            (145, "C145"),
+                            (146, "C146"),
+                            (147, "C147"),
+                            (148, "C148"),
+                            (149, "C149"),
+                            (150, "C150"),
+                            (151, "C151"),
+                            (152, "C152"),
+                            (153, "C153"),
+                            (154, "C154"),
+                            (155, "C155"),
+                            (156, "C156"),
+                            (157, "C157"),
+                            (158, "C158"),
+                            (159, "C159"),
+                            (160, "C160"),
+                            (161, "C161"),
+                            (162, "C162"),
+                            (163, "C163"),
+                            (164, "C164"),
+                            (165, "C165"),
+                            (166, "C166"),
+                            (167, "C167"),
+                            (168, "C168"),
+                            (169, "C169"),
+                            (170, "C170"),
+                            (171, "C171"),
+                            (172, "C172"),
+                            (173, "C173"),
+                            (174, "C174"),
+                            (175, "C175"),
+                            (176, "C176"),
+                            (177, "C177"),
+                            (178, "C178"),
+                            (179, "C179"),
+                            (180, "C180"),
+                            (181, "C181"),
+                            (182, "C182"),
+                            (183, "C183"),
+                            (184, "C184"),
+                            (185, "C185"),
+                            (186, "C186"),
+                            (187, "C187"),
+                            (188, "C188"),
+                            (189, "C189"),
+                            (190, "C190"),
+                            (191, "C191"),
+                            (192, "C192"),
+                            (193, "C193"),
+                            (194, "C194"),
+                            (195, "C195"),
+                            (196, "C196"),
+                            (197, "C197"),
+                            (198, "C198"),
+                            (199, "C199"),
+                            (300, "C300"),
+                            (301, "C301"),
+                            (302, "C302"),
+                            (400, "C400"),
+                            (401, "C401"),
+                            (1000, "C1000"),
+                        ],
+                        default=None,
+                        null=True,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(("text__in", ["V1", "V22", "V333", "D"])),
+                        name="tests_djenum_OrdinalTester_text_TextEnum",
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            ("dj_text__in", ["A", "B", "C"]),
+                            ("dj_text__isnull", True),
+                            _connector="OR",
+                        ),
+                        name="tests_djenum_OrdinalTester_dj_text_DJTextEnum",
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            (
+                                "constant__in",
+                                [None, 3.141592653589793, 2.71828, 1.618033988749895],
+                            ),
+                            ("constant__isnull", True),
+                            _connector="OR",
+                        ),
+                        name="tests_djenum_OrdinalTester_constant_NullableConstants",
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            (
+                                "decimal__in",
+                                [
+                                    Decimal("0.99"),
+                                    Decimal("0.999"),
+                                    Decimal("0.9999"),
+                                    Decimal("99.9999"),
+                                    Decimal("999"),
+                                ],
+                            ),
+                            ("decimal__isnull", True),
+                            _connector="OR",
+                        ),
+                        name="tests_djenum_OrdinalTester_decimal_DecimalEnum",
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            (
+                                "date__in",
+                                [
+                                    datetime.date(1984, 8, 7),
+                                    datetime.date(1989, 7, 27),
+                                    datetime.date(2016, 9, 9),
+                                ],
+                            ),
+                            ("date__isnull", True),
+                            _connector="OR",
+                        ),
+                        name="tests_djenum_OrdinalTester_date_DateEnum",
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            ("code__range", (7, 1000)),
+                            ("code__isnull", True),
+                            _connector="OR",
+                        ),
+                        name="tests_djenum_OrdinalTester_code_CodeEnum",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:24
+
+import django_enum.fields
+import django_enum.operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tests_djenum", "0006_ordinal_tester"),
+    ]
+
+    operations = [
+        django_enum.operations.CreateEnumType(
+            "tests_djenum_textenum", ["V1", "V22", "V333", "D"]
+        ),
+        django_enum.operations.CreateEnumType("djenum_dj_text", ["A", "B", "C"]),
+        migrations.CreateModel(
+            name="DBEnumTypeTester",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "text",
+                    django_enum.fields.EnumTypeCharField(
+                        blank=True,
+                        choices=[
+                            ("V1", "Value1"),
+                            ("V22", "Value2"),
+                            ("V333", "Value3"),
+                            ("D", "Default"),
+                        ],
+                        db_enum_type="tests_djenum_textenum",
+                        default="V1",
+                        max_length=4,
+                    ),
+                ),
+                (
+                    "dj_text",
+                    django_enum.fields.EnumTypeCharField(
+                        blank=True,
+                        choices=[("A", "Label A"), ("B", "Label B"), ("C", "Label C")],
+                        db_enum_type="djenum_dj_text",
+                        default=None,
+                        max_length=1,
+                        null=True,
+                    ),
+                ),
+                (
+                    "flags",
+                    django_enum.fields.SetFlagField(
+                        bit_length=15,
+                        blank=True,
+                        choices=[
+                            (1024, "ONE"),
+                            (2048, "TWO"),
+                            (4096, "THREE"),
+                            (8192, "FOUR"),
+                            (16384, "FIVE"),
+                        ],
+                        db_enum_type=True,
+                        default=0,
+                        null=True,
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -11,6 +11,7 @@
     BigNegativeFlagEnum,
     BigPosIntEnum,
     BigPositiveFlagEnum,
+    CodeEnum,
     Constants,
     DateEnum,
     DateTimeEnum,
@@ -415,3 +416,63 @@ class FlagFilterTester(models.Model):
 
     def get_absolute_url(self):
         return reverse("tests_djenum:flag-detail", kwargs={"pk": self.pk})
+
+
+class LazyCoerceTester(models.Model):
+    small_pos_int = EnumField(
+        SmallPosIntEnum, coerce="lazy", null=True, default=None, blank=True
+    )
+    text = EnumField(TextEnum, coerce="lazy", null=True, default=None, blank=True)
+    date_enum = EnumField(DateEnum, coerce="lazy", default=DateEnum.EMMA, blank=True)
+    non_strict_int = EnumField(
+        SmallPosIntEnum, coerce="lazy", strict=False, default=5, blank=True
+    )
+    flag = EnumField(PositiveFlagEnum, coerce="lazy")
+
+
+class BitStringTester(models.Model):
+    small_pos = EnumField(
+        SmallPositiveFlagEnum, bit_string=True, null=True, default=None, blank=True
+    )
+    pos = EnumField(PositiveFlagEnum, bit_string=True, blank=True)
+    extra_big_pos = EnumField(
+        ExtraBigPositiveFlagEnum, bit_string=True, db_index=True, blank=True
+    )
+
+
+class FlagIndexTester(models.Model):
+    btree = EnumField(PositiveFlagEnum, index_strategy="btree", blank=True)
+    bits = EnumField(
+        SmallPositiveFlagEnum,
+        index_strategy="bits",
+        null=True,
+        default=None,
+        blank=True,
+    )
+
+
+class CodeConstraintTester(models.Model):
+    code = EnumField(CodeEnum, null=True, default=None, blank=True)
+
+
+class OrdinalTester(models.Model):
+    text = EnumField(TextEnum, ordinal=True, default=TextEnum.VALUE1, blank=True)
+    dj_text = EnumField(DJTextEnum, ordinal=True, null=True, default=None, blank=True)
+    constant = EnumField(
+        NullableConstants, ordinal=True, null=True, default=None, blank=True
+    )
+    decimal = EnumField(DecimalEnum, ordinal=True, null=True, default=None, blank=True)
+    date = EnumField(DateEnum, ordinal=True, null=True, default=None, blank=True)
+    code = EnumField(CodeEnum, ordinal=True, null=True, default=None, blank=True)
+
+
+class DBEnumTypeTester(models.Model):
+    text = EnumField(TextEnum, db_enum_type=True, default=TextEnum.VALUE1, blank=True)
+    dj_text = EnumField(
+        DJTextEnum,
+        db_enum_type="djenum_dj_text",
+        null=True,
+        default=None,
+        blank=True,
+    )
+    flags = EnumField(SmallPositiveFlagEnum, db_enum_type=True, null=True, blank=True)
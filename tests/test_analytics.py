@@ -0,0 +1,141 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from django.test import TestCase
+
+from django_enum.analytics import (
+    bit_frequency,
+    flag_array,
+    has_all,
+    has_any,
+    popcount,
+)
+from tests.djenum.models import EnumFlagTester
+from tests.test_flags import combine_flags
+
+
+class TestFlagAnalytics(TestCase):
+    MODEL_CLASS = EnumFlagTester
+    FIELDS = ["small_pos", "pos", "big_pos"]
+
+    def setUp(self):
+        for field_name in self.FIELDS:
+            enum = self.MODEL_CLASS._meta.get_field(field_name).enum
+            members = list(enum)
+            for idx in range(len(members) + 1):
+                self.MODEL_CLASS.objects.create(
+                    **{field_name: combine_flags(*members[:idx]) or enum(0)}
+                )
+                self.MODEL_CLASS.objects.create(
+                    **{field_name: combine_flags(*members[idx::2]) or enum(0)}
+                )
+        # a row with a null small_pos
+        self.MODEL_CLASS.objects.create()
+
+    def queries(self, enum):
+        members = list(enum)
+        return [
+            enum(0),
+            members[0],
+            members[-1],
+            members[0] | members[-1],
+            combine_flags(*members[1:3]),
+            combine_flags(*members),
+        ]
+
+    def test_matches_lookups(self):
+        qry = self.MODEL_CLASS.objects.order_by("pk")
+        pks = np.array(list(qry.values_list("pk", flat=True)))
+        for field_name in self.FIELDS:
+            enum = self.MODEL_CLASS._meta.get_field(field_name).enum
+            array = flag_array(qry, field_name)
+            self.assertEqual(len(array), len(pks))
+            for flags in self.queries(enum):
+                for func, lookup in [(has_any, "has_any"), (has_all, "has_all")]:
+                    expected = set(
+                        qry.filter(**{f"{field_name}__{lookup}": flags}).values_list(
+                            "pk", flat=True
+                        )
+                    )
+                    self.assertEqual(
+                        set(pks[func(array, flags)].tolist()),
+                        expected,
+                        f"{field_name}__{lookup}={flags!r}",
+                    )
+
+    def test_nulls_masked(self):
+        array = flag_array(self.MODEL_CLASS.objects.order_by("pk"), "small_pos")
+        nulls = self.MODEL_CLASS.objects.filter(small_pos__isnull=True).count()
+        self.assertGreater(nulls, 0)
+        self.assertEqual(int(np.ma.count_masked(array)), nulls)
+        self.assertFalse(has_all(array, 0)[array.mask].any())
+        self.assertFalse(has_any(array, 0).any())
+        self.assertEqual(int(popcount(array).count()), len(array) - nulls)
+
+    def test_popcount(self):
+        qry = self.MODEL_CLASS.objects.order_by("pk")
+        for field_name in self.FIELDS:
+            expected = [
+                None if value is None else value.value.bit_count()
+                for value in qry.values_list(field_name, flat=True)
+            ]
+            self.assertEqual(popcount(flag_array(qry, field_name)).tolist(), expected)
+
+    def test_bit_frequency(self):
+        qry = self.MODEL_CLASS.objects.all()
+        for field_name in self.FIELDS:
+            enum = self.MODEL_CLASS._meta.get_field(field_name).enum
+            array = flag_array(qry, field_name)
+            by_member = bit_frequency(array, enum)
+            self.assertEqual(set(by_member), set(enum))
+            by_bit = bit_frequency(array)
+            self.assertEqual(len(by_bit), 64)
+            for member, count in by_member.items():
+                self.assertEqual(
+                    count,
+                    qry.filter(**{f"{field_name}__has_all": member}).count(),
+                )
+                bit = member.value.bit_length() - 1
+                self.assertEqual(by_bit[bit], count)
+            self.assertEqual(int(by_bit.sum()), int(popcount(array).sum()))
+
+    def test_plain_arrays(self):
+        array = np.array([0, 1, 3, 6], dtype=np.uint64)
+        self.assertEqual(has_any(array, 2).tolist(), [False, False, True, True])
+        self.assertEqual(has_all(array, 3).tolist(), [False, False, True, False])
+        self.assertEqual(popcount(array).tolist(), [0, 1, 2, 2])
+        self.assertEqual(bit_frequency(array, 3).tolist(), [2, 2, 1])
+
+    def test_set_columns(self):
+        from django.db import connection
+
+        from django_enum.analytics import _masked_array
+        from tests.djenum.enums import SmallPositiveFlagEnum
+        from tests.djenum.models import DBEnumTypeTester
+
+        ONE, _, THREE, *_ = SmallPositiveFlagEnum
+        DBEnumTypeTester.objects.create(flags=ONE | THREE)
+        DBEnumTypeTester.objects.create(flags=None)
+        self.assertEqual(
+            flag_array(DBEnumTypeTester.objects.order_by("pk"), "flags").tolist(),
+            [(ONE | THREE).value, None],
+        )
+        # MySQL fetches set columns as their members
+        field = DBEnumTypeTester._meta.get_field("flags")
+        array = _masked_array(
+            field, ["1024,4096", None, "", {"1024", "4096"}, 2048], connection
+        )
+        self.assertEqual(
+            array.tolist(), [(ONE | THREE).value, None, 0, (ONE | THREE).value, 2048]
+        )
+
+    def test_unsupported_fields(self):
+        with self.assertRaises(TypeError):
+            flag_array(self.MODEL_CLASS.objects.all(), "extra_big_pos")
+        with self.assertRaises(TypeError):
+            flag_array(self.MODEL_CLASS.objects.all(), "big_neg")
+        from tests.djenum.models import EnumTester
+
+        with self.assertRaises(TypeError):
+            flag_array(EnumTester.objects.all(), "small_pos_int")
@@ -1,3 +1,4 @@
+from django.core.exceptions import ValidationError
 from django.test import TestCase
 from tests.utils import EnumTypeMixin, IGNORE_ORA_01843
 from tests.djenum.models import EnumTester
@@ -115,3 +116,97 @@ def test_bulk_update(self):
                 # continue
                 pytest.skip("Oracle bug ORA-01843 encountered - skipping")
             raise
+
+    def test_coerce_many(self):
+        for name, value in self.create_params.items():
+            field = self.MODEL_CLASS._meta.get_field(name)
+            values = [value, None, value, getattr(value, "value", value)]
+            try:
+                expected = [field.to_python(val) for val in values]
+            except ValidationError:
+                with self.assertRaises(ValidationError):
+                    field.coerce_many(values)
+                continue
+            coerced = field.coerce_many(values)
+            self.assertEqual(coerced, expected)
+            self.assertIs(coerced[0], coerced[2])
+
+    def test_coerce_many_dedupes(self):
+        from unittest import mock
+
+        field = self.MODEL_CLASS._meta.get_field("small_pos_int")
+        values = [
+            self.SmallPosIntEnum.VAL2.value,
+            self.SmallPosIntEnum.VAL2,
+            "VAL2",
+            self.SmallPosIntEnum.VAL3.value,
+        ] * 25
+        with mock.patch.object(field, "to_python", wraps=field.to_python) as convert:
+            field.coerce_many(values)
+        self.assertEqual(convert.call_count, 4)
+
+        with mock.patch.object(
+            field, "get_prep_value", wraps=field.get_prep_value
+        ) as prep:
+            field.prep_many(values)
+        self.assertEqual(prep.call_count, 4)
+
+    def test_coerce_many_invalid(self):
+        field = self.MODEL_CLASS._meta.get_field("small_pos_int")
+        with self.assertRaises(ValidationError):
+            field.coerce_many([self.SmallPosIntEnum.VAL2, "not a value"])
+        with self.assertRaises(ValueError):
+            field.prep_many([self.SmallPosIntEnum.VAL2, "not a value"])
+
+    def test_prep_many(self):
+        for name, value in self.create_params.items():
+            field = self.MODEL_CLASS._meta.get_field(name)
+            values = [value, None, value]
+            try:
+                expected = [field.get_prep_value(val) for val in values]
+            except (ValueError, TypeError):
+                with self.assertRaises((ValueError, TypeError)):
+                    field.prep_many(values)
+                continue
+            self.assertEqual(field.prep_many(values), expected)
+
+    def test_in_lookup_prep_many(self):
+        from unittest import mock
+
+        field = self.MODEL_CLASS._meta.get_field("text")
+        self.MODEL_CLASS.objects.bulk_create(
+            [self.MODEL_CLASS(**self.create_params) for _ in range(3)]
+        )
+        values = [self.TextEnum.VALUE2, "V1", self.TextEnum.VALUE2, "V22"]
+        with mock.patch.object(
+            type(field), "prep_many", autospec=True, side_effect=type(field).prep_many
+        ) as prep_many:
+            qry = self.MODEL_CLASS.objects.filter(text__in=values)
+            self.assertEqual(qry.count(), 3)
+        prep_many.assert_called_once_with(field, values)
+        self.assertEqual(
+            self.MODEL_CLASS.objects.filter(
+                text__in=(value for value in ["V333", "V22"])
+            ).count(),
+            3,
+        )
+        with self.assertRaises(ValueError):
+            self.MODEL_CLASS.objects.filter(text__in=["V22", "not a value"])
+
+    def test_bulk_create_coerce_many(self):
+        columns = {}
+        for name, value in self.create_params.items():
+            field = self.MODEL_CLASS._meta.get_field(name)
+            try:
+                columns[name] = field.coerce_many([value] * self.NUMBER)
+            except ValidationError:
+                columns[name] = [value] * self.NUMBER
+        objects = [
+            self.MODEL_CLASS(**dict(zip(columns.keys(), row)))
+            for row in zip(*columns.values())
+        ]
+        self.MODEL_CLASS.objects.bulk_create(objects)
+        self.assertEqual(
+            self.MODEL_CLASS.objects.filter(**self.create_params).count(),
+            self.NUMBER,
+        )
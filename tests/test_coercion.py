@@ -0,0 +1,244 @@
+from copy import copy
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from tests.djenum.models import EnumFlagTester, EnumTester
+from tests.utils import EnumTypeMixin
+
+
+class TestCoercionTable(EnumTypeMixin, TestCase):
+    MODEL_CLASS = EnumTester
+
+    def candidates(self, member):
+        return [
+            member,
+            member.value,
+            member.name,
+            str(member.value),
+            getattr(member, "label", member.name),
+        ]
+
+    def no_table(self, field):
+        """Return a copy of the field that must resolve values the slow way."""
+        slow = copy(field)
+        slow._coercion_table_ = {}
+        return slow
+
+    def test_table_matches_coercion(self):
+        for field_name in self.fields:
+            field = self.MODEL_CLASS._meta.get_field(field_name)
+            slow = self.no_table(field)
+            for member in field.enum:
+                for value in self.candidates(member):
+                    try:
+                        expected = slow._try_coerce(value, force=True)
+                    except (ValueError, TypeError):
+                        with self.assertRaises((ValueError, TypeError)):
+                            field._try_coerce(value, force=True)
+                        continue
+                    coerced = field._try_coerce(value, force=True)
+                    self.assertEqual(coerced, expected)
+                    self.assertIs(type(coerced), type(expected))
+
+    def test_table_contents(self):
+        for field_name in self.fields:
+            field = self.MODEL_CLASS._meta.get_field(field_name)
+            for member in field.enum:
+                self.assertIs(field._coercion_table_[member.value], member)
+                self.assertIs(field._coercion_table_[member.name], member)
+
+    def test_unhashable_values(self):
+        field = self.MODEL_CLASS._meta.get_field("small_pos_int")
+        with self.assertRaises((ValueError, TypeError)):
+            field._try_coerce([1, 2], force=True)
+
+    def test_values_prioritized_over_names(self):
+        from enum import Enum
+
+        from django_enum import EnumField
+
+        class Tricky(Enum):
+            A = "B"
+            B = "C"
+
+        field = EnumField(Tricky)
+        self.assertIs(field._try_coerce("B"), Tricky.A)
+        self.assertIs(field._try_coerce("A"), Tricky.A)
+        self.assertIs(field._try_coerce("C"), Tricky.B)
+
+    def test_no_table_without_enum(self):
+        field = EnumTester._meta.get_field("small_pos_int")
+        name, path, args, kwargs = field.deconstruct()
+        reconstructed = type(field)(*args, **kwargs)
+        self.assertEqual(reconstructed._coercion_table_, {})
+
+
+class TestFallbackCache(TestCase):
+    def test_non_strict_values_cached(self):
+        from unittest import mock
+
+        field = EnumTester._meta.get_field("non_strict_int")
+        field._fallback_cache_.clear()
+        with mock.patch.object(
+            field, "_coerce_to_enum", wraps=field._coerce_to_enum
+        ) as slow:
+            for _ in range(3):
+                self.assertEqual(field.to_python(15), 15)
+                self.assertEqual(field.to_python("15"), 15)
+        self.assertEqual(slow.call_count, 2)
+        info = field.fallback_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (4, 2, 2))
+
+    def test_cache_bounded(self):
+        from tests.djenum.enums import SmallPosIntEnum
+
+        from django_enum import EnumField
+
+        field = EnumField(SmallPosIntEnum, strict=False, fallback_cache_size=4)
+        for value in range(100, 110):
+            self.assertEqual(field.to_python(value), value)
+        self.assertEqual(field.fallback_cache_info().currsize, 4)
+        self.assertIs(field.to_python(2), SmallPosIntEnum.VAL2)
+        self.assertEqual(field.fallback_cache_info().currsize, 4)
+
+    def test_invalid_values_not_cached(self):
+        field = EnumTester._meta.get_field("non_strict_int")
+        field._fallback_cache_.clear()
+        with self.assertRaises(ValidationError):
+            field.to_python("not an int")
+        self.assertEqual(field.fallback_cache_info().currsize, 0)
+
+    def test_no_cache(self):
+        from tests.djenum.enums import SmallPosIntEnum
+
+        from django_enum import EnumField
+
+        self.assertIsNone(
+            EnumTester._meta.get_field("small_pos_int").fallback_cache_info()
+        )
+        field = EnumField(SmallPosIntEnum, strict=False, fallback_cache_size=0)
+        self.assertIsNone(field.fallback_cache_info())
+        self.assertEqual(field.to_python(15), 15)
+
+
+class TestFlagCoercionTable(TestCase):
+    def test_empty_flag(self):
+        for field in EnumFlagTester._meta.fields:
+            enum = getattr(field, "enum", None)
+            if enum is None:
+                continue
+            self.assertIs(field._try_coerce(0), enum(0))
+
+
+class TestFromDbCoercion(EnumTypeMixin, TestCase):
+    MODEL_CLASS = EnumTester
+
+    def test_values_coerced_once_per_row(self):
+        from unittest import mock
+
+        for _ in range(3):
+            self.MODEL_CLASS.objects.create(small_pos_int=self.SmallPosIntEnum.VAL2)
+
+        for field_name in ["small_pos_int", "text", "no_coerce", "date_enum"]:
+            field = self.MODEL_CLASS._meta.get_field(field_name)
+            with mock.patch.object(
+                field, "_try_coerce", wraps=field._try_coerce
+            ) as try_coerce:
+                objs = list(self.MODEL_CLASS.objects.all())
+            self.assertEqual(try_coerce.call_count, len(objs))
+
+    def test_is_coerced(self):
+        field = self.MODEL_CLASS._meta.get_field("small_pos_int")
+        self.assertTrue(field._is_coerced(self.SmallPosIntEnum.VAL2))
+        self.assertTrue(field._is_coerced(None))
+        self.assertFalse(field._is_coerced(self.SmallPosIntEnum.VAL2.value))
+        self.assertFalse(field._is_coerced("VAL2"))
+
+        no_coerce = self.MODEL_CLASS._meta.get_field("no_coerce")
+        self.assertTrue(no_coerce._is_coerced(self.SmallPosIntEnum.VAL2.value))
+        self.assertFalse(no_coerce._is_coerced(str(self.SmallPosIntEnum.VAL2.value)))
+        self.assertTrue(no_coerce._is_coerced(None))
+
+
+class TestLazyCoercion(TestCase):
+    def setUp(self):
+        from tests.djenum.enums import DateEnum, PositiveFlagEnum, SmallPosIntEnum
+        from tests.djenum.models import LazyCoerceTester
+
+        self.LazyCoerceTester = LazyCoerceTester
+        self.SmallPosIntEnum = SmallPosIntEnum
+        self.DateEnum = DateEnum
+        self.PositiveFlagEnum = PositiveFlagEnum
+
+        LazyCoerceTester.objects.create(
+            small_pos_int=SmallPosIntEnum.VAL2,
+            text="V22",
+            date_enum=DateEnum.HUGO,
+            non_strict_int=15,
+            flag=PositiveFlagEnum.ONE | PositiveFlagEnum.THREE,
+        )
+
+    def test_lazy_field_properties(self):
+        field = self.LazyCoerceTester._meta.get_field("small_pos_int")
+        self.assertTrue(field.lazy)
+        self.assertTrue(field.coerce)
+        self.assertFalse(EnumTester._meta.get_field("small_pos_int").lazy)
+        self.assertFalse(EnumTester._meta.get_field("no_coerce").lazy)
+        self.assertNotIn("coerce", field.deconstruct()[3])
+
+    def test_raw_values_stored_until_accessed(self):
+        obj = self.LazyCoerceTester.objects.get()
+        self.assertIs(type(obj.__dict__["small_pos_int"]), int)
+        self.assertEqual(obj.__dict__["text"], "V22")
+        self.assertIs(type(obj.__dict__["text"]), str)
+
+        self.assertIs(obj.small_pos_int, self.SmallPosIntEnum.VAL2)
+        self.assertIs(obj.__dict__["small_pos_int"], self.SmallPosIntEnum.VAL2)
+        self.assertEqual(obj.text, "V22")
+        self.assertIsInstance(obj.text, obj._meta.get_field("text").enum)
+        self.assertIs(obj.date_enum, self.DateEnum.HUGO)
+        self.assertEqual(obj.non_strict_int, 15)
+        self.assertEqual(
+            obj.flag, self.PositiveFlagEnum.ONE | self.PositiveFlagEnum.THREE
+        )
+        self.assertIsInstance(obj.flag, self.PositiveFlagEnum)
+
+    def test_only_accessed_fields_coerced(self):
+        from unittest import mock
+
+        from django_enum.fields import EnumField
+
+        with mock.patch.object(
+            EnumField,
+            "_try_coerce",
+            autospec=True,
+            side_effect=EnumField._try_coerce,
+        ) as try_coerce:
+            obj = self.LazyCoerceTester.objects.get()
+            self.assertEqual(try_coerce.call_count, 0)
+            obj.small_pos_int
+            obj.small_pos_int
+            self.assertEqual(try_coerce.call_count, 1)
+
+    def test_lazy_assignment(self):
+        obj = self.LazyCoerceTester.objects.get()
+        obj.small_pos_int = "VAL3"
+        self.assertEqual(obj.__dict__["small_pos_int"], "VAL3")
+        self.assertIs(obj.small_pos_int, self.SmallPosIntEnum.VAL3)
+        obj.save()
+        obj.refresh_from_db()
+        self.assertIs(obj.small_pos_int, self.SmallPosIntEnum.VAL3)
+
+        obj.small_pos_int = None
+        obj.save()
+        self.assertEqual(
+            self.LazyCoerceTester.objects.filter(small_pos_int__isnull=True).count(), 1
+        )
+
+    def test_lazy_invalid_values(self):
+        obj = self.LazyCoerceTester.objects.get()
+        obj.small_pos_int = "not a value"
+        self.assertEqual(obj.small_pos_int, "not a value")
+        with self.assertRaises(ValidationError):
+            obj.full_clean()
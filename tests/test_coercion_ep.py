@@ -0,0 +1,24 @@
+import pytest
+
+pytest.importorskip("enum_properties")
+
+from tests.enum_prop.models import EnumTester
+from tests.test_coercion import TestCoercionTable
+
+
+class TestCoercionTableProps(TestCoercionTable):
+    MODEL_CLASS = EnumTester
+
+    def candidates(self, member):
+        return [
+            *super().candidates(member),
+            *getattr(member, "aliases", []),
+        ]
+
+    def test_symmetric_aliases(self):
+        field = self.MODEL_CLASS._meta.get_field("text")
+        self.assertIs(field._coercion_table_["v one"], self.TextEnum.VALUE1)
+        self.assertIs(field._coercion_table_["Value2"], self.TextEnum.VALUE2)
+
+
+TestCoercionTable = None
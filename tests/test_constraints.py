@@ -523,3 +523,276 @@ def test_flag_constraints(self):
                     ("0", StrictFlagEnum(0)),
                 ),
             )
+
+
+class CompactConstraintTests(TestCase):
+    def test_value_ranges(self):
+        from django_enum.fields import _value_ranges
+
+        self.assertEqual(
+            _value_ranges([5, 1, 2, 3, 9, 10, 12, 13, 14, 15, -1]),
+            ([(1, 3), (12, 15)], (-1, 5, 9, 10)),
+        )
+        self.assertEqual(_value_ranges([]), ([], ()))
+        self.assertEqual(_value_ranges([1, 3]), ([], (1, 3)))
+        self.assertEqual(_value_ranges([None, 4, 1, 2, 3]), ([(1, 4)], (None,)))
+
+    def test_nullable_choices(self):
+        from django.db import models
+        from django.db.models import Q
+
+        Codes = models.IntegerChoices(
+            "Codes",
+            {**{f"C{code}": code for code in range(40)}, "__empty__": "None"},
+        )
+        field = EnumField(Codes, null=True, blank=True)
+        self.assertEqual(
+            field.constraint_condition("code"),
+            Q(code__range=(0, 39)) | Q(code__in=[None]),
+        )
+
+    def test_small_enums_unchanged(self):
+        constraint = next(
+            constraint
+            for constraint in EnumTester._meta.constraints
+            if constraint.name.endswith("small_pos_int_SmallPosIntEnum")
+        )
+        self.assertNotIn(
+            "__range", str(getattr(constraint, "condition", None) or constraint.check)
+        )
+
+    def test_code_constraint(self):
+        from django.db.models import Q
+        from django.db.utils import IntegrityError
+
+        from tests.djenum.enums import CodeEnum
+        from tests.djenum.models import CodeConstraintTester
+
+        (constraint,) = CodeConstraintTester._meta.constraints
+        self.assertEqual(
+            getattr(constraint, "condition", None) or constraint.check,
+            Q(code__range=(100, 199))
+            | Q(code__range=(300, 302))
+            | Q(code__in=[7, 11, 13, 400, 401, 1000])
+            | Q(code__isnull=True),
+        )
+
+        table = CodeConstraintTester._meta.db_table
+        column = CodeConstraintTester._meta.get_field("code").column
+        values = {member.value for member in CodeEnum}
+        for value in range(0, 1002):
+            with connection.cursor() as cursor:
+                if value in values:
+                    with transaction.atomic():
+                        cursor.execute(
+                            f"INSERT INTO {table} ({column}) VALUES ({value})"
+                        )
+                else:
+                    with self.assertRaises(IntegrityError), transaction.atomic():
+                        cursor.execute(
+                            f"INSERT INTO {table} ({column}) VALUES ({value})"
+                        )
+        self.assertEqual(
+            set(CodeConstraintTester.objects.values_list("code", flat=True)),
+            set(CodeEnum),
+        )
+
+
+class NotValidConstraintTests(TestCase):
+    def setUp(self):
+        from django.apps import apps
+        from django.db.migrations.state import ProjectState
+
+        from tests.djenum.models import CodeConstraintTester
+
+        self.state = ProjectState.from_apps(apps)
+        self.constraint = CodeConstraintTester._meta.constraints[0]
+        self.table = connection.ops.quote_name(CodeConstraintTester._meta.db_table)
+        self.name = connection.ops.quote_name(self.constraint.name)
+
+    def vendor(self, name):
+        from unittest import mock
+
+        from django.db import connections
+
+        return mock.patch.object(type(connections["default"]), "vendor", name)
+
+    def collect(self, operation):
+        editor = connection.schema_editor(collect_sql=True)
+        operation.database_forwards("tests_djenum", editor, self.state, self.state)
+        return editor.collected_sql
+
+    def test_add_not_valid(self):
+        from django_enum.operations import AddConstraintNotValid
+
+        from unittest import mock
+
+        operation = AddConstraintNotValid("codeconstrainttester", self.constraint)
+        with self.vendor("postgresql"):
+            (sql,) = self.collect(operation)
+        self.assertTrue(
+            sql.startswith(
+                f"ALTER TABLE {self.table} ADD CONSTRAINT {self.name} CHECK ("
+            )
+        )
+        self.assertTrue(sql.endswith(") NOT VALID;"))
+
+        # oracle compiles conditions differently, only the suffix is checked
+        with (
+            self.vendor("oracle"),
+            mock.patch.object(self.constraint, "create_sql", return_value="ADD CHECK"),
+        ):
+            self.assertEqual(self.collect(operation), ["ADD CHECK ENABLE NOVALIDATE;"])
+
+        editor = connection.schema_editor(collect_sql=True)
+        with mock.patch.object(editor, "add_constraint") as add_constraint:
+            operation.database_forwards("tests_djenum", editor, self.state, self.state)
+        add_constraint.assert_called_once()
+        self.assertIs(add_constraint.call_args.args[1], self.constraint)
+
+        self.assertEqual(
+            operation.describe(),
+            f"Create not valid constraint {self.constraint.name} on model "
+            f"codeconstrainttester",
+        )
+        self.assertEqual(
+            operation.deconstruct(),
+            (
+                "AddConstraintNotValid",
+                [],
+                {"model_name": "codeconstrainttester", "constraint": self.constraint},
+            ),
+        )
+        with self.assertRaises(TypeError):
+            from django.db.models import UniqueConstraint
+
+            AddConstraintNotValid(
+                "codeconstrainttester", UniqueConstraint("code", name="unique_code")
+            )
+
+    def test_validate(self):
+        from django_enum.operations import ValidateConstraint
+
+        operation = ValidateConstraint("codeconstrainttester", self.constraint.name)
+        with self.vendor("postgresql"):
+            self.assertEqual(
+                self.collect(operation),
+                [f"ALTER TABLE {self.table} VALIDATE CONSTRAINT {self.name};"],
+            )
+        with self.vendor("oracle"):
+            self.assertEqual(
+                self.collect(operation),
+                [f"ALTER TABLE {self.table} MODIFY CONSTRAINT {self.name} VALIDATE;"],
+            )
+        self.assertEqual(self.collect(operation), [])
+        self.assertEqual(
+            operation.describe(),
+            f"Validate constraint {self.constraint.name} on model codeconstrainttester",
+        )
+        self.assertEqual(
+            operation.deconstruct(),
+            ("ValidateConstraint", ("codeconstrainttester", self.constraint.name), {}),
+        )
+
+
+class RemapEnumValuesTests(TestCase):
+    def setUp(self):
+        from django.apps import apps
+        from django.db.migrations.state import ProjectState
+
+        from tests.djenum.models import CodeConstraintTester
+
+        self.state = ProjectState.from_apps(apps)
+        self.objects = CodeConstraintTester.objects.bulk_create(
+            CodeConstraintTester(code=code) for code in [7, 11, 7, 300, 11, 7, 1000]
+        )
+
+    def codes(self):
+        from tests.djenum.models import CodeConstraintTester
+
+        return [
+            code.value if code is not None else None
+            for code in CodeConstraintTester.objects.order_by("pk").values_list(
+                "code", flat=True
+            )
+        ]
+
+    def run_operation(self, operation, backwards=False):
+        from unittest import mock
+
+        # constraint changes are only collected, the rows are rewritten
+        editor = connection.schema_editor(collect_sql=True)
+        editor.deferred_sql = []
+        with (
+            mock.patch.object(editor, "remove_constraint") as remove,
+            mock.patch.object(editor, "add_constraint") as add,
+        ):
+            if backwards:
+                operation.database_backwards(
+                    "tests_djenum", editor, self.state, self.state
+                )
+            else:
+                operation.database_forwards(
+                    "tests_djenum", editor, self.state, self.state
+                )
+        return remove, add
+
+    def test_remap(self):
+        from django_enum.operations import RemapEnumValues
+
+        operation = RemapEnumValues(
+            "codeconstrainttester", "code", {"7": 11, 11: "7"}, batch_size=2
+        )
+        with self.assertLogs("django_enum.operations", "INFO") as logs:
+            remove, add = self.run_operation(operation)
+        self.assertEqual(self.codes(), [11, 7, 11, 300, 7, 11, 1000])
+        self.assertEqual(len(logs.records), 3)
+        self.assertIn(f"primary key {self.objects[5].pk}", logs.output[-1])
+
+        # check constraints are left to the surrounding operations
+        remove.assert_not_called()
+        add.assert_not_called()
+
+        self.assertTrue(operation.reversible)
+        self.run_operation(operation, backwards=True)
+        self.assertEqual(self.codes(), [7, 11, 7, 300, 11, 7, 1000])
+
+    def test_resume(self):
+        from django_enum.operations import RemapEnumValues
+        from tests.djenum.models import CodeConstraintTester
+
+        operation = RemapEnumValues(
+            "codeconstrainttester",
+            "code",
+            {7: 13, 1000: 401},
+            start=self.objects[2].pk,
+        )
+        self.run_operation(operation)
+        self.assertEqual(self.codes(), [7, 11, 7, 300, 11, 13, 401])
+
+        # start only applies forwards
+        CodeConstraintTester.objects.filter(pk=self.objects[0].pk).update(code=13)
+        self.run_operation(operation, backwards=True)
+        self.assertEqual(self.codes(), [7, 11, 7, 300, 11, 7, 1000])
+        self.assertEqual(
+            operation.deconstruct(),
+            (
+                "RemapEnumValues",
+                ("codeconstrainttester", "code", {7: 13, 1000: 401}),
+                {"start": self.objects[2].pk},
+            ),
+        )
+
+    def test_irreversible(self):
+        from django_enum.operations import RemapEnumValues
+
+        operation = RemapEnumValues("codeconstrainttester", "code", {7: 13, 11: 13})
+        self.assertFalse(operation.reversible)
+        self.assertEqual(
+            operation.describe(), "Remap values of codeconstrainttester.code"
+        )
+        self.assertEqual(
+            operation.migration_name_fragment, "remap_codeconstrainttester_code"
+        )
+        with self.assertRaises(ValueError):
+            RemapEnumValues("codeconstrainttester", "code", {7: 13}, batch_size=0)
@@ -0,0 +1,265 @@
+from unittest import mock
+
+from django.apps import apps
+from django.db import connection, connections, models
+from django.db.models import TextChoices
+from django.db.migrations.state import ProjectState
+from django.test import TestCase
+from django.test.utils import isolate_apps
+from django.utils.module_loading import import_string
+
+from django_enum import EnumField
+from django_enum.fields import EnumCharField, EnumTypeCharField, SetFlagField
+from django_enum.operations import AddEnumValues, CreateEnumType
+from tests.djenum.enums import (
+    DJTextEnum,
+    ExtraBigPositiveFlagEnum,
+    SmallNegativeFlagEnum,
+    SmallPosIntEnum,
+    SmallPositiveFlagEnum,
+    TextEnum,
+)
+from tests.djenum.models import DBEnumTypeTester
+
+
+def vendor(name):
+    return mock.patch.object(type(connections["default"]), "vendor", name)
+
+
+def reconstruct(field):
+    _, path, args, kwargs = field.deconstruct()
+    return import_string(path)(*args, **kwargs)
+
+
+class TestDBEnumTypeFields(TestCase):
+    MODEL_CLASS = DBEnumTypeTester
+
+    def test_field_types(self):
+        self.assertIsInstance(
+            self.MODEL_CLASS._meta.get_field("text"), EnumTypeCharField
+        )
+        self.assertEqual(
+            self.MODEL_CLASS._meta.get_field("text").db_enum_type,
+            "tests_djenum_textenum",
+        )
+        self.assertEqual(
+            self.MODEL_CLASS._meta.get_field("dj_text").db_enum_type, "djenum_dj_text"
+        )
+        self.assertIsInstance(self.MODEL_CLASS._meta.get_field("flags"), SetFlagField)
+
+    def test_no_check_constraints(self):
+        self.assertEqual(self.MODEL_CLASS._meta.constraints, [])
+        field = EnumField(TextEnum, db_enum_type=True, constrained=True)
+        self.assertTrue(field.constrained)
+
+    def test_native_column_types(self):
+        text = self.MODEL_CLASS._meta.get_field("text")
+        dj_text = self.MODEL_CLASS._meta.get_field("dj_text")
+        flags = self.MODEL_CLASS._meta.get_field("flags")
+        with vendor("postgresql"):
+            self.assertEqual(text.db_type(connection), '"tests_djenum_textenum"')
+            self.assertEqual(dj_text.db_type(connection), '"djenum_dj_text"')
+        with vendor("mysql"):
+            self.assertEqual(text.db_type(connection), "enum('V1', 'V22', 'V333', 'D')")
+            self.assertEqual(
+                flags.db_type(connection),
+                "set({})".format(", ".join(f"'{1 << bit}'" for bit in range(15))),
+            )
+        self.assertEqual(
+            text.db_type(connection), EnumCharField.db_type(text, connection)
+        )
+
+    def test_quoted_members(self):
+        field = EnumTypeCharField(
+            choices=[("it's", "It's"), ("back\\slash", "Backslash")],
+            db_enum_type="quoted",
+        )
+        with vendor("mysql"):
+            self.assertEqual(
+                field.db_type(connection), "enum('it''s', 'back\\\\slash')"
+            )
+
+    def test_reconstructed_fields(self):
+        for field_name in ["text", "dj_text", "flags"]:
+            field = self.MODEL_CLASS._meta.get_field(field_name)
+            reconstructed = reconstruct(field)
+            self.assertIsNone(reconstructed.enum)
+            for name in ["postgresql", "mysql", "sqlite"]:
+                with vendor(name):
+                    self.assertEqual(
+                        reconstructed.db_type(connection), field.db_type(connection)
+                    )
+
+    def test_choices_do_not_alter_column(self):
+        field = self.MODEL_CLASS._meta.get_field("text")
+        _, _, args, kwargs = field.deconstruct()
+        editor = connection.schema_editor()
+        for choices in [
+            [(value, label.upper()) for value, label in kwargs["choices"]],
+            [*kwargs["choices"], ("V4", "Value4")],
+        ]:
+            new_field = EnumTypeCharField(*args, **{**kwargs, "choices": choices})
+            new_field.set_attributes_from_name("text")
+            self.assertFalse(editor._field_should_be_altered(field, new_field))
+
+    def test_round_trip(self):
+        obj = self.MODEL_CLASS.objects.create(
+            dj_text=DJTextEnum.B,
+            flags=SmallPositiveFlagEnum.ONE | SmallPositiveFlagEnum.FOUR,
+        )
+        obj.refresh_from_db()
+        self.assertIs(obj.text, TextEnum.VALUE1)
+        self.assertIs(obj.dj_text, DJTextEnum.B)
+        self.assertEqual(
+            obj.flags, SmallPositiveFlagEnum.ONE | SmallPositiveFlagEnum.FOUR
+        )
+        self.assertEqual(
+            self.MODEL_CLASS.objects.filter(
+                dj_text="B", flags__has_any=SmallPositiveFlagEnum.FOUR
+            ).count(),
+            1,
+        )
+
+    def test_set_values(self):
+        field = self.MODEL_CLASS._meta.get_field("flags")
+        expected = SmallPositiveFlagEnum.ONE | SmallPositiveFlagEnum.THREE
+        for value in ["1024,4096", {"1024", "4096"}, expected.value]:
+            self.assertEqual(field.from_db_value(value, None, connection), expected)
+        self.assertEqual(
+            field.from_db_value("", None, connection), SmallPositiveFlagEnum(0)
+        )
+        self.assertIsNone(field.from_db_value(None, None, connection))
+        with vendor("mysql"):
+            self.assertEqual(
+                field.get_db_prep_value(expected, connection), expected.value
+            )
+
+    def test_unsupported_enums(self):
+        for enum, kwargs in [
+            (SmallPosIntEnum, {}),
+            (SmallNegativeFlagEnum, {}),
+            (ExtraBigPositiveFlagEnum, {}),
+            (SmallPositiveFlagEnum, {"bit_string": True}),
+        ]:
+            with self.assertRaises(ValueError):
+                EnumField(enum, db_enum_type=True, **kwargs)
+        with self.assertRaises(ValueError):
+            EnumTypeCharField(choices=[("A", "A")])
+
+    def test_type_name_collisions(self):
+        class Status(TextChoices):
+            OPEN = "O"
+            CLOSED = "C"
+
+        class OtherStatus(TextChoices):
+            DRAFT = "D"
+
+        OtherStatus.__name__ = "Status"
+
+        with isolate_apps("tests.djenum", "tests.flag_constraints"):
+
+            class Order(models.Model):
+                status = EnumField(Status, db_enum_type=True)
+                shared = EnumField(Status, db_enum_type="status")
+
+                class Meta:
+                    app_label = "tests_djenum"
+
+            class Invoice(models.Model):
+                status = EnumField(OtherStatus, db_enum_type=True)
+                shared = EnumField(Status, db_enum_type="status")
+                other = EnumField(OtherStatus, db_enum_type="status")
+
+                class Meta:
+                    app_label = "tests_flag_constraints"
+
+        # default type names are qualified by the app label
+        self.assertEqual(
+            Order._meta.get_field("status").db_enum_type, "tests_djenum_status"
+        )
+        self.assertEqual(
+            Invoice._meta.get_field("status").db_enum_type,
+            "tests_flag_constraints_status",
+        )
+        self.assertEqual(Order._meta.get_field("status").check(), [])
+        for field in [
+            Order._meta.get_field("status"),
+            Invoice._meta.get_field("status"),
+        ]:
+            with vendor("postgresql"):
+                self.assertEqual(field.check(databases=["default"]), [])
+
+        # different members can not share a type name
+        shared = Order._meta.get_field("shared")
+        self.assertEqual(shared.check(databases=["default"]), [])
+        with vendor("postgresql"):
+            errors = shared.check(databases=["default"])
+        self.assertEqual([error.id for error in errors], ["django_enum.E002"])
+        self.assertIn("tests_flag_constraints.Invoice.other", errors[0].msg)
+
+
+class TestEnumTypeOperations(TestCase):
+    def collect(self, operation, backwards=False, state=None):
+        editor = connection.schema_editor(collect_sql=True)
+        if backwards:
+            operation.database_backwards("tests_djenum", editor, state, state)
+        else:
+            operation.database_forwards("tests_djenum", editor, state, state)
+        return editor.collected_sql
+
+    def test_create_enum_type(self):
+        operation = CreateEnumType("color", ["R", "G", "it's"])
+        with vendor("postgresql"):
+            self.assertEqual(
+                self.collect(operation),
+                ["CREATE TYPE \"color\" AS ENUM ('R', 'G', 'it''s');"],
+            )
+            self.assertEqual(
+                self.collect(operation, backwards=True), ['DROP TYPE "color";']
+            )
+        self.assertEqual(self.collect(operation), [])
+        self.assertEqual(operation.describe(), "Create enumeration type color")
+        self.assertEqual(operation.migration_name_fragment, "create_enum_type_color")
+        self.assertEqual(
+            operation.deconstruct(),
+            ("CreateEnumType", ("color", ["R", "G", "it's"]), {}),
+        )
+
+    def test_add_enum_values(self):
+        operation = AddEnumValues("color", ["B", "Y"])
+        with vendor("postgresql"):
+            self.assertEqual(
+                self.collect(operation),
+                [
+                    "ALTER TYPE \"color\" ADD VALUE IF NOT EXISTS 'B';",
+                    "ALTER TYPE \"color\" ADD VALUE IF NOT EXISTS 'Y';",
+                ],
+            )
+            self.assertEqual(self.collect(operation, backwards=True), [])
+        self.assertEqual(self.collect(operation), [])
+        self.assertEqual(operation.describe(), "Add B, Y to enumeration type color")
+        self.assertEqual(operation.migration_name_fragment, "add_enum_values_color")
+
+    def test_add_enum_values_mysql(self):
+        state = ProjectState.from_apps(apps)
+        operation = AddEnumValues("tests_djenum_textenum", ["V4", "V1"])
+        self.assertEqual(
+            [(model.__name__, field.name) for model, field in operation.fields(state)],
+            [("DBEnumTypeTester", "text")],
+        )
+        with vendor("mysql"):
+            self.assertEqual(
+                self.collect(operation, state=state),
+                [
+                    'ALTER TABLE "tests_djenum_dbenumtypetester" MODIFY "text" '
+                    "enum('V1', 'V22', 'V333', 'D', 'V4') NOT NULL;"
+                ],
+            )
+            self.assertEqual(
+                self.collect(AddEnumValues("djenum_dj_text", ["D"]), state=state),
+                [
+                    'ALTER TABLE "tests_djenum_dbenumtypetester" MODIFY "dj_text" '
+                    "enum('A', 'B', 'C', 'D') NULL;"
+                ],
+            )
+            self.assertEqual(self.collect(operation, backwards=True), [])
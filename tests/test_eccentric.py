@@ -111,15 +111,15 @@ def test_enum_choice_field(self):
         from tests.djenum.enums import MultiPrimitiveEnum, MultiWithNone
 
         form_field1 = EnumChoiceField(MultiPrimitiveEnum)
-        self.assertEqual(form_field1.choices, choices(MultiPrimitiveEnum))
+        self.assertEqual(form_field1.choices, list(choices(MultiPrimitiveEnum)))
         self.assertEqual(form_field1.primitive, str)
 
         form_field2 = EnumChoiceField(MultiPrimitiveEnum, primitive=float)
-        self.assertEqual(form_field2.choices, choices(MultiPrimitiveEnum))
+        self.assertEqual(form_field2.choices, list(choices(MultiPrimitiveEnum)))
         self.assertEqual(form_field2.primitive, float)
 
         form_field3 = EnumChoiceField(MultiWithNone)
-        self.assertEqual(form_field3.choices, choices(MultiWithNone))
+        self.assertEqual(form_field3.choices, list(choices(MultiWithNone)))
         self.assertEqual(form_field3.primitive, str)
 
     def test_custom_primitive(self):
@@ -42,44 +42,45 @@ def choices(self):
 
     def test_choices(self):
         self.assertEqual(
-            choices(TestEnumCompat.NormalIntEnum), [(1, "VAL1"), (2, "VAL2")]
+            choices(TestEnumCompat.NormalIntEnum), ((1, "VAL1"), (2, "VAL2"))
         )
         self.assertEqual(
             choices(TestEnumCompat.IntEnumWithLabels),
-            TestEnumCompat.ChoicesIntEnum.choices,
+            tuple(TestEnumCompat.ChoicesIntEnum.choices),
         )
         self.assertEqual(
             choices(TestEnumCompat.EnumWithChoicesProperty),
-            [(1, "Label 1"), (2, "Label 2")],
+            ((1, "Label 1"), (2, "Label 2")),
         )
-        self.assertEqual(choices(None), [])
+        self.assertEqual(choices(None), ())
 
     def test_labels(self):
-        self.assertEqual(labels(TestEnumCompat.NormalIntEnum), ["VAL1", "VAL2"])
+        self.assertEqual(labels(TestEnumCompat.NormalIntEnum), ("VAL1", "VAL2"))
         self.assertEqual(
             labels(TestEnumCompat.IntEnumWithLabels),
-            TestEnumCompat.ChoicesIntEnum.labels,
+            tuple(TestEnumCompat.ChoicesIntEnum.labels),
         )
         self.assertEqual(
-            labels(TestEnumCompat.EnumWithChoicesProperty), ["Label 1", "Label 2"]
+            labels(TestEnumCompat.EnumWithChoicesProperty), ("Label 1", "Label 2")
         )
-        self.assertEqual(labels(None), [])
+        self.assertEqual(labels(None), ())
 
     def test_values(self):
-        self.assertEqual(values(TestEnumCompat.NormalIntEnum), [1, 2])
+        self.assertEqual(values(TestEnumCompat.NormalIntEnum), (1, 2))
         self.assertEqual(
             values(TestEnumCompat.IntEnumWithLabels),
-            TestEnumCompat.ChoicesIntEnum.values,
+            tuple(TestEnumCompat.ChoicesIntEnum.values),
         )
-        self.assertEqual(values(TestEnumCompat.EnumWithChoicesProperty), [1, 2])
-        self.assertEqual(values(None), [])
+        self.assertEqual(values(TestEnumCompat.EnumWithChoicesProperty), (1, 2))
+        self.assertEqual(values(None), ())
 
     def test_names(self):
-        self.assertEqual(names(TestEnumCompat.NormalIntEnum), ["VAL1", "VAL2"])
+        self.assertEqual(names(TestEnumCompat.NormalIntEnum), ("VAL1", "VAL2"))
         self.assertEqual(
-            names(TestEnumCompat.IntEnumWithLabels), TestEnumCompat.ChoicesIntEnum.names
+            names(TestEnumCompat.IntEnumWithLabels),
+            tuple(TestEnumCompat.ChoicesIntEnum.names),
         )
         self.assertEqual(
-            names(TestEnumCompat.EnumWithChoicesProperty), ["VAL1", "VAL2"]
+            names(TestEnumCompat.EnumWithChoicesProperty), ("VAL1", "VAL2")
         )
-        self.assertEqual(names(None), [])
+        self.assertEqual(names(None), ())
@@ -230,3 +230,92 @@ def test_base_fields(self):
         self.assertIsNone(tester.text)
 
         self.assertIsNone(tester.extern)
+
+
+class TestEnumAnalysis(TestCase):
+    def test_enum_analyzed_once(self):
+        from enum import IntEnum
+        from unittest import mock
+
+        from django_enum import fields, utils
+
+        class Shared(IntEnum):
+            ONE = 1
+            TWO = 2
+            THREE = 3
+
+        with (
+            mock.patch.object(
+                fields, "determine_primitive", wraps=fields.determine_primitive
+            ) as determine_primitive,
+            mock.patch.object(
+                fields, "_check_symmetric", wraps=fields._check_symmetric
+            ) as check_symmetric,
+            mock.patch.object(utils, "_members", wraps=utils._members) as members,
+        ):
+            enum_fields = [EnumField(Shared, null=idx % 2) for idx in range(10)]
+
+        self.assertEqual(determine_primitive.call_count, 1)
+        self.assertEqual(check_symmetric.call_count, 1)
+        self.assertEqual(members.call_count, 1)
+        for field in enum_fields:
+            self.assertIsInstance(field, EnumPositiveSmallIntegerField)
+            self.assertEqual(field.choices, enum_fields[0].choices)
+            self.assertIs(field._coercion_table_, enum_fields[0]._coercion_table_)
+        self.assertIsNot(enum_fields[0].choices, enum_fields[1].choices)
+        self.assertIsNot(
+            enum_fields[0]._value_primitives_, enum_fields[1]._value_primitives_
+        )
+
+    def test_redefined_enum(self):
+        import gc
+        import weakref
+        from enum import IntEnum
+
+        class Redefined(IntEnum):
+            ONE = 1
+
+        self.assertIsInstance(EnumField(Redefined), EnumPositiveSmallIntegerField)
+        original = weakref.ref(Redefined)
+
+        class Redefined(IntEnum):
+            ONE = 1
+            BIG = 1 << 20
+
+        field = EnumField(Redefined)
+        self.assertIsInstance(field, EnumPositiveIntegerField)
+        self.assertEqual(field.choices, [(1, "ONE"), (1 << 20, "BIG")])
+
+        gc.collect()
+        self.assertIsNone(original())
+
+    def test_subclass_not_shared(self):
+        from enum import Enum
+
+        class Base(Enum):
+            @property
+            def double(self):
+                return self.value * 2
+
+        with self.assertRaises(ValueError):
+            EnumField(Base)
+
+        class Sub1(Base):
+            ONE = 1
+
+        class Sub2(Base):
+            ONE = "1"
+
+        self.assertIsInstance(EnumField(Sub1), EnumPositiveSmallIntegerField)
+        self.assertIsInstance(EnumField(Sub2), EnumCharField)
+
+    def test_failed_analysis_not_cached(self):
+        from enum import Enum
+
+        class Asymmetric(Enum):
+            ONE = 1
+            HALF = 1.5
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                EnumField(Asymmetric, primitive=int)
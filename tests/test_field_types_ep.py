@@ -3,6 +3,7 @@
 pytest.importorskip("enum_properties")
 from tests.djenum.models import EnumTester
 from django.core.exceptions import FieldError
+from django.db import NotSupportedError, connection
 from django.db.models import F
 from tests.test_field_types import TestFieldTypeResolution
 from tests.enum_prop.models import EnumTester
@@ -95,14 +96,28 @@ def test_large_bitfields(self):
             large_neg=None,
         )
 
-        # has_any and has_all are not supported on ExtraLarge bit fields
-        with self.assertRaises(FieldError):
-            BitFieldModel.objects.filter(bit_field_large__has_any=LargeBitField.ONE)
-
-        with self.assertRaises(FieldError):
-            BitFieldModel.objects.filter(
-                bit_field_large__has_all=LargeBitField.ONE | LargeBitField.TWO
+        # has_any and has_all are only supported on ExtraLarge bit fields on
+        # SQLite and PostgreSQL
+        if connection.vendor in ["sqlite", "postgresql"]:
+            self.assertEqual(
+                BitFieldModel.objects.filter(
+                    bit_field_large__has_any=LargeBitField.ONE
+                ).count(),
+                2,
+            )
+            self.assertEqual(
+                BitFieldModel.objects.get(
+                    bit_field_large__has_all=LargeBitField.ONE | LargeBitField.TWO
+                ),
+                tester2,
             )
+        else:
+            with self.assertRaises(NotSupportedError):
+                BitFieldModel.objects.filter(
+                    bit_field_large__has_any=LargeBitField.ONE
+                ).count()
+
+        # large_neg is not a flag field
 
         with self.assertRaises(FieldError):
             BitFieldModel.objects.filter(large_neg__has_any=LargeNegativeField.NEG_ONE)
@@ -1,12 +1,53 @@
 import sys
+from enum import Flag, IntFlag
+from functools import reduce
+from operator import and_, or_, xor
+from types import SimpleNamespace
+from unittest import mock
+
 import pytest
+from django.apps import apps
+from django.contrib.postgres.indexes import GinIndex
 from django.test import TestCase
-from tests.djenum.models import EnumFlagTester, EnumFlagTesterRelated
-from django_enum.fields import EnumField, FlagField, ExtraBigIntegerFlagField
+from django.test.utils import CaptureQueriesContext, isolate_apps
+from tests.djenum.models import (
+    BitStringTester,
+    EnumFlagTester,
+    EnumFlagTesterRelated,
+    FlagIndexTester,
+)
+from tests.djenum.enums import (
+    ExtraBigPositiveFlagEnum,
+    PositiveFlagEnum,
+    SmallNegativeFlagEnum,
+    SmallPositiveFlagEnum,
+    SmallPosIntEnum,
+)
+from django_enum.fields import (
+    BitStringFlagField,
+    EnumField,
+    FlagField,
+    ExtraBigIntegerFlagField,
+)
+from django_enum.operations import RemapFlagBits
+from django_enum.query import (
+    FlagAnd,
+    FlagBit,
+    FlagClear,
+    FlagCount,
+    FlagOr,
+    FlagSet,
+    FlagToggle,
+    FlagXor,
+    flag_histogram,
+)
+from django.db import models
+from django.db.migrations.state import ProjectState
 from django.db.models import F, Q, Func, OuterRef, Subquery, Count
+from django.db.models.sql import UpdateQuery
 from django.db.utils import DatabaseError
 from tests.utils import IGNORE_ORA_00932
-from django.db import connection
+from django.db import NotSupportedError, connection, connections
 from django.core.exceptions import FieldError
 
 
@@ -34,6 +75,40 @@ def invert_flags(en):
     )
 
 
+def vendor(name):
+    """Make the default connection report the given database vendor."""
+    return mock.patch.object(type(connections["default"]), "vendor", name)
+
+
+def compile_sql(query, name):
+    """Compile a query as it would be for the given database vendor."""
+    with vendor(name):
+        return query.get_compiler(using="default").as_sql()
+
+
+class FlagFixtureMixin:
+    """
+    Fill the flag fields of the test model with the combinations of their
+    flags returned by ``combinations``, plus one row of nulls.
+    """
+
+    MODEL_CLASS = EnumFlagTester
+    FIELDS = ["small_pos", "pos", "big_pos"]
+
+    def combinations(self, members):
+        raise NotImplementedError
+
+    def setUp(self):
+        super().setUp()
+        for field_name in self.FIELDS:
+            enum = self.MODEL_CLASS._meta.get_field(field_name).enum
+            for combination in self.combinations(list(enum)):
+                self.MODEL_CLASS.objects.create(
+                    **{field_name: combine_flags(*combination) or enum(0)}
+                )
+        self.MODEL_CLASS.objects.create()
+
+
 class FlagTests(TestCase):
     MODEL_CLASS = EnumFlagTester
     RELATED_CLASS = EnumFlagTesterRelated
@@ -454,6 +529,56 @@ def test_unsupported_flags(self):
             with self.assertRaises(FieldError):
                 self.MODEL_CLASS.objects.filter(**{"field__has_all": EnumClass.ONE})
 
+    def test_composite_cache(self):
+        class Wide(IntFlag):
+            A = 1
+            B = 2
+            C = 4
+            D = 8
+
+        field = EnumField(Wide, composite_cache_size=2)
+        for value in [3, 5, 6, 7, 3]:
+            member = field.to_python(value)
+            self.assertIsInstance(member, Wide)
+            self.assertEqual(member, value)
+            self.assertEqual(list(member), [flg for flg in Wide if flg & value])
+        for value in [3, 5, 6, 7]:
+            self.assertNotIn(value, Wide._value2member_map_)
+        self.assertEqual(field.composite_cache_info().currsize, 2)
+        self.assertEqual(field.composite_cache_info().misses, 5)
+        self.assertIs(field.to_python(3), field.to_python(3))
+        self.assertEqual(field.composite_cache_info().hits, 2)
+        self.assertEqual(field.to_python(3), Wide.A | Wide.B)
+
+        # composites that python has already interned are left alone
+        interned = Wide.B | Wide.D
+        self.assertIs(field.to_python(10), interned)
+        self.assertIs(Wide._value2member_map_[10], interned)
+
+        class Plain(Flag):
+            A = 1
+            B = 2
+
+        self.assertIsNone(EnumField(Plain).composite_cache_info())
+        self.assertIsNone(
+            EnumField(Wide, composite_cache_size=0).composite_cache_info()
+        )
+
+    def test_composite_reads_bounded(self):
+        field = self.MODEL_CLASS._meta.get_field("big_pos")
+        EnumClass = field.enum
+        flags = [int(flag) for flag in EnumClass]
+        composites = {flags[0] | flags[1], flags[1] | flags[3], flags[0] | flags[4]}
+        for value in composites:
+            self.MODEL_CLASS.objects.create(big_pos=value)
+        interned = len(EnumClass._value2member_map_)
+        self.assertEqual(
+            {int(obj.big_pos) for obj in self.MODEL_CLASS.objects.all()}, composites
+        )
+        for obj in self.MODEL_CLASS.objects.all():
+            self.assertIsInstance(obj.big_pos, EnumClass)
+        self.assertLessEqual(len(EnumClass._value2member_map_), interned)
+
     def test_extra_big_flags(self):
         obj = self.MODEL_CLASS.objects.create()
         self.assertTrue(obj.extra_big_neg is None)
@@ -475,3 +600,908 @@ def test_extra_big_flags(self):
         else:
             self.assertEqual(obj, self.MODEL_CLASS.objects.get(extra_big_pos=0))
         self.assertEqual(obj, self.MODEL_CLASS.objects.get(extra_big_neg__isnull=True))
+
+    @pytest.mark.skipif(
+        connection.vendor not in ["sqlite", "postgresql"],
+        reason="Extra big flag lookups are only supported on SQLite and PostgreSQL",
+    )
+    def test_extra_big_flag_lookups(self):
+        EnumClass = self.MODEL_CLASS._meta.get_field("extra_big_pos").enum
+        members = list(EnumClass)
+        values = [EnumClass(0), *members]
+        values += [
+            members[idx] | members[jdx]
+            for idx in range(len(members))
+            for jdx in range(idx + 1, len(members))
+        ]
+        values.append(combine_flags(*members))
+        for value in values:
+            self.MODEL_CLASS.objects.create(extra_big_pos=value)
+        rows = list(self.MODEL_CLASS.objects.values_list("pk", "extra_big_pos"))
+
+        for query in values:
+            for lookup, test in [
+                ("has_any", lambda val: bool(val & query)),
+                ("has_all", lambda val: val & query == query),
+            ]:
+                self.assertEqual(
+                    set(
+                        self.MODEL_CLASS.objects.filter(
+                            **{f"extra_big_pos__{lookup}": query}
+                        ).values_list("pk", flat=True)
+                    ),
+                    {pk for pk, val in rows if test(val)},
+                    f"extra_big_pos__{lookup}={query!r}",
+                )
+                self.assertEqual(
+                    set(
+                        self.MODEL_CLASS.objects.filter(
+                            **{f"extra_big_pos__{lookup}": int(query)}
+                        ).values_list("pk", flat=True)
+                    ),
+                    {pk for pk, val in rows if test(val)},
+                )
+
+    @pytest.mark.skipif(
+        connection.vendor in ["sqlite", "postgresql"],
+        reason="Extra big flag lookups are supported on SQLite and PostgreSQL",
+    )
+    def test_extra_big_flag_lookups_unsupported(self):
+        EnumClass = self.MODEL_CLASS._meta.get_field("extra_big_pos").enum
+        with self.assertRaises(NotSupportedError):
+            list(self.MODEL_CLASS.objects.filter(extra_big_pos__has_any=EnumClass.ONE))
+
+
+class BitStringFlagTests(TestCase):
+    MODEL_CLASS = BitStringTester
+
+    def test_field_type(self):
+        for name, bits in [("small_pos", 15), ("pos", 31), ("extra_big_pos", 66)]:
+            field = self.MODEL_CLASS._meta.get_field(name)
+            self.assertIsInstance(field, BitStringFlagField)
+            self.assertEqual(field.bit_length, bits)
+            self.assertEqual(field.deconstruct()[3]["bit_length"], bits)
+
+    def test_non_flag_error(self):
+        for enum in [SmallPosIntEnum, SmallNegativeFlagEnum]:
+            with self.assertRaises(ValueError):
+                EnumField(enum, bit_string=True)
+
+    def test_native_conversions(self):
+        field = self.MODEL_CLASS._meta.get_field("extra_big_pos")
+        EnumClass = field.enum
+        value = EnumClass.ONE | EnumClass.FIVE
+        postgres = SimpleNamespace(vendor="postgresql")
+        mysql = SimpleNamespace(vendor="mysql")
+
+        self.assertEqual(field.db_type(postgres), "bit(66)")
+        bits = field.get_db_prep_value(value, postgres)
+        self.assertEqual(bits, "1" + "0" * 64 + "1")
+        self.assertEqual(
+            field.get_db_prep_value(field.get_prep_value(value), postgres), bits
+        )
+        self.assertEqual(field.from_db_value(bits, None, postgres), value)
+        self.assertEqual(field.get_db_prep_value(EnumClass(0), postgres), "0" * 66)
+        self.assertIsNone(field.get_db_prep_value(None, postgres))
+
+        # MySQL BIT columns hold at most 64 bits
+        self.assertFalse(field.native(mysql))
+        small = self.MODEL_CLASS._meta.get_field("small_pos")
+        self.assertTrue(small.native(mysql))
+        self.assertEqual(small.db_type(mysql), "bit(15)")
+        self.assertEqual(small.get_db_prep_value(small.enum.TWO, mysql), 2048)
+        self.assertEqual(
+            small.from_db_value((2048).to_bytes(2, "big"), None, mysql), small.enum.TWO
+        )
+
+    def test_native_lookup_sql(self):
+        EnumClass = self.MODEL_CLASS._meta.get_field("extra_big_pos").enum
+        mask = EnumClass.ONE | EnumClass.FOUR
+        for lookup, expected in [
+            ("has_all", "& CAST(%s AS bit(66)) = CAST(%s AS bit(66))"),
+            ("has_any", "& CAST(%s AS bit(66)) <> CAST(0 AS bit(66))"),
+        ]:
+            sql, params = compile_sql(
+                self.MODEL_CLASS.objects.filter(
+                    **{f"extra_big_pos__{lookup}": mask}
+                ).query,
+                "postgresql",
+            )
+            self.assertIn(expected, sql)
+            self.assertEqual(params[0], format(int(mask), "066b"))
+
+    def test_bit_string_storage(self):
+        values = [
+            (
+                SmallPositiveFlagEnum.ONE,
+                PositiveFlagEnum(0),
+                ExtraBigPositiveFlagEnum.FIVE,
+            ),
+            (
+                None,
+                PositiveFlagEnum.TWO | PositiveFlagEnum.FIVE,
+                ExtraBigPositiveFlagEnum.ONE | ExtraBigPositiveFlagEnum.FOUR,
+            ),
+            (
+                SmallPositiveFlagEnum.ONE | SmallPositiveFlagEnum.THREE,
+                PositiveFlagEnum.FIVE,
+                ExtraBigPositiveFlagEnum(0),
+            ),
+        ]
+        for small_pos, pos, extra_big_pos in values:
+            self.MODEL_CLASS.objects.create(
+                small_pos=small_pos, pos=pos, extra_big_pos=extra_big_pos
+            )
+        self.assertEqual(
+            list(
+                self.MODEL_CLASS.objects.order_by("pk").values_list(
+                    "small_pos", "pos", "extra_big_pos"
+                )
+            ),
+            values,
+        )
+        self.assertEqual(
+            self.MODEL_CLASS.objects.get(pos=PositiveFlagEnum.FIVE).extra_big_pos, 0
+        )
+        if connection.vendor not in ["sqlite", "postgresql", "mysql"]:
+            return
+        self.assertEqual(
+            self.MODEL_CLASS.objects.filter(
+                extra_big_pos__has_any=ExtraBigPositiveFlagEnum.ONE
+                | ExtraBigPositiveFlagEnum.FIVE
+            ).count(),
+            2,
+        )
+        self.assertEqual(
+            self.MODEL_CLASS.objects.filter(pos__has_all=PositiveFlagEnum.FIVE).count(),
+            2,
+        )
+        self.assertEqual(
+            self.MODEL_CLASS.objects.filter(
+                small_pos__has_any=SmallPositiveFlagEnum.THREE
+            ).count(),
+            1,
+        )
+
+
+class FlagInListTests(TestCase):
+    def test_constant_folding(self):
+        qry = EnumFlagTester.objects.all()
+        EnumFlagTester.objects.create()
+        EnumFlagTester.objects.create(small_pos=SmallPositiveFlagEnum.ONE)
+        self.assertNotIn("&", str(qry.filter(pos__has_all=0).query))
+        self.assertEqual(qry.filter(pos__has_all=0).count(), 2)
+        self.assertEqual(qry.filter(small_pos__has_all=0).count(), 1)
+        self.assertEqual(qry.filter(small_pos__has_any=0).count(), 0)
+        self.assertEqual(qry.exclude(small_pos__has_any=0).count(), 2)
+
+    def test_in_list(self):
+        field = EnumField(SmallPositiveFlagEnum, in_list_lookups=True)
+        ONE, TWO, THREE, FOUR, FIVE = SmallPositiveFlagEnum
+        self.assertEqual(
+            field.in_list(ONE | FIVE, has_all=True),
+            sorted(
+                int(ONE | FIVE | flag)
+                for flag in [
+                    SmallPositiveFlagEnum(0),
+                    TWO,
+                    THREE,
+                    FOUR,
+                    TWO | THREE,
+                    TWO | FOUR,
+                    THREE | FOUR,
+                    TWO | THREE | FOUR,
+                ]
+            ),
+        )
+        self.assertEqual(field.in_list(ONE | 1, has_all=True), [])
+        self.assertEqual(len(field.in_list(ONE | TWO, has_all=False)), 24)
+        self.assertEqual(field.in_list(1, has_all=False), [])
+        # too many matches
+        field.in_list_max = 16
+        self.assertEqual(len(field.in_list(ONE, has_all=False)), 16)
+        self.assertIsNone(field.in_list(ONE | TWO, has_all=False))
+
+        self.assertIsNone(EnumField(SmallPositiveFlagEnum).in_list(ONE | FIVE, True))
+        self.assertIsNone(
+            EnumField(SmallPositiveFlagEnum, in_list_lookups=False).in_list(
+                ONE | FIVE, True
+            )
+        )
+
+    if sys.version_info >= (3, 11):
+
+        def test_in_list_lookups(self):
+            from enum import STRICT
+
+            from tests.flag_constraints.enums import StrictFlagEnum
+            from tests.flag_constraints.models import FlagConstraintTestModel
+
+            class Exact(Flag, boundary=STRICT):
+                A = 1
+                B = 2
+                C = 4
+
+            # the range constraint limits the column to combinations of flags
+            self.assertEqual(
+                EnumField(Exact).in_list(Exact.A.value, False), [1, 3, 5, 7]
+            )
+            # stray bits below the highest flag pass the range constraint
+            self.assertIsNone(
+                EnumField(StrictFlagEnum).in_list(StrictFlagEnum.VAL1, True)
+            )
+
+            values = [
+                StrictFlagEnum(combination) for combination in range(0, 2**15, 2**12)
+            ]
+            rows = [
+                (FlagConstraintTestModel.objects.create(strict=value).pk, value.value)
+                for value in values
+            ]
+            FlagConstraintTestModel.objects.create(strict=None)
+            # a value with a stray bit that passes the check constraint
+            table = FlagConstraintTestModel._meta.db_table
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {table} (eject, eject_non_strict, strict) "
+                    f"VALUES (0, 0, 4097)"
+                )
+            rows.append(
+                (
+                    FlagConstraintTestModel.objects.exclude(
+                        pk__in=[pk for pk, _ in rows]
+                    )
+                    .filter(strict__isnull=False)
+                    .values_list("pk", flat=True)
+                    .get(),
+                    4097,
+                )
+            )
+
+            for mask in values:
+                for lookup, test in [
+                    ("has_any", lambda val: bool(val & mask.value)),
+                    ("has_all", lambda val: val & mask.value == mask.value),
+                ]:
+                    qry = FlagConstraintTestModel.objects.filter(
+                        **{f"strict__{lookup}": mask}
+                    )
+                    if mask:
+                        self.assertNotIn(" IN (", str(qry.query))
+                    self.assertEqual(
+                        set(qry.values_list("pk", flat=True)),
+                        {pk for pk, val in rows if val is not None and test(val)},
+                        f"strict__{lookup}={mask!r}",
+                    )
+
+
+class FlagIndexStrategyTests(TestCase):
+    MODEL_CLASS = FlagIndexTester
+
+    def test_indexes(self):
+        indexes = self.MODEL_CLASS._meta.indexes
+        self.assertEqual(len(indexes), 6)
+        self.assertEqual(indexes[0].fields, ["btree"])
+        for index in indexes:
+            self.assertLessEqual(len(index.name), 30)
+        self.assertEqual(
+            self.MODEL_CLASS._meta.get_field("bits").index_bits,
+            tuple(flag.value for flag in SmallPositiveFlagEnum),
+        )
+
+    def test_invalid_strategy(self):
+        with self.assertRaises(ValueError):
+            EnumField(SmallPositiveFlagEnum, index_strategy="hash")
+        with self.assertRaises(ValueError):
+            EnumField(ExtraBigPositiveFlagEnum, index_strategy="bits")
+
+    def test_btree_in_lists(self):
+        field = self.MODEL_CLASS._meta.get_field("btree")
+        self.assertEqual(field.index_strategy, "btree")
+        # the column is not limited to combinations of the flags
+        self.assertNotIn(
+            " IN (",
+            str(self.MODEL_CLASS.objects.filter(btree__has_any=field.enum.ONE).query),
+        )
+        field = EnumField(
+            PositiveFlagEnum, index_strategy="btree", in_list_lookups=True
+        )
+        self.assertEqual(len(field.in_list(PositiveFlagEnum.ONE, True)), 16)
+
+    def test_bits_lookups(self):
+        ONE, TWO, THREE, FOUR, FIVE = SmallPositiveFlagEnum
+        values = [None, SmallPositiveFlagEnum(0), ONE, TWO | THREE, ONE | FIVE]
+        values += [ONE | TWO | FOUR, 1 | TWO]
+        for value in values:
+            self.MODEL_CLASS.objects.create(bits=value)
+        rows = list(self.MODEL_CLASS.objects.values_list("pk", "bits"))
+        for mask in [ONE, TWO, ONE | TWO, ONE | FIVE, THREE | FOUR, 1]:
+            for lookup, test in [
+                ("has_any", lambda val: bool(val & mask)),
+                ("has_all", lambda val: val & mask == mask),
+            ]:
+                qry = self.MODEL_CLASS.objects.filter(**{f"bits__{lookup}": mask})
+                self.assertEqual(
+                    set(qry.values_list("pk", flat=True)),
+                    {pk for pk, val in rows if val is not None and test(val)},
+                    f"bits__{lookup}={mask!r}",
+                )
+
+    @pytest.mark.skipif(
+        connection.vendor != "sqlite", reason="Checks the SQLite query plan."
+    )
+    def test_bits_index_used(self):
+        plan = self.MODEL_CLASS.objects.filter(
+            bits__has_all=SmallPositiveFlagEnum.THREE
+        ).explain()
+        self.assertIn("tests_djenu_bits_55cbc5_b12", plan)
+
+    def test_gin(self):
+        with isolate_apps("tests.djenum"):
+
+            class GinTester(models.Model):
+                flags = EnumField(SmallPositiveFlagEnum, index_strategy="gin")
+
+                class Meta:
+                    app_label = "tests_djenum"
+
+        (index,) = GinTester._meta.indexes
+        self.assertIsInstance(index, GinIndex)
+        self.assertIn(
+            'ARRAY[("flags" & 1024), ("flags" & 2048)',
+            str(index.create_sql(GinTester, connection.schema_editor())),
+        )
+        ONE, TWO, *_ = SmallPositiveFlagEnum
+        for lookup, operator in [("has_all", "@>"), ("has_any", "&&")]:
+            sql, _ = compile_sql(
+                GinTester.objects.filter(**{f"flags__{lookup}": ONE | TWO}).query,
+                "postgresql",
+            )
+            self.assertIn(
+                f" & 16384)] {operator} CAST(ARRAY[1024, 2048] AS integer[])", sql
+            )
+            # flags outside of the index are tested bitwise
+            sql, _ = compile_sql(
+                GinTester.objects.filter(**{f"flags__{lookup}": ONE | 1}).query,
+                "postgresql",
+            )
+            self.assertNotIn("ARRAY", sql)
+
+        # the index can only be migrated on PostgreSQL
+        field = GinTester._meta.get_field("flags")
+        self.assertEqual(field.check(), [])
+        errors = field.check(databases=["default"])
+        if connection.vendor == "postgresql":
+            self.assertEqual(errors, [])
+        else:
+            self.assertEqual([error.id for error in errors], ["django_enum.E001"])
+        with vendor("postgresql"):
+            self.assertEqual(field.check(databases=["default"]), [])
+        self.assertEqual(
+            self.MODEL_CLASS._meta.get_field("bits").check(databases=["default"]),
+            [],
+        )
+
+
+class FlagAggregateTests(FlagFixtureMixin, TestCase):
+    def combinations(self, members):
+        return [members[idx : idx + 3] for idx in range(len(members))]
+
+    def expected(self, field_name, combine, **filters):
+        values = [
+            value
+            for value in self.MODEL_CLASS.objects.filter(**filters).values_list(
+                field_name, flat=True
+            )
+            if value is not None
+        ]
+        if not values:
+            return None
+        result = values[0]
+        for value in values[1:]:
+            result = combine(result, value)
+        return result
+
+    def test_aggregates(self):
+        for field_name in self.FIELDS:
+            enum = self.MODEL_CLASS._meta.get_field(field_name).enum
+            members = list(enum)
+            for aggregate, combine in [
+                (FlagOr, or_),
+                (FlagAnd, and_),
+                (FlagXor, xor),
+            ]:
+                for filters in [
+                    {},
+                    {f"{field_name}__has_any": members[1]},
+                    {f"{field_name}__has_all": members[0] | members[-1]},
+                ]:
+                    result = self.MODEL_CLASS.objects.filter(**filters).aggregate(
+                        flags=aggregate(field_name)
+                    )["flags"]
+                    expected = self.expected(field_name, combine, **filters)
+                    self.assertEqual(result, expected)
+                    if expected is not None:
+                        self.assertIsInstance(result, enum)
+
+                # filtered aggregates and aggregates of groups
+                filters = {f"{field_name}__has_any": members[2]}
+                self.assertEqual(
+                    self.MODEL_CLASS.objects.aggregate(
+                        flags=aggregate(field_name, filter=Q(**filters))
+                    )["flags"],
+                    self.expected(field_name, combine, **filters),
+                )
+                for group, flags in (
+                    self.MODEL_CLASS.objects.values("pos")
+                    .annotate(flags=aggregate(field_name))
+                    .values_list("pos", "flags")
+                ):
+                    self.assertEqual(
+                        flags, self.expected(field_name, combine, pos=group)
+                    )
+
+    def test_null_groups(self):
+        for aggregate in [FlagOr, FlagAnd, FlagXor]:
+            self.assertIsNone(
+                self.MODEL_CLASS.objects.filter(pos__isnull=True).aggregate(
+                    flags=aggregate("pos")
+                )["flags"]
+            )
+            # groups where the filter leaves no rows
+            for flags in (
+                self.MODEL_CLASS.objects.values("small_pos")
+                .annotate(flags=aggregate("pos", filter=Q(pos__isnull=True)))
+                .values_list("flags", flat=True)
+            ):
+                self.assertIsNone(flags)
+
+    @pytest.mark.skipif(
+        connection.vendor != "sqlite", reason="Simulates Oracle on SQLite."
+    )
+    def test_oracle_aggregates(self):
+        connection.ensure_connection()
+        connection.connection.create_function(
+            "BITAND", 2, lambda lhs, rhs: None if lhs is None else lhs & rhs
+        )
+        connection.connection.create_function(
+            "MOD", 2, lambda lhs, rhs: None if lhs is None else int(lhs) % rhs
+        )
+        # sums of the high bits of big_pos would overflow SQLite's integers
+        for field_name in ["small_pos", "pos"]:
+            for aggregate, combine in [
+                (FlagOr, or_),
+                (FlagAnd, and_),
+                (FlagXor, xor),
+            ]:
+                expected = self.expected(field_name, combine)
+                with vendor("oracle"):
+                    result = self.MODEL_CLASS.objects.aggregate(
+                        flags=aggregate(field_name)
+                    )["flags"]
+                self.assertEqual(result, expected)
+
+    def test_aggregate_sql(self):
+        def sql(aggregate, name):
+            queryset = self.MODEL_CLASS.objects.annotate(flags=aggregate).values(
+                "flags"
+            )
+            with vendor(name):
+                return str(queryset.query)
+
+        self.assertIn(
+            'BIT_OR("tests_djenum_enumflagtester"."pos")',
+            sql(FlagOr("pos"), "postgresql"),
+        )
+        self.assertIn("BIT_XOR(", sql(FlagXor("pos"), "postgresql"))
+        self.assertIn(
+            'CASE WHEN COUNT("tests_djenum_enumflagtester"."pos") > 0 THEN BIT_AND(',
+            sql(FlagAnd("pos"), "mysql"),
+        )
+        for aggregate in [FlagOr, FlagAnd, FlagXor]:
+            self.assertIn(
+                f'CASE WHEN COUNT("tests_djenum_enumflagtester"."pos") > 0 THEN '
+                f"{aggregate.function}(",
+                sql(aggregate("pos"), "mysql"),
+            )
+        self.assertIn("MIN(BITAND(", sql(FlagAnd("pos"), "oracle"))
+        self.assertIn("django_enum_bit_or(", sql(FlagOr("pos"), "sqlite"))
+
+
+class FlagFunctionTests(FlagFixtureMixin, TestCase):
+    FIELDS = ["small_pos", "pos", "big_pos", "extra_big_pos"]
+
+    def combinations(self, members):
+        return [members[idx::3] for idx in range(len(members))]
+
+    def test_flag_count(self):
+        for field_name in self.FIELDS:
+            qry = self.MODEL_CLASS.objects.annotate(
+                num_flags=FlagCount(field_name)
+            ).order_by("-num_flags", "pk")
+            rows = list(qry.values_list("pk", field_name, "num_flags"))
+            for _, value, num_flags in rows:
+                self.assertEqual(
+                    num_flags, None if value is None else value.value.bit_count()
+                )
+            ordered = [pk for pk, value, _ in rows if value is not None]
+            self.assertEqual(
+                list(
+                    qry.filter(**{f"{field_name}__isnull": False}).values_list(
+                        "pk", flat=True
+                    )
+                ),
+                sorted(
+                    ordered,
+                    key=lambda pk: (
+                        -dict((row[0], row[1]) for row in rows)[pk].value.bit_count(),
+                        pk,
+                    ),
+                ),
+            )
+            self.assertEqual(
+                set(qry.filter(num_flags__gte=3).values_list("pk", flat=True)),
+                {
+                    pk
+                    for pk, value, _ in rows
+                    if value is not None and value.value.bit_count() >= 3
+                },
+            )
+
+    def test_flag_bit(self):
+        for field_name in self.FIELDS:
+            members = list(self.MODEL_CLASS._meta.get_field(field_name).enum)
+            for flags in [members[0], members[1], members[0] | members[3]]:
+                rows = list(
+                    self.MODEL_CLASS.objects.annotate(
+                        is_set=FlagBit(field_name, flags)
+                    ).values_list("pk", field_name, "is_set")
+                )
+                for _, value, is_set in rows:
+                    self.assertEqual(is_set, None if value is None else flags in value)
+                self.assertEqual(
+                    set(
+                        self.MODEL_CLASS.objects.filter(
+                            FlagBit(field_name, flags)
+                        ).values_list("pk", flat=True)
+                    ),
+                    set(
+                        self.MODEL_CLASS.objects.filter(
+                            **{f"{field_name}__has_all": flags}
+                        ).values_list("pk", flat=True)
+                    ),
+                )
+        with self.assertRaises(FieldError):
+            self.MODEL_CLASS.objects.annotate(
+                is_set=FlagBit("id", SmallPositiveFlagEnum.ONE)
+            )
+
+    def test_flag_count_sql(self):
+        def sql(field_name, name, pg_version=0):
+            queryset = self.MODEL_CLASS.objects.annotate(
+                num_flags=FlagCount(field_name)
+            ).values("num_flags")
+            with (
+                vendor(name),
+                mock.patch.object(connection, "pg_version", pg_version, create=True),
+            ):
+                return str(queryset.query)
+
+        column = '"tests_djenum_enumflagtester"."pos"'
+        self.assertIn(f"BIT_COUNT({column})", sql("pos", "mysql"))
+        self.assertIn(
+            f"bit_count(CAST(CAST({column} AS bigint) AS bit(64)))",
+            sql("pos", "postgresql", 140000),
+        )
+        self.assertIn(
+            f"bit_count({column.replace('pos', 'extra_big_pos')})",
+            sql("extra_big_pos", "postgresql", 140000),
+        )
+        self.assertIn(f"SIGN(({column} & 1))", sql("pos", "postgresql", 130000))
+        self.assertIn(f"SIGN(BITAND({column}, 1))", sql("pos", "oracle"))
+
+        # native bit strings
+        queryset = BitStringTester.objects.annotate(
+            num_flags=FlagCount("extra_big_pos")
+        ).values("num_flags")
+        column = '"tests_djenum_bitstringtester"."extra_big_pos"'
+        with mock.patch.object(connection, "pg_version", 140000, create=True):
+            self.assertIn(
+                f"bit_count({column})", compile_sql(queryset.query, "postgresql")[0]
+            )
+        with mock.patch.object(connection, "pg_version", 130000, create=True):
+            sql, _ = compile_sql(queryset.query, "postgresql")
+        self.assertNotIn("bit_count", sql)
+        self.assertIn(f"SIGN(get_bit({column}, 65))", sql)
+        self.assertIn(f"SIGN(get_bit({column}, 0))", sql)
+
+
+class FlagHistogramTests(FlagFixtureMixin, TestCase):
+    FIELDS = ["small_pos", "pos", "big_pos", "extra_big_pos"]
+
+    def combinations(self, members):
+        return [members[: idx + 1] for idx in range(len(members))]
+
+    def test_flag_histogram(self):
+        for field_name in self.FIELDS:
+            enum = self.MODEL_CLASS._meta.get_field(field_name).enum
+            qry = self.MODEL_CLASS.objects.filter(pk__gt=1)
+            with CaptureQueriesContext(connection) as ctx:
+                histogram = flag_histogram(qry, field_name)
+            self.assertEqual(len(ctx.captured_queries), 1)
+            self.assertEqual(list(histogram), [member for member in enum])
+            values = [
+                value
+                for value in qry.values_list(field_name, flat=True)
+                if value is not None
+            ]
+            for member, count in histogram.items():
+                self.assertEqual(count, sum(1 for value in values if member in value))
+
+    def test_composite_members(self):
+        class CompositeFlagEnum(IntFlag):
+            ONE = 2**10
+            TWO = 2**11
+            ONE_TWO = 2**10 | 2**11
+            THREE = 2**12
+            FOUR = 2**13
+            FIVE = 2**14
+
+        expected = flag_histogram(self.MODEL_CLASS.objects.all(), "small_pos")
+        field = self.MODEL_CLASS._meta.get_field("small_pos")
+        with mock.patch.object(field, "_enum_", CompositeFlagEnum):
+            histogram = flag_histogram(self.MODEL_CLASS.objects.all(), "small_pos")
+        self.assertEqual(
+            list(histogram),
+            [
+                CompositeFlagEnum.ONE,
+                CompositeFlagEnum.TWO,
+                CompositeFlagEnum.THREE,
+                CompositeFlagEnum.FOUR,
+                CompositeFlagEnum.FIVE,
+            ],
+        )
+        self.assertEqual(list(histogram.values()), list(expected.values()))
+
+    def test_historical_models(self):
+        model = ProjectState.from_apps(apps).apps.get_model(
+            "tests_djenum", "EnumFlagTester"
+        )
+        for field_name in self.FIELDS:
+            self.assertIsNone(model._meta.get_field(field_name).enum)
+            histogram = flag_histogram(model.objects.all(), field_name)
+            expected = flag_histogram(self.MODEL_CLASS.objects.all(), field_name)
+            self.assertEqual(
+                histogram,
+                {member.value: count for member, count in expected.items()},
+            )
+            self.assertEqual([type(flag) for flag in histogram], [int] * len(expected))
+
+    def test_flag_histogram_errors(self):
+        with self.assertRaises(TypeError):
+            flag_histogram(self.MODEL_CLASS.objects.all(), "big_neg")
+        with self.assertRaises(TypeError):
+            flag_histogram(self.MODEL_CLASS.objects.all(), "id")
+
+
+class FlagUpdateTests(FlagFixtureMixin, TestCase):
+    def combinations(self, members):
+        return [members[idx::2] for idx in range(len(members))]
+
+    def check_update(self, expression, combine):
+        for field_name in self.FIELDS:
+            members = list(self.MODEL_CLASS._meta.get_field(field_name).enum)
+            flags = members[0] | members[-1]
+            before = dict(self.MODEL_CLASS.objects.values_list("pk", field_name))
+            self.MODEL_CLASS.objects.update(
+                **{field_name: expression(field_name, flags)}
+            )
+            after = dict(self.MODEL_CLASS.objects.values_list("pk", field_name))
+            for pk, value in before.items():
+                self.assertEqual(
+                    after[pk], None if value is None else combine(value, flags)
+                )
+                if value is not None:
+                    self.assertIsInstance(after[pk], type(flags))
+
+    def test_flag_set(self):
+        self.check_update(FlagSet, lambda value, flags: value | flags)
+
+    def test_flag_clear(self):
+        self.check_update(FlagClear, lambda value, flags: value & ~flags)
+
+    def test_flag_toggle(self):
+        self.check_update(FlagToggle, lambda value, flags: value ^ flags)
+
+    def test_bulk_update(self):
+        ONE, TWO, *_ = SmallPositiveFlagEnum
+        objs = list(self.MODEL_CLASS.objects.filter(small_pos__isnull=False))
+        expected = {}
+        for idx, obj in enumerate(objs):
+            expression = FlagSet if idx % 2 else FlagToggle
+            expected[obj.pk] = (
+                obj.small_pos | ONE | TWO if idx % 2 else obj.small_pos ^ (ONE | TWO)
+            )
+            obj.small_pos = expression("small_pos", ONE | TWO)
+        self.MODEL_CLASS.objects.bulk_update(objs, ["small_pos"])
+        self.assertEqual(
+            dict(
+                self.MODEL_CLASS.objects.filter(pk__in=expected).values_list(
+                    "pk", "small_pos"
+                )
+            ),
+            expected,
+        )
+
+    def test_update_errors(self):
+        with self.assertRaises(ValueError):
+            self.MODEL_CLASS.objects.update(
+                small_pos=FlagSet("small_pos", SmallPositiveFlagEnum.ONE | 1)
+            )
+        with self.assertRaises(FieldError):
+            self.MODEL_CLASS.objects.update(
+                extra_big_pos=FlagToggle("extra_big_pos", 1)
+            )
+
+    def test_historical_models(self):
+        # the models RunPython data migrations get
+        model = ProjectState.from_apps(apps).apps.get_model(
+            "tests_djenum", "EnumFlagTester"
+        )
+        self.assertIsNone(model._meta.get_field("pos").enum)
+        ONE, TWO, *_ = (
+            flag.value for flag in self.MODEL_CLASS._meta.get_field("pos").enum
+        )
+        before = dict(self.MODEL_CLASS.objects.values_list("pk", "pos"))
+        model.objects.update(pos=FlagSet("pos", ONE))
+        model.objects.update(pos=FlagClear("pos", TWO))
+        model.objects.update(pos=FlagToggle("pos", ONE | TWO))
+        self.assertEqual(
+            dict(self.MODEL_CLASS.objects.values_list("pk", "pos")),
+            {
+                pk: None if value is None else (value | ONE) & ~TWO ^ (ONE | TWO)
+                for pk, value in before.items()
+            },
+        )
+
+    def test_update_sql(self):
+        def sql(expression, name):
+            query = self.MODEL_CLASS.objects.all().query.chain(UpdateQuery)
+            query.add_update_values({"pos": expression})
+            return compile_sql(query, name)
+
+        column = '"tests_djenum_enumflagtester"."pos"'
+        ONE = self.MODEL_CLASS._meta.get_field("pos").enum.ONE
+        self.assertEqual(
+            sql(FlagToggle("pos", ONE), "oracle"),
+            (
+                f'UPDATE "tests_djenum_enumflagtester" SET "pos" = '
+                f"({column} + %s - 2 * BITAND({column}, %s))",
+                (ONE.value, ONE.value),
+            ),
+        )
+        self.assertIn('"pos" | %s', sql(FlagSet("pos", ONE), "postgresql")[0])
+        self.assertEqual(sql(FlagClear("pos", ONE), "postgresql")[1], (~ONE.value,))
+
+
+class RemapFlagBitsTests(FlagFixtureMixin, TestCase):
+    def combinations(self, members):
+        return [
+            combination
+            for idx in range(len(members))
+            for combination in [members[idx:], members[idx::2], members[:idx]]
+        ]
+
+    def setUp(self):
+        super().setUp()
+        self.state = ProjectState.from_apps(apps)
+
+    def values(self, field_name):
+        return [
+            value if value is None else int(value)
+            for value in self.MODEL_CLASS.objects.order_by("pk").values_list(
+                field_name, flat=True
+            )
+        ]
+
+    def run_operation(self, operation, backwards=False, app_label="tests_djenum"):
+        editor = connection.schema_editor(collect_sql=True)
+        editor.deferred_sql = []
+        with (
+            mock.patch.object(editor, "remove_constraint") as remove,
+            mock.patch.object(editor, "add_constraint") as add,
+        ):
+            if backwards:
+                operation.database_backwards(app_label, editor, self.state, self.state)
+            else:
+                operation.database_forwards(app_label, editor, self.state, self.state)
+        return remove, add
+
+    @staticmethod
+    def remap(value, mapping):
+        if value is None:
+            return None
+        remapped = value & ~reduce(or_, mapping, 0)
+        for old, new in mapping.items():
+            if value & old:
+                remapped |= new
+        return remapped
+
+    def test_remap(self):
+        for field_name in self.FIELDS:
+            ONE, TWO, THREE, FOUR, FIVE = (
+                member.value
+                for member in self.MODEL_CLASS._meta.get_field(field_name).enum
+            )
+            # swap, move down, move up by two, split and retire bits
+            mapping = {ONE: TWO, TWO: ONE, FOUR: ONE, THREE: FIVE | THREE, FIVE: 0}
+            operation = RemapFlagBits(
+                "enumflagtester", field_name, mapping, batch_size=4
+            )
+            self.assertFalse(operation.reversible)
+            before = self.values(field_name)
+            self.run_operation(operation)
+            self.assertEqual(
+                self.values(field_name),
+                [self.remap(value, mapping) for value in before],
+            )
+
+            mapping = {ONE: THREE, THREE: FIVE, FIVE: ONE}
+            operation = RemapFlagBits("enumflagtester", field_name, mapping)
+            self.assertTrue(operation.reversible)
+            before = self.values(field_name)
+            self.run_operation(operation)
+            self.assertEqual(
+                self.values(field_name),
+                [self.remap(value, mapping) for value in before],
+            )
+            self.run_operation(operation, backwards=True)
+            self.assertEqual(self.values(field_name), before)
+
+    def test_update_sql(self):
+        operation = RemapFlagBits("enumflagtester", "pos", {1: 4, 8: 2, 16: 1, 32: 8})
+        field = self.state.apps.get_model(
+            "tests_djenum", "enumflagtester"
+        )._meta.get_field("pos")
+        condition, expression = operation.update(field, operation.mapping)
+        self.assertEqual(condition, Q(pos__has_any=57))
+        query = self.MODEL_CLASS.objects.all().query.chain(UpdateQuery)
+        query.add_update_values({"pos": expression})
+        sql, params = query.get_compiler("default").as_sql()
+        # one mask and shift for each distance the bits move
+        self.assertEqual(params, (~57, 16, 4, 40, 2, 1, 2))
+        self.assertEqual(sql.count(">>"), 2)
+        self.assertEqual(sql.count("<<"), 1)
+
+    def test_constraint(self):
+        if sys.version_info < (3, 11):
+            pytest.skip("Flag boundaries require Python 3.11")
+        from tests.flag_constraints.models import FlagConstraintTestModel
+
+        obj = FlagConstraintTestModel.objects.create(strict=2**12 | 2**14)
+        # the remapped flags satisfy the constraint, which stays in place
+        remove, add = self.run_operation(
+            RemapFlagBits("flagconstrainttestmodel", "strict", {2**12: 2**13}),
+            app_label="tests_flag_constraints",
+        )
+        remove.assert_not_called()
+        add.assert_not_called()
+        obj.refresh_from_db()
+        self.assertEqual(obj.strict.value, 2**13 | 2**14)
+
+    def test_operation(self):
+        operation = RemapFlagBits("enumflagtester", "pos", {1: None, 2: 4})
+        self.assertEqual(operation.mapping, {1: 0, 2: 4})
+        self.assertFalse(operation.reversible)
+        # bits moved onto bits that are kept can not be separated again
+        self.assertFalse(RemapFlagBits("enumflagtester", "pos", {1: 2}).reversible)
+        self.assertTrue(RemapFlagBits("enumflagtester", "pos", {1: 2, 2: 1}).reversible)
+        self.assertEqual(operation.describe(), "Remap flags of enumflagtester.pos")
+        self.assertEqual(
+            operation.migration_name_fragment, "remap_flags_enumflagtester_pos"
+        )
+        for mapping in [{3: 4}, {0: 4}, {1: -1}]:
+            with self.assertRaises(ValueError):
+                RemapFlagBits("enumflagtester", "pos", mapping)
+        with self.assertRaises(FieldError):
+            self.run_operation(RemapFlagBits("enumflagtester", "extra_big_pos", {1: 2}))
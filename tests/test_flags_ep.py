@@ -23,11 +23,19 @@ def test_prop_enum(self):
         self.assertEqual(GNSSConstellation.BEIDOU, GNSSConstellation("BeiDou"))
         self.assertEqual(GNSSConstellation.QZSS, GNSSConstellation("qzss"))
 
-        self.assertEqual(choices(SmallNegativeFlagEnum), SmallNegativeFlagEnum.choices)
-        self.assertEqual(names(SmallNegativeFlagEnum), SmallNegativeFlagEnum.names)
+        self.assertEqual(
+            choices(SmallNegativeFlagEnum), tuple(SmallNegativeFlagEnum.choices)
+        )
+        self.assertEqual(
+            names(SmallNegativeFlagEnum), tuple(SmallNegativeFlagEnum.names)
+        )
 
-        self.assertEqual(choices(SmallPositiveFlagEnum), SmallPositiveFlagEnum.choices)
-        self.assertEqual(names(SmallPositiveFlagEnum), SmallPositiveFlagEnum.names)
+        self.assertEqual(
+            choices(SmallPositiveFlagEnum), tuple(SmallPositiveFlagEnum.choices)
+        )
+        self.assertEqual(
+            names(SmallPositiveFlagEnum), tuple(SmallPositiveFlagEnum.names)
+        )
 
 
 FlagTests = None
@@ -973,6 +973,128 @@ def test_0009_change_default(self):
         self.assertEqual(MigrationTesterNew.objects.create().color, "B")
 
 
+class TestSchemaEvolution(TestCase):
+    """
+    Label changes and appended members must not touch the column, only the
+    check constraint may change.
+    """
+
+    def enums(self, labels="", extra=False):
+        from enum import IntFlag
+
+        from django.db.models import IntegerChoices, TextChoices
+
+        text = [("A", ("A", f"{labels}A")), ("B", ("B", f"{labels}B"))]
+        ints = [("ONE", (1, f"{labels}One")), ("TWO", (2, f"{labels}Two"))]
+        flags = [("X", 1), ("Y", 2)]
+        if extra:
+            text.append(("C", ("C", f"{labels}C")))
+            ints.append(("THREE", (3, f"{labels}Three")))
+            flags.append(("Z", 4))
+        return (
+            TextChoices("Text", text, module=__name__),
+            IntegerChoices("Int", ints, module=__name__),
+            IntFlag("Flags", flags, module=__name__),
+        )
+
+    def state(self, text, ints, flags):
+        from django.apps.registry import Apps
+        from django.db import models
+        from django.db.migrations.state import ModelState, ProjectState
+
+        from django_enum import EnumField
+
+        meta = type("Meta", (), {"app_label": "evolution", "apps": Apps()})
+        model = type(
+            "Evolution",
+            (models.Model,),
+            {
+                "__module__": __name__,
+                "Meta": meta,
+                "text": EnumField(text),
+                "ints": EnumField(ints),
+                "flags": EnumField(flags, null=True),
+                "ordinal": EnumField(text, ordinal=True),
+                "native": EnumField(text, db_enum_type="evolution_text"),
+            },
+        )
+        state = ProjectState()
+        state.add_model(ModelState.from_model(model))
+        return state
+
+    def operations(self, old, new):
+        from django.db.migrations.autodetector import MigrationAutodetector
+        from django.db.migrations.questioner import (
+            NonInteractiveMigrationQuestioner,
+        )
+
+        changes = MigrationAutodetector(
+            old, new, NonInteractiveMigrationQuestioner()
+        )._detect_changes()
+        return [
+            operation
+            for migration in changes.get("evolution", [])
+            for operation in migration.operations
+        ]
+
+    def sql(self, operation, old, new):
+        from django.db import connection
+
+        editor = connection.schema_editor(collect_sql=True)
+        editor.deferred_sql = []
+        operation.database_forwards("evolution", editor, old, new)
+        return editor.collected_sql
+
+    def test_label_changes_are_state_only(self):
+        old = self.state(*self.enums())
+        new = self.state(*self.enums(labels="Renamed "))
+        operations = self.operations(old, new)
+        self.assertEqual(
+            {operation.name for operation in operations},
+            {"text", "ints", "ordinal", "native"},
+        )
+        for operation in operations:
+            self.assertIsInstance(operation, migrations.AlterField)
+            self.assertEqual(self.sql(operation, old, new), [])
+
+    def test_appended_members_only_swap_constraints(self):
+        old = self.state(*self.enums())
+        new = self.state(*self.enums(extra=True))
+        operations = self.operations(old, new)
+        constraints = {
+            operation.name
+            for operation in operations
+            if isinstance(operation, migrations.RemoveConstraint)
+        }
+        self.assertEqual(
+            constraints,
+            {
+                "evolution_Evolution_text_Text",
+                "evolution_Evolution_ints_Int",
+                "evolution_Evolution_ordinal_Text",
+            },
+        )
+        self.assertEqual(
+            {
+                operation.constraint.name
+                for operation in operations
+                if isinstance(operation, migrations.AddConstraint)
+            },
+            constraints,
+        )
+        altered = [
+            operation
+            for operation in operations
+            if isinstance(operation, migrations.AlterField)
+        ]
+        self.assertEqual(
+            {operation.name for operation in altered},
+            {"text", "ints", "flags", "ordinal", "native"},
+        )
+        for operation in altered:
+            self.assertEqual(self.sql(operation, old, new), [])
+
+
 def test_migration_test_marker_tag():
     """Ensure ``MigratorTestCase`` sublasses are properly tagged."""
     assert MIGRATION_TEST_MARKER in TestInitialMigration.tags
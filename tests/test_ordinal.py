@@ -0,0 +1,242 @@
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.core import serializers
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+
+from django_enum import EnumField
+from django_enum.fields import OrdinalField, SmallIntegerOrdinalField
+from tests.djenum.enums import (
+    CodeEnum,
+    DateEnum,
+    DecimalEnum,
+    DJTextEnum,
+    NullableConstants,
+    SmallPositiveFlagEnum,
+    TextEnum,
+)
+from tests.djenum.models import OrdinalTester
+
+
+class TestOrdinalStorage(TestCase):
+    MODEL_CLASS = OrdinalTester
+
+    FIELDS = {
+        "text": TextEnum,
+        "dj_text": DJTextEnum,
+        "constant": NullableConstants,
+        "decimal": DecimalEnum,
+        "date": DateEnum,
+        "code": CodeEnum,
+    }
+
+    def members(self, field_name):
+        return [
+            member for member in self.FIELDS[field_name] if member.value is not None
+        ]
+
+    def raw_values(self, field_name):
+        column = self.MODEL_CLASS._meta.get_field(field_name).column
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {column} FROM {self.MODEL_CLASS._meta.db_table} ORDER BY id"
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def test_field_types(self):
+        for field_name in self.FIELDS:
+            field = self.MODEL_CLASS._meta.get_field(field_name)
+            self.assertIsInstance(field, SmallIntegerOrdinalField)
+            self.assertEqual(field.get_internal_type(), "PositiveSmallIntegerField")
+
+    def test_round_trip(self):
+        for field_name in self.FIELDS:
+            self.MODEL_CLASS.objects.all().delete()
+            members = self.members(field_name)
+            for member in members:
+                self.MODEL_CLASS.objects.create(**{field_name: member})
+            self.assertEqual(self.raw_values(field_name), list(range(len(members))))
+            loaded = list(
+                self.MODEL_CLASS.objects.order_by("id").values_list(
+                    field_name, flat=True
+                )
+            )
+            self.assertEqual(loaded, members)
+            for value in loaded:
+                self.assertIsInstance(value, self.FIELDS[field_name])
+
+    def test_serialization(self):
+        for member in NullableConstants:
+            self.MODEL_CLASS.objects.create(
+                text=TextEnum.VALUE2,
+                dj_text=DJTextEnum.C,
+                constant=member,
+                decimal=DecimalEnum.THREE,
+                date=DateEnum.EMMA,
+                code=list(CodeEnum)[1],
+            )
+        expected = list(self.MODEL_CLASS.objects.order_by("id").values())
+        for format in ["json", "python"]:
+            serialized = serializers.serialize(
+                format, self.MODEL_CLASS.objects.order_by("id")
+            )
+            if format == "json":
+                # values are serialized, not ordinals
+                self.assertIn('"date": "1989-07-27"', serialized)
+                self.assertIn('"decimal": "0.9999"', serialized)
+            self.MODEL_CLASS.objects.all().delete()
+            for obj in serializers.deserialize(format, serialized):
+                obj.save()
+            self.assertEqual(
+                list(self.MODEL_CLASS.objects.order_by("id").values()), expected
+            )
+
+    def test_lookups(self):
+        members = self.members("text")
+        for member in members:
+            self.MODEL_CLASS.objects.create(text=member)
+        qry = self.MODEL_CLASS.objects.all()
+        self.assertEqual(qry.get(text=TextEnum.VALUE2).text, TextEnum.VALUE2)
+        self.assertEqual(qry.get(text="V333").text, TextEnum.VALUE3)
+        self.assertEqual(qry.get(text="VALUE1").text, TextEnum.VALUE1)
+        self.assertEqual(
+            set(
+                qry.filter(text__in=["V1", TextEnum.DEFAULT]).values_list(
+                    "text", flat=True
+                )
+            ),
+            {TextEnum.VALUE1, TextEnum.DEFAULT},
+        )
+        # comparisons and ordering follow declaration order
+        self.assertEqual(
+            list(
+                qry.filter(text__gt=TextEnum.VALUE2)
+                .order_by("text")
+                .values_list("text", flat=True)
+            ),
+            [TextEnum.VALUE3, TextEnum.DEFAULT],
+        )
+        self.assertEqual(
+            list(
+                qry.filter(text__lt=TextEnum.VALUE3)
+                .order_by("-text")
+                .values_list("text", flat=True)
+            ),
+            [TextEnum.VALUE2, TextEnum.VALUE1],
+        )
+        self.assertEqual(
+            list(qry.order_by("text").values_list("text", flat=True)), members
+        )
+
+        self.MODEL_CLASS.objects.create(constant=NullableConstants.e)
+        self.assertEqual(qry.filter(constant__gte=NullableConstants.e).count(), 1)
+        self.assertEqual(
+            qry.filter(constant__lt=NullableConstants.GOLDEN_RATIO).count(), 1
+        )
+        self.assertEqual(qry.filter(constant__isnull=True).count(), len(members))
+
+        self.MODEL_CLASS.objects.create(
+            decimal=DecimalEnum.FOUR, date=DateEnum.HUGO, code=CodeEnum.C1000
+        )
+        self.assertEqual(qry.filter(decimal=Decimal("99.9999")).count(), 1)
+        self.assertEqual(qry.filter(date=date(2016, 9, 9)).count(), 1)
+        self.assertEqual(qry.filter(code=1000).count(), 1)
+        self.assertEqual(qry.filter(code__gt=CodeEnum.C401).count(), 1)
+
+    def test_update_and_bulk(self):
+        objs = self.MODEL_CLASS.objects.bulk_create(
+            [self.MODEL_CLASS(dj_text=member) for member in DJTextEnum]
+        )
+        self.MODEL_CLASS.objects.filter(dj_text=DJTextEnum.A).update(
+            dj_text=DJTextEnum.C
+        )
+        for obj in objs:
+            obj.date = DateEnum.EMMA
+        self.MODEL_CLASS.objects.bulk_update(objs, ["date"])
+        self.assertEqual(
+            list(
+                self.MODEL_CLASS.objects.order_by("id").values_list("dj_text", "date")
+            ),
+            [
+                (DJTextEnum.C, DateEnum.EMMA),
+                (DJTextEnum.B, DateEnum.EMMA),
+                (DJTextEnum.C, DateEnum.EMMA),
+            ],
+        )
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            self.MODEL_CLASS.objects.create(text="not a value")
+        obj = self.MODEL_CLASS(text="V22", dj_text="D")
+        with self.assertRaises(ValidationError):
+            obj.full_clean()
+        obj.dj_text = "B"
+        obj.full_clean()
+
+    def test_constraints(self):
+        table = self.MODEL_CLASS._meta.db_table
+        for field_name, max_ordinal in [("text", 3), ("dj_text", 2), ("code", 108)]:
+            columns = {
+                "text": 0,
+                self.MODEL_CLASS._meta.get_field(field_name).column: 0,
+            }
+            with connection.cursor() as cursor:
+                for ordinal, valid in [(max_ordinal, True), (max_ordinal + 1, False)]:
+                    columns[field_name] = ordinal
+                    sql = (
+                        f"INSERT INTO {table} ({', '.join(columns)}) "
+                        f"VALUES ({', '.join(map(str, columns.values()))})"
+                    )
+                    if valid:
+                        with transaction.atomic():
+                            cursor.execute(sql)
+                    else:
+                        with self.assertRaises(IntegrityError), transaction.atomic():
+                            cursor.execute(sql)
+        self.assertEqual(
+            self.MODEL_CLASS.objects.filter(code__isnull=False).get().code,
+            CodeEnum.C1000,
+        )
+
+    def test_reconstructed_field(self):
+        for field_name in self.FIELDS:
+            field = self.MODEL_CLASS._meta.get_field(field_name)
+            _, path, args, kwargs = field.deconstruct()
+            self.assertEqual(path, "django_enum.fields.SmallIntegerOrdinalField")
+            reconstructed = SmallIntegerOrdinalField(*args, **kwargs)
+            self.assertIsNone(reconstructed.enum)
+            for ordinal, member in enumerate(self.members(field_name)):
+                self.assertEqual(reconstructed.get_prep_value(member.value), ordinal)
+                self.assertEqual(field.get_prep_value(member), ordinal)
+                self.assertEqual(
+                    reconstructed.from_db_value(ordinal, None, connection),
+                    member.value,
+                )
+
+    def test_ordinal_options(self):
+        field = EnumField(TextEnum, ordinal=True, coerce=False)
+        self.assertIsInstance(field, OrdinalField)
+        self.assertEqual(field.from_db_value(1, None, connection), "V22")
+        self.assertIs(type(field.from_db_value(1, None, connection)), str)
+        self.assertIsNone(field.from_db_value(None, None, connection))
+        with self.assertRaises(ValueError):
+            EnumField(SmallPositiveFlagEnum, ordinal=True)
+        with self.assertRaises(ValueError):
+            EnumField(TextEnum, ordinal=True, strict=False)
+
+    def test_unknown_ordinals(self):
+        # e.g. after a value is removed from the enumeration
+        field = self.MODEL_CLASS._meta.get_field("text")
+        for ordinal in [4, -1]:
+            with self.assertRaisesMessage(ValueError, f"Ordinal {ordinal} "):
+                field.from_db_value(ordinal, None, connection)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {self.MODEL_CLASS._meta.db_table} (text) VALUES (3)"
+            )
+        with mock.patch.object(field, "_ordinal_values_", ("V1", "V22")):
+            with self.assertRaisesMessage(ValueError, "field text"):
+                self.MODEL_CLASS.objects.get()
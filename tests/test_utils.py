@@ -124,6 +124,86 @@ def test_decompose(self):
 
         self.assertEqual(decompose(0), [])
 
+    def test_decompose_matches_scan(self):
+        import random
+
+        from tests.benchmark.enums import enums
+        from tests.djenum.enums import GNSSConstellation, SmallNegativeFlagEnum
+
+        def scan(flags):
+            return [
+                flg
+                for flg in type(flags).__members__.values()
+                if flg in flags and flg is not type(flags)(0)
+            ]
+
+        class Aliased(enum.IntFlag):
+            B = 2
+            A = 1
+            C = 4
+            ALSO_A = 1
+            AC = 5
+
+        class Plain(enum.Flag):
+            X = 1
+            Y = 2
+            Z = 4
+
+        flag_classes = [
+            enums[15],
+            enums[31],
+            enums[61],
+            Aliased,
+            Plain,
+            GNSSConstellation,
+            SmallNegativeFlagEnum,
+        ]
+        for flag_cls in flag_classes:
+            flags = [int(flg.value) for flg in flag_cls]
+            for _ in range(25):
+                value = flag_cls(0)
+                for flg in random.sample(flags, k=random.randint(0, len(flags))):
+                    value |= flag_cls(flg)
+                self.assertEqual(decompose(value), scan(value))
+                # memoized result
+                self.assertEqual(decompose(value), scan(value))
+                if value.value >= 0:
+                    self.assertEqual(
+                        get_set_values(value.value),
+                        [
+                            1 << i
+                            for i in range(value.value.bit_length())
+                            if (value.value >> i) & 1
+                        ],
+                    )
+                    self.assertEqual(
+                        get_set_bits(value.value),
+                        [
+                            i
+                            for i in range(value.value.bit_length())
+                            if value.value & (1 << i)
+                        ],
+                    )
+
+        self.assertEqual(get_set_bits(-6), [1])
+        self.assertEqual(get_set_values(-6), [2])
+
+    def test_decompose_memoized(self):
+        from django_enum import utils
+
+        class Memo(enum.IntFlag):
+            A = 1
+            B = 2
+            C = 4
+
+        composite = Memo.A | Memo.C
+        decomposed = decompose(composite)
+        decomposed.append(Memo.B)
+        self.assertEqual(decompose(composite), [Memo.A, Memo.C])
+        info = Memo.__dict__["_django_enum_cache_"]["decompositions"].info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        self.assertEqual(info.maxsize, utils.DECOMPOSE_CACHE_SIZE)
+
     def test_members(self):
         class NoAliasesEnum(enum.Enum):
             A = 1
@@ -515,3 +595,80 @@ def not_a_member(self):
                 AliasesFlagWithProp.ABC,
             ],
         )
+
+    def test_lru_cache(self):
+        import copy
+        import pickle
+
+        from django_enum.utils import CacheInfo, LRUCache
+
+        cache = LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        self.assertEqual(cache["a"], 1)
+        cache["c"] = 3
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertIn("c", cache)
+        with self.assertRaises(KeyError):
+            cache["b"]
+        self.assertEqual(
+            cache.info(), CacheInfo(hits=1, misses=1, maxsize=2, currsize=2)
+        )
+
+        for cpy in [
+            copy.copy(cache),
+            copy.deepcopy(cache),
+            pickle.loads(pickle.dumps(cache)),
+        ]:
+            self.assertEqual(cpy.info(), CacheInfo(0, 0, 2, 0))
+
+        cache.clear()
+        self.assertEqual(cache.info(), CacheInfo(0, 0, 2, 0))
+
+    def test_enum_helpers_cached(self):
+        from django.db.models import IntegerChoices
+
+        from django_enum.utils import choices, labels, names, values
+
+        class Cached(IntegerChoices):
+            ONE = 1, "One"
+            TWO = 2, "Two"
+
+        for helper, expected in [
+            (choices, ((1, "One"), (2, "Two"))),
+            (names, ("ONE", "TWO")),
+            (labels, ("One", "Two")),
+            (values, (1, 2)),
+            (members, (Cached.ONE, Cached.TWO)),
+        ]:
+            result = helper(Cached)
+            self.assertEqual(result, expected)
+            self.assertIsInstance(result, tuple)
+            self.assertIs(helper(Cached), result)
+
+        class Cached(IntegerChoices):
+            ONE = 1, "One"
+            THREE = 3, "Three"
+
+        self.assertEqual(choices(Cached), ((1, "One"), (3, "Three")))
+        self.assertEqual(names(Cached), ("ONE", "THREE"))
+        self.assertEqual(labels(Cached), ("One", "Three"))
+        self.assertEqual(values(Cached), (1, 3))
+        self.assertEqual(members(Cached), (Cached.ONE, Cached.THREE))
+
+    def test_enum_helpers_subclass_not_shared(self):
+        from django_enum.utils import choices, values
+
+        class Base(enum.Enum):
+            @property
+            def double(self):
+                return self.value * 2
+
+        self.assertEqual(choices(Base), ())
+
+        class Sub(Base):
+            ONE = 1
+
+        self.assertEqual(choices(Sub), ((1, "ONE"),))
+        self.assertEqual(values(Sub), (1,))